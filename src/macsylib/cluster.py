@@ -27,10 +27,10 @@ from __future__ import annotations
 
 import itertools
 import logging
+from bisect import bisect_left
 from collections import defaultdict, Counter
 from operator import attrgetter
 
-import macsylib.gene
 from .error import MacsylibError
 from .gene import ModelGene, GeneStatus
 from .hit import Loner, LonerMultiSystem, get_best_hit_4_func, ModelHit, CoreHit, HitWeight
@@ -56,7 +56,9 @@ def _colocates(h1: ModelHit, h2: ModelHit, rep_info: RepliconInfo) -> bool:
              Managed circularity.
     """
     # compute the number of genes between h1 and h2
-    dist = h2.position - h1.position - 1
+    pos_1 = h1.position
+    pos_2 = h2.position
+    dist = pos_2 - pos_1 - 1
     g1 = h1.gene_ref
     g2 = h2.gene_ref
     model = g1.model
@@ -76,7 +78,7 @@ def _colocates(h1: ModelHit, h2: ModelHit, rep_info: RepliconInfo) -> bool:
         return True
     elif dist <= 0 and rep_info.topology == 'circular':
         # h1 and h2 overlap the ori
-        dist = rep_info.max - h1.position + h2.position - rep_info.min
+        dist = rep_info.max - pos_1 + pos_2 - rep_info.min
         return dist <= inter_gene_max_space
     return False
 
@@ -95,7 +97,7 @@ def scaffold_to_cluster(cluster_scaffold: list[ModelHit], model: Model, hit_weig
     gene_types = {hit.gene_ref.name for hit in cluster_scaffold}
 
     if len(gene_types) > 1:
-        if all([_hit.gene_ref.status == GeneStatus.NEUTRAL for _hit in cluster_scaffold]):
+        if all(_hit.gene_ref.status == GeneStatus.NEUTRAL for _hit in cluster_scaffold):
             # contains different genes but all are neutral
             # we do not consider a group of neutral as a cluster
             _log.debug(f"{', '.join([h.id for h in cluster_scaffold])} "
@@ -104,21 +106,23 @@ def scaffold_to_cluster(cluster_scaffold: list[ModelHit], model: Model, hit_weig
         else:
             return  Cluster(cluster_scaffold, model, hit_weights)
     else:
-        cluster = Cluster(cluster_scaffold, model, hit_weights)
-        if cluster.loner:
+        # all hits code for the same gene,
+        # check if it is worth to be a cluster before to build it
+        gene_ref = cluster_scaffold[0].gene_ref
+        if gene_ref.loner:
             # it's a group of one loner add as cluster
             # it will be squashed at  next step (_get_true_loners )
             # the hit transformation in loner is performed at the end when circularity and merging is done
-            return cluster
+            return Cluster(cluster_scaffold, model, hit_weights)
         elif model.min_genes_required == 1:
-            if cluster.hits[0].gene_ref.status == GeneStatus.NEUTRAL:
+            if gene_ref.status == GeneStatus.NEUTRAL:
                 # even min_genes_required == 1
                 # a neutral alone is not a cluster
                 _log.debug(f"{', '.join([h.id for h in cluster_scaffold])} "
                        f"is composed of only neutral. It's not a cluster.")
                 return None
             else:
-                return cluster
+                return Cluster(cluster_scaffold, model, hit_weights)
         else:
             _log.debug(f"({', '.join([h.id for h in cluster_scaffold])}) "
                        f"is composed of only type of gene {cluster_scaffold[0].gene_ref.name}. It's not a cluster.")
@@ -148,7 +152,7 @@ def clusterize_hits_on_distance_only(hits: list[ModelHit], model: Model, hit_wei
         cluster_scaffold.append(hit)
         previous_hit = cluster_scaffold[0]
 
-        for m_hit in hits[1:]:
+        for m_hit in itertools.islice(hits, 1, None):
             if _colocates(previous_hit, m_hit, rep_info):
                 cluster_scaffold.append(m_hit)
             else:
@@ -169,7 +173,7 @@ def clusterize_hits_on_distance_only(hits: list[ModelHit], model: Model, hit_wei
             if rep_info.topology == 'circular':
                 # if there are clusters
                 # maybe the last hit in scaffold collocate with the first hit of the first cluster
-                if clusters and _colocates(cluster_scaffold[-1], clusters[0].hits[0], rep_info):
+                if clusters and _colocates(cluster_scaffold[-1], clusters[0][0], rep_info):
                     new_cluster = Cluster(cluster_scaffold, model, hit_weights)
                     clusters[0].merge(new_cluster, before=True)
                 elif _colocates(cluster_scaffold[-1], hits[0], rep_info):
@@ -180,9 +184,8 @@ def clusterize_hits_on_distance_only(hits: list[ModelHit], model: Model, hit_wei
                         clusters.append(cluster)
         # handle circularity
         if rep_info.topology == 'circular' and len(clusters):
-            if _colocates(clusters[-1].hits[-1], clusters[0].hits[0], rep_info):
-                clusters[0].merge(clusters[-1], before=True)
-                clusters = clusters[:-1]
+            if _colocates(clusters[-1][-1], clusters[0][0], rep_info):
+                clusters[0].merge(clusters.pop(), before=True)
     return clusters
 
 
@@ -212,14 +215,27 @@ def closest_hit(hit: ModelHit, ref_hits:list[ModelHit]) -> ModelHit:
             will return *H1*
     """
     ref_hits = sorted(ref_hits, key=attrgetter('position'))
-    closest_int = ref_hits[0]
-    closest_dist = abs(hit.position - closest_int.position)
-    for integrase in ref_hits[1:]:
-        distance = abs(hit.position - integrase.position)
-        if distance < closest_dist:
-            closest_dist = distance
-            closest_int = integrase
-    return closest_int
+    positions = [h.position for h in ref_hits]
+    return _closest_hit(hit.position, ref_hits, positions)
+
+
+def _closest_hit(position: int, ref_hits: list[ModelHit], positions: list[int]) -> ModelHit:
+    """
+    Find the closest *ref_hit* to *position* by bisection.
+
+    :param position: the position of the hit
+    :param ref_hits: The reference hits sorted by increasing position
+    :param positions: the positions of the *ref_hits* (in same order)
+    :return: The closest *ref_hit* to the position. If two *ref_hits* are equidistant
+             return those with the lowest position (the first one in *ref_hits* order).
+    """
+    idx = bisect_left(positions, position)
+    if idx == len(positions):
+        # all ref_hits are before the position, take the first of the last positions
+        return ref_hits[bisect_left(positions, positions[-1])]
+    if idx == 0 or positions[idx] - position < position - positions[idx - 1]:
+        return ref_hits[idx]
+    return ref_hits[bisect_left(positions, positions[idx - 1])]
 
 
 def split_cluster_on_key_genes(key_genes: set[str], cluster: Cluster) -> list[Cluster]:
@@ -255,8 +271,10 @@ def split_cluster_on_key_genes(key_genes: set[str], cluster: Cluster) -> list[Cl
 
     if not key_gene_hits:
         return []
+    key_gene_hits.sort(key=attrgetter('position'))
+    key_gene_positions = [h.position for h in key_gene_hits]
     for hit in not_key_genes_hits:
-        closest_int = closest_hit(hit, key_gene_hits)
+        closest_int = _closest_hit(hit.position, key_gene_hits, key_gene_positions)
         scaffolds[closest_int].append(hit)
 
     for integrase, scaffold in scaffolds.items():
@@ -264,7 +282,7 @@ def split_cluster_on_key_genes(key_genes: set[str], cluster: Cluster) -> list[Cl
         scaffold.sort(key=lambda h: h.position)
         cluster = scaffold_to_cluster(scaffold, cluster.model, cluster.hit_weights)
         clusters.append(cluster)
-    clusters.sort(key=lambda c: c.hits[0].position)
+    clusters.sort(key=lambda c: c[0].position)
     return clusters
 
 
@@ -291,7 +309,7 @@ def clusterize_hits_around_key_genes(key_genes: set[str],
     dist_cls = clusterize_hits_on_distance_only(hits, model, hit_weights, rep_info)
     key_gene_clst = []
     for clst in dist_cls:
-        key_gene_nb = sum([1 for hit in clst.hits if is_a(hit, key_genes)])
+        key_gene_nb = sum(1 for hit in clst._hits if is_a(hit, key_genes))
         if key_gene_nb == 0:
             continue
         elif key_gene_nb == 1:
@@ -299,7 +317,7 @@ def clusterize_hits_around_key_genes(key_genes: set[str],
         else:
             clusters = split_cluster_on_key_genes(key_genes, clst)
             key_gene_clst.extend(clusters)
-    key_gene_clst.sort(key=lambda c: c.hits[0].position)
+    key_gene_clst.sort(key=lambda c: c[0].position)
     return key_gene_clst
 
 
@@ -352,20 +370,16 @@ def _get_true_loners(clusters: list[Cluster]) -> tuple[dict[str: Loner | LonerMu
                 true_clusters.append(clstr)
 
         for func_name, loners in true_loners.items():
-            # transform ModelHit in Loner
-            true_loners[func_name] = []
-            for i, _ in enumerate(loners):
-                if loners[i].multi_system:
-                    # the counterpart have been already computed during the MS hit instantiation
-                    # instead of the Loner not multisystem it include the hits which clusterize
-                    true_loners[func_name].append(LonerMultiSystem(loners[i]))
-                else:
-                    counterpart = loners[:]
-                    hit = counterpart.pop(i)
-                    true_loners[func_name].append(Loner(hit, counterpart=counterpart))
-            # replace List of Loners/MultiSystem by the best hit
-            best_loner = get_best_hit_4_func(func_name, true_loners[func_name], key='score')
-            true_loners[func_name] = best_loner
+            # choose the best hit first, then transform only this one in Loner
+            # the other hits are its counterpart
+            best_hit = get_best_hit_4_func(func_name, loners, key='score')
+            if best_hit.multi_system:
+                # the counterpart have been already computed during the MS hit instantiation
+                # instead of the Loner not multisystem it include the hits which clusterize
+                true_loners[func_name] = LonerMultiSystem(best_hit)
+            else:
+                counterpart = [hit for hit in loners if hit is not best_hit]
+                true_loners[func_name] = Loner(best_hit, counterpart=counterpart)
 
         true_loners = {func_name: Cluster([loner], model, hit_weights) for func_name, loner in true_loners.items()}
     return true_loners, true_clusters
@@ -419,6 +433,8 @@ class Cluster:
     Handle hits relative to a model which collocates
     """
 
+    __slots__ = ('_hits', 'model', '_score', '_genes_roles', '_hit_weights', 'id')
+
     _id = itertools.count(1)
 
     def __init__(self, hits: list[CoreHit]|list[ModelHit], model, hit_weights) -> None:
@@ -438,12 +454,12 @@ class Cluster:
 
 
     def __len__(self) -> int:
-        return len(self.hits)
+        return len(self._hits)
 
 
     def __getitem__(self, index: str) -> CoreHit | ModelHit | Cluster:
         if isinstance(index, int):
-            return self.hits[index]
+            return self._hits[index]
         elif isinstance(index, slice):
             start, stop, step = index.indices((len(self._hits)))
             return self.__class__([self._hits[index] for index in range(start, stop, step)],
@@ -469,6 +485,16 @@ class Cluster:
         set cluster hits
         """
         self._hits = hits
+        self._reset_cache()
+
+
+    def _reset_cache(self) -> None:
+        """
+        forget the values computed from the hits (score, functions),
+        must be called each time the hits are modified.
+        """
+        self._score = None
+        self._genes_roles = None
 
 
     @property
@@ -493,7 +519,7 @@ class Cluster:
         # need this method in build_cluster before to transform ModelHit in Loner
         # so cannot rely on Loner type
         # beware return True if several hits of same gene composed this cluster (I use a set!)
-        return len({h.gene_ref.name for h in self.hits}) == 1 and self.hits[0].gene_ref.loner
+        return len({h.gene_ref.name for h in self._hits}) == 1 and self._hits[0].gene_ref.loner
 
     @property
     def multi_system(self) -> bool:
@@ -506,15 +532,15 @@ class Cluster:
         """
 
         # by default gene_ref.multi_system == gene_ref.alternate_of().multi_system
-        return len(self) == 1 and self.hits[0].gene_ref.multi_system
+        return len(self) == 1 and self._hits[0].gene_ref.multi_system
 
 
     def _check_replicon_consistency(self) -> None:
         """
         :raise: MacsylibError if all hits of a cluster are NOT related to the same replicon
         """
-        rep_name = self.hits[0].replicon_name
-        if not all([h.replicon_name == rep_name for h in self.hits]):
+        rep_name = self._hits[0].replicon_name
+        if not all(h.replicon_name == rep_name for h in self._hits):
             msg = "Cannot build a cluster from hits coming from different replicons"
             _log.error(msg)
             raise MacsylibError(msg)
@@ -526,7 +552,8 @@ class Cluster:
         :param m_hit: The hit to test
         :return: True if the hit is in the cluster hits, False otherwise
         """
-        return m_hit in self.hits
+        # scan the hits without copying them, the hits are compared with ==
+        return m_hit in self._hits
 
 
     @property
@@ -549,7 +576,7 @@ class Cluster:
                  the functions for a cluster corresponding to this model wil be {'a' , 'b'}
         """
         if self._genes_roles is None:
-            self._genes_roles = frozenset({h.gene_ref.alternate_of().name for h in self.hits})
+            self._genes_roles = frozenset({h.gene_ref.alternate_of().name for h in self._hits})
         return self._genes_roles
 
 
@@ -560,19 +587,13 @@ class Cluster:
         :return: the common functions between genes and this cluster.
         """
         # we do not filter out neutral from the model
-        genes_roles = self.functions
-        functions = set()
-        for gene in genes:
-            if isinstance(gene, macsylib.gene.ModelGene):
-                function = gene.name
-            else:
-                # gene is a string
-                function = gene
-            functions.add(function)
-        return genes_roles.intersection(functions)
+        # the functions of the cluster are computed once and cached,
+        # so the cost of a call depends only on the number of genes to test
+        functions = {gene.name if isinstance(gene, ModelGene) else gene for gene in genes}
+        return self.functions.intersection(functions)
 
     def count_function(self) -> Counter[str]:
-        return Counter(h.gene_ref.alternate_of().name for h in self.hits)
+        return Counter(h.gene_ref.alternate_of().name for h in self._hits)
 
     def merge(self, cluster: Cluster, before: bool = False) -> None:
         """
@@ -587,9 +608,10 @@ class Cluster:
             raise MacsylibError("Try to merge Clusters from different model")
         else:
             if before:
-                self._hits = cluster.hits + self.hits
+                self._hits = cluster._hits + self._hits
             else:
-                self._hits.extend(cluster.hits)
+                self._hits.extend(cluster._hits)
+            self._reset_cache()
 
     @property
     def replicon_name(self) -> str:
@@ -598,7 +620,7 @@ class Cluster:
         :return: The name of the replicon where this cluster is located
         :rtype: str
         """
-        return self.hits[0].replicon_name
+        return self._hits[0].replicon_name
 
 
     @property
@@ -611,8 +633,10 @@ class Cluster:
             return self._score
         else:
             seen_hits = {}
+            # loner and multi_system are computed from all hits, do it once
+            out_of_cluster = self.loner or self.multi_system
             _log.debug("===================== compute score for cluster =====================")
-            for m_hit in self.hits:
+            for m_hit in self._hits:
                 _log.debug(f"-------------- test model hit {m_hit.gene.name} --------------")
 
                 # attribute a score for this hit
@@ -636,7 +660,7 @@ class Cluster:
                 else:
                     hit_score *= self._hit_weights.itself
 
-                if self.loner or self.multi_system:
+                if out_of_cluster:
                     hit_score *= self._hit_weights.out_of_cluster
                     _log.debug(f"{m_hit.id} is out of cluster (Loner) score = {hit_score}")
 
@@ -671,7 +695,7 @@ class Cluster:
         rep = f"""Cluster:
 - model = {self.model.name}
 - replicon = {self.replicon_name}
-- hits = {', '.join([f"({h.id}, {h.gene.name}, {h.position})" for h in self.hits])}"""
+- hits = {', '.join([f"({h.id}, {h.gene.name}, {h.position})" for h in self._hits])}"""
         return rep
 
 
@@ -685,5 +709,17 @@ class Cluster:
         :param new: the new hit
         :return: None
         """
-        idx = self._hits.index(old)
+        # replace old itself, or if old is not in the cluster the first hit equal to old
+        # ModelHit.__eq__ compares the hits field by field, so it's not called anymore once an equal hit is found
+        equal_idx = None
+        for idx, hit in enumerate(self._hits):
+            if hit is old:
+                break
+            elif equal_idx is None and hit == old:
+                equal_idx = idx
+        else:
+            if equal_idx is None:
+                raise ValueError(f"{old} is not in cluster {self.id}")
+            idx = equal_idx
         self._hits[idx] = new
+        self._reset_cache()
@@ -45,6 +45,8 @@ class CoreHit:
     These hits are independent of any :class:`macsylib.model.Model` instance.
     """
 
+    __slots__ = ('gene', 'id', 'seq_length', 'replicon_name', 'position', 'i_eval', 'score',
+                 'profile_coverage', 'sequence_coverage', 'begin_match', 'end_match', '_systems')
 
     def __init__(self, gene: CoreGene, hit_id: str, hit_seq_length: int, replicon_name: str,
                  position_hit: int, i_eval: float, score: float, profile_coverage: float,
@@ -153,6 +155,8 @@ class ModelHit:
     for one gene it can exist several ModelHit instance one for each Model containing this gene
     """
 
+    __slots__ = ('_hit', 'gene_ref', 'status')
+
     def __init__(self, hit: CoreHit, gene_ref: ModelGene, gene_status: GeneStatus) -> None:
         """
         :param hit: a match between a hmm profile and a replicon
@@ -193,6 +197,16 @@ class ModelHit:
         return self._hit
 
 
+    @property
+    def position(self) -> int:
+        """
+        :return: The rank of the sequence matched in the input dataset file
+        """
+        # position is used intensively to build clusters
+        # so do not rely on __getattr__ delegation which is slow
+        return self._hit.position
+
+
     @property
     def multi_system(self) -> bool:
         """
@@ -250,6 +264,8 @@ class AbstractCounterpartHit(ModelHit, metaclass=abc.ABCMeta):
     Abstract Class to handle ModelHit wit equivalent for instance Loner or MultiSystem hit
     """
 
+    __slots__ = ('_counterpart',)
+
     def __init__(self,
                  hit: CoreHit | ModelHit,
                  gene_ref: ModelGene = None,
@@ -317,6 +333,8 @@ class Loner(AbstractCounterpartHit):
     Handle hit which encode for a gene tagged as loner and which not clustering with other hit.
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  hit: CoreHit | ModelHit,
                  gene_ref: ModelGene = None,
@@ -355,6 +373,8 @@ class MultiSystem(AbstractCounterpartHit):
     Handle hit which encode for a gene tagged as loner and which not clustering with other hit.
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  hit: CoreHit | ModelHit,
                  gene_ref: ModelGene = None,
@@ -396,6 +416,8 @@ class LonerMultiSystem(Loner, MultiSystem):
      * and the hit do not clustering with other hits.
     """
 
+    __slots__ = ()
+
     def __init__(self, hit: CoreHit | ModelHit,
                  gene_ref: ModelGene = None,
                  gene_status: GeneStatus = None,
@@ -31,7 +31,6 @@ module that deals with the satellite_finder outputs
 import sys
 import typing
 from collections.abc import Callable
-import pandas as pd
 
 import macsylib
 from macsylib.system import HitSystemTracker, System, RejectedCandidate, LikelySystem, UnlikelySystem
@@ -200,6 +199,9 @@ def summary_best_solution(models_fam_name: str,
     :param header: A function that generate the string which will be place on the head of the results
     :param skipped_replicons: the replicons name for which msf reach the timeout
     """
+    # pandas is long to import and is used only here
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
     skipped_replicons = skipped_replicons if skipped_replicons else set()
     print(header(models_fam_name, models_version, skipped_replicons=skipped_replicons),
           file=sys_file)
@@ -31,6 +31,8 @@ from __future__ import annotations
 
 import os
 import logging
+import shlex
+import shutil
 from subprocess import Popen
 from threading import Lock
 
@@ -182,30 +184,37 @@ class Profile:
 
             with open(err_path, 'w') as err_file:
                 if not self.cfg.cut_ga():
-                    hmmer_threshold = f"-E {self.cfg.e_value_search():f}"
+                    hmmer_threshold = ['-E', f"{self.cfg.e_value_search():f}"]
                 elif self.cfg.cut_ga() and self.ga_threshold:
-                    hmmer_threshold = "--cut_ga"
+                    hmmer_threshold = ['--cut_ga']
                 else:
                     # cut_ga is True set but there is not self.ga_threshold:
-                    hmmer_threshold = f"-E {self.cfg.e_value_search():f}"
+                    hmmer_threshold = ['-E', f"{self.cfg.e_value_search():f}"]
                     _log.warning(f"GA bit thresholds unavailable on profile {self.gene.name}. "
-                                 f"Switch to e-value threshold ({hmmer_threshold})")
-
-                command = f'"{self.cfg.hmmer()}" --cpu {cpu} -o "{output_path}" {hmmer_threshold} ' \
-                          f'"{self.path}" "{self.cfg.sequence_db()}" '
+                                 f"Switch to e-value threshold ({' '.join(hmmer_threshold)})")
+
+                # hmmsearch is executed directly without an intermediate shell
+                # so the paths do not need to be quoted.
+                # With the path of the executable (not only its name), close_fds=False and no preexec_fn
+                # Popen can use posix_spawn instead of fork + exec
+                hmmer_exe = shutil.which(self.cfg.hmmer()) or self.cfg.hmmer()
+                args = [hmmer_exe, '--cpu', str(cpu), '-o', output_path, *hmmer_threshold,
+                        self.path, self.cfg.sequence_db()]
+                command = shlex.join(args)
                 _log.debug(f"{self.gene.name} Hmmer command line : {command}")
                 try:
-                    hmmer = Popen(command,
-                                  shell=True,
+                    hmmer = Popen(args,
                                   stdout=None,
                                   stdin=None,
                                   stderr=err_file,
                                   close_fds=False,
                                   )
                 except Exception as err:
+                    # Popen raises an OSError if hmmsearch is missing or not executable
+                    # it is reported as a RuntimeError like the other hmmsearch failures
                     msg = f"Hmmer execution failed: command = {command} : {err}"
                     _log.critical(msg, exc_info=True)
-                    raise err
+                    raise RuntimeError(msg) from err
                 hmmer.wait()
 
             if hmmer.returncode != 0:
@@ -75,13 +75,13 @@ def scan_models_dir(models_dir: str, profile_suffix: str = ".hmm", relative_path
     :rtype: [:class:`macsylib.registries.ModelLocation`, ...]
     """
     models = []
-    for models_type in os.listdir(models_dir):
-        model_path = os.path.join(models_dir, models_type)
-        if os.path.isdir(model_path):
-            new_model = ModelLocation(path=model_path,
-                                      profile_suffix=profile_suffix,
-                                      relative_path=relative_path)
-            models.append(new_model)
+    with os.scandir(models_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                new_model = ModelLocation(path=entry.path,
+                                          profile_suffix=profile_suffix,
+                                          relative_path=relative_path)
+                models.append(new_model)
     return models
 
 
@@ -166,12 +166,12 @@ class ModelLocation:
 
         self._definitions = {}
         def_dir = os.path.join(self._path, 'definitions')
-        for definition in os.listdir(def_dir):
-            definition_path = os.path.join(def_dir, definition)
-            new_def = self._scan_definitions(def_path=definition_path)
+        with os.scandir(def_dir) as definitions:
+            for definition in definitions:
+                new_def = self._scan_definitions(def_path=definition.path)
 
-            if new_def:  # _scan_definitions can return None if a dir is empty
-                self._definitions[new_def.name] = new_def
+                if new_def:  # _scan_definitions can return None if a dir is empty
+                    self._definitions[new_def.name] = new_def
 
 
     def _scan_definitions(self, parent_def: DefinitionLocation = None, def_path: str = None) -> DefinitionLocation:
@@ -206,10 +206,11 @@ class ModelLocation:
             new_def = DefinitionLocation(name=name,
                                          fqn=fqn,
                                          path=def_path)
-            for model in os.listdir(def_path):
-                subdef = self._scan_definitions(parent_def=new_def, def_path=os.path.join(new_def.path, model))
-                if subdef is not None:
-                    new_def.add_subdefinition(subdef)
+            with os.scandir(def_path) as models:
+                for model in models:
+                    subdef = self._scan_definitions(parent_def=new_def, def_path=model.path)
+                    if subdef is not None:
+                        new_def.add_subdefinition(subdef)
             return new_def
 
 
@@ -223,18 +224,21 @@ class ModelLocation:
         :return: all profiles found in the path
         """
         all_profiles = {}
-        for profile in os.listdir(path):
-            profile_path = os.path.join(path, profile)
-            compressed_suffix = f"{profile_suffix}.gz"
-            if os.path.isfile(profile_path):
-                if profile.endswith(profile_suffix):
-                    base, _ = profile.rsplit('.', maxsplit=1)
-                elif profile.endswith(compressed_suffix):
-                    base, *_ = profile.rsplit('.', maxsplit=2)
-                    # cannot use this solution for all cases because some profile have name like PF05930.13.hmm
-                else:
-                    continue
-                all_profiles[base] = profile_path if relative_path else os.path.abspath(profile_path)
+        compressed_suffix = f"{profile_suffix}.gz"
+        # scandir get the file type while reading the directory
+        # so there is no need of an extra stat for each profile
+        with os.scandir(path) as profiles:
+            for entry in profiles:
+                if entry.is_file():
+                    profile = entry.name
+                    if profile.endswith(profile_suffix):
+                        base, _ = profile.rsplit('.', maxsplit=1)
+                    elif profile.endswith(compressed_suffix):
+                        base, *_ = profile.rsplit('.', maxsplit=2)
+                        # cannot use this solution for all cases because some profile have name like PF05930.13.hmm
+                    else:
+                        continue
+                    all_profiles[base] = entry.path if relative_path else os.path.abspath(entry.path)
         return all_profiles
 
 
@@ -120,13 +120,10 @@ def _search_in_pack_name(pattern: str,
     :return:
     """
     results = []
+    if not match_case:
+        pattern = pattern.lower()
     for pack_name in m_packages:
-        if not match_case:
-            pack = pack_name.lower()
-            pattern = pattern.lower()
-        else:
-            pack = pack_name
-
+        pack = pack_name if match_case else pack_name.lower()
         if pattern in pack:
             all_versions = remote.list_package_vers(pack_name)
             if all_versions:
@@ -149,19 +146,16 @@ def _search_in_desc(pattern: str,
     :return:
     """
     results = []
+    if not match_case:
+        pattern = pattern.lower()
     for pack_name in m_packages:
         all_versions = remote.list_package_vers(pack_name)
         if all_versions:
             metadata = remote.get_metadata(pack_name)
             desc = metadata['short_desc']
-            if not match_case:
-                pack = pack_name.lower()
-                desc = desc.lower()
-                pattern = pattern.lower()
-            else:
-                pack = pack_name
-
-            if pattern in pack or pattern in desc:
+            pack = pack_name if match_case else pack_name.lower()
+            # the description is lowered only if the pattern is not found in the name
+            if pattern in pack or pattern in (desc if match_case else desc.lower()):
                 last_vers = all_versions[0]
                 results.append((pack_name, last_vers, metadata['short_desc']))
     return results
@@ -1100,8 +1094,8 @@ https://docs.github.com/en/get-started/writing-on-github/getting-started-with-wr
 
     # add files to repository
     untracked_files = repo.untracked_files
-    for file in untracked_files:
-        repo.index.add(file)
+    # add all files in one call, the index is written once
+    repo.index.add(untracked_files)
     untracked_str = '- ' + '\n- '.join(untracked_files)
     repo.index.commit(f"""initial commit
 
@@ -168,6 +168,7 @@ def search_in_ordered_replicon(hits_by_replicon: dict[str: list[macsylib.hit.Cor
     all_systems = []
     all_rejected_candidates = []
     rep_db = RepliconDB(config)
+    hit_weights = HitWeight(**config.hit_weights())
 
     for rep_name in hits_by_replicon:
         logger.info(f"\n{f' Hits analysis for replicon {rep_name} ':#^60}")
@@ -184,7 +185,6 @@ def search_in_ordered_replicon(hits_by_replicon: dict[str: list[macsylib.hit.Cor
             logger.debug(f"\n{hit_header_str}\n{hits_str}")
             logger.debug("#" * 80)
             logger.info("Building clusters")
-            hit_weights = HitWeight(**config.hit_weights())
             true_clusters, true_loners = cluster.build_clusters(mhits_related_one_model, rep_info, model, hit_weights)
             logger.debug(f"{' CLUSTERS ':#^80}")
             logger.debug("\n" + "\n".join([str(c) for c in true_clusters]))
@@ -265,7 +265,6 @@ def search_in_unordered_replicon(hits_by_replicon: dict[str: list[macsylib.hit.C
             logger.debug("".join([str(h) for h in hits_related_one_model]))
             logger.debug("#" * 80)
             logger.info("Searching systems")
-            hits_related_one_model = model.filter(hits_by_replicon[rep_name])
             if hits_related_one_model:
                 unordered_matcher = UnorderedMatchMaker(model)
                 res = unordered_matcher.match(hits_related_one_model)
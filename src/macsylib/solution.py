@@ -25,7 +25,6 @@
 #########################################################################
 
 import itertools
-import networkx as nx
 from typing import Generator
 
 from .system import System, RejectedCandidate
@@ -138,6 +137,8 @@ def find_best_solutions(systems: list[System]) -> tuple[list[Solution], float]:
     :rtype: tuple of 2 elements the best solutions and it's score
 
     """
+    # networkx is long to import and is used only here
+    import networkx as nx  # pylint: disable=import-outside-toplevel
 
     G = nx.Graph()
     # add nodes (vertices)
@@ -31,9 +31,10 @@ import unittest
 from io import StringIO
 from contextlib import contextmanager
 import hashlib
-from functools import partial
+from functools import partial, lru_cache
 import tempfile
 import uuid
+import logging
 import colorlog
 import json
 import re
@@ -51,6 +52,38 @@ def path_to_modulename(p):
     return modulename
 
 
+def link_file(src, dst):
+    """
+    Put the file src (a data file or a file of a template) in the test directory.
+    The tests never modify these files in place (they can remove them),
+    so a hard link is enough and avoid to copy the data.
+    It can be used as copy_function of shutil.copytree
+
+    :param src: the path of the file to put in the test directory
+    :param dst: the path of the file in the test directory
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        # src and dst are not on the same file system or it does not support hard links
+        # a symbolic link would be archived as is by tarfile
+        shutil.copyfile(src, dst)
+
+
+@lru_cache(maxsize=None)
+def _find_data(data_dir, *args):
+    """
+    The data of the tests do not move during the tests,
+    so check only once that a data exists.
+    The missing data raise an error, so they are not cached.
+    """
+    data_path = os.path.join(data_dir, *args)
+    if os.path.exists(data_path):
+        return data_path
+    else:
+        raise IOError("data '{}' does not exists".format(data_path))
+
+
 class MacsyTest(unittest.TestCase):
 
     _tests_dir = os.path.normpath(os.path.dirname(__file__))
@@ -74,11 +107,7 @@ class MacsyTest(unittest.TestCase):
 
     @classmethod
     def find_data(cls, *args):
-        data_path = os.path.join(cls._data_dir, *args)
-        if os.path.exists(data_path):
-            return data_path
-        else:
-            raise IOError("data '{}' does not exists".format(data_path))
+        return _find_data(cls._data_dir, *args)
 
 
     @contextmanager
@@ -163,6 +192,16 @@ class MacsyTest(unittest.TestCase):
                     raise self.failureException(f"{fh2.name} is longer than {fh1.name}")
 
 
+    def assertSameHits(self, hits_1, hits_2, msg=None):
+        """
+        Check that two sequences contain the same hit objects in the same order.
+        The comparison is on the objects identity, so it does not rely on the hits __eq__
+        """
+        if tuple(map(id, hits_1)) != tuple(map(id, hits_2)):
+            standard_msg = f"hits differ: [{', '.join(h.id for h in hits_1)}] != [{', '.join(h.id for h in hits_2)}]"
+            self.fail(self._formatMessage(msg, standard_msg))
+
+
     def assertTsvEqual(self, f1, f2, tsv_type='best_solution.tsv', comment="#", msg=None):
         # the StringIO does not support context in python2.7
         # so we can use the following statement only in python3
@@ -308,23 +347,45 @@ class MacsyTest(unittest.TestCase):
     def catch_log(self, log_name='macsylib'):
         logger = colorlog.getLogger(log_name)
         handlers_ori = logger.handlers
-        fake_handler = colorlog.StreamHandler(StringIO())
+        fake_handler = RecordsHandler()
         try:
             logger.handlers = [fake_handler]
-            yield LoggerWrapper(logger)
+            yield LoggerWrapper(logger, fake_handler)
         finally:
             fake_handler.close()
             logger.handlers = handlers_ori
 
 
 
+class RecordsHandler(logging.Handler):
+    """
+    Keep the records emitted in the logger.
+    Most of the tests catch the log only to silence it,
+    so the records are formatted only when the log is read.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def getvalue(self):
+        """
+        :return: the formatted records, one per line, as a StreamHandler would write them
+        """
+        return ''.join(f"{self.format(record)}\n" for record in self.records)
+
+
 class LoggerWrapper(object):
 
-    def __init__(self, logger):
+    def __init__(self, logger, handler):
         self.logger = logger
+        self.handler = handler
 
     def __getattr__(self, item):
         return getattr(self.logger, item)
 
     def get_value(self):
-        return self.logger.handlers[0].stream.getvalue()
+        return self.handler.getvalue()
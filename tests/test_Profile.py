@@ -329,7 +329,9 @@ class TestProfile(MacsyTest):
         path = self.model_location.get_profile("abc", )
         profile = Profile(gene, self.cfg, path)
         with self.catch_log():
-            with self.assertRaises(RuntimeError):
+            with self.assertRaisesRegex(RuntimeError,
+                                        "Hmmer execution failed: command = Nimportnaoik --cpu .* : "
+                                        ".*No such file or directory"):
                 profile.execute()
 
 
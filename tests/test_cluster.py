@@ -31,7 +31,7 @@ import random
 from macsylib.error import MacsylibError
 from macsylib.config import Config, MacsyDefaults
 from macsylib.registries import ModelLocation
-from macsylib.gene import CoreGene, ModelGene, Exchangeable, GeneStatus
+from macsylib.gene import CoreGene, ModelGene, Exchangeable, GeneStatus, GeneBank
 from macsylib.profile import ProfileFactory
 from macsylib.hit import CoreHit, ModelHit, Loner, MultiSystem, LonerMultiSystem, HitWeight
 from macsylib.model import Model
@@ -42,22 +42,57 @@ from macsylib.cluster import (Cluster, build_clusters, _colocates, clusterize_hi
 from tests import MacsyTest
 
 
-class TestBuildCluster(MacsyTest):
+def _core_hit(gene: CoreGene, hit_id: str, position: int, score: float,
+              replicon_name: str = "replicon_1", seq_length: int = 10) -> CoreHit:
+    """
+    :return: a CoreHit with the statistics which does not matter for clustering set to constant values
+    """
+    return CoreHit(gene, hit_id, seq_length, replicon_name, position, 1.0, score, 1.0, 1.0, 10, 20)
 
-    def setUp(self) -> None:
-        self.args = argparse.Namespace()
-        self.args.sequence_db = self.find_data("base", "test_1.fasta")
-        self.args.db_type = 'gembase'
-        self.args.models_dir = self.find_data('models')
-        self.args.res_search_dir = "blabla"
 
-        self.cfg = Config(MacsyDefaults(), self.args)
-        self.model_name = 'foo'
-        self.model_location = ModelLocation(path=os.path.join(self.args.models_dir, self.model_name))
-        self.profile_factory = ProfileFactory(self.cfg)
-        self.hit_weights = HitWeight(**self.cfg.hit_weights())
+def _model_hit(gene: ModelGene, hit_id: str, position: int, gene_status: GeneStatus,
+               hit_class: type[ModelHit] = ModelHit, **kwargs) -> ModelHit:
+    """
+    :return: a hit_class instance on a CoreHit of the core gene of gene, the score of the hit is its position.
+             kwargs are passed to :func:`_core_hit`
+    """
+    return hit_class(_core_hit(gene.core_gene, hit_id, position, float(position), **kwargs), gene, gene_status)
 
 
+class ClusterTestCase(MacsyTest):
+    """
+    Provide the objects needed to build hits and clusters, they are set once for each test class
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.args = argparse.Namespace()
+        cls.args.sequence_db = cls.find_data("base", "test_1.fasta")
+        cls.args.db_type = 'gembase'
+        cls.args.models_dir = cls.find_data('models')
+        cls.args.res_search_dir = "blabla"
+
+        cls.cfg = Config(MacsyDefaults(), cls.args)
+        cls.model_name = 'foo'
+        cls.model_location = ModelLocation(path=os.path.join(cls.args.models_dir, cls.model_name))
+        # the tests does not modify these objects
+        # so they can be shared by all tests of a class
+        cls.profile_factory = ProfileFactory(cls.cfg)
+        # HitWeight is frozen, it can be safely shared by all tests
+        cls.hit_weights = HitWeight(**cls.cfg.hit_weights())
+        cls.gene_bank = GeneBank()
+
+
+    def core_gene(self, name: str) -> CoreGene:
+        """
+        :return: the CoreGene corresponding to name, it is instantiated only once for all tests of the class
+        """
+        self.gene_bank.add_new_gene(self.model_location, name, self.profile_factory)
+        return self.gene_bank[(self.model_location.name, name)]
+
+
+class TestBuildCluster(ClusterTestCase):
+
     def test_build_clusters(self):
         # handle name, topology type, and min/max positions in the sequence dataset for a replicon and list of genes.
         # each genes is representing by a tuple (seq_id, length)"""
@@ -69,7 +104,7 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC', 'sctJ', 'sctN', 'abc'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
         model_genes[4]._loner = True
@@ -80,66 +115,60 @@ class TestBuildCluster(MacsyTest):
         model.add_accessory_gene(model_genes[3])
         model.add_neutral_gene(model_genes[4])
 
-        #     CoreHit(gene, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        #                                                     pos     score
-        h10 = CoreHit(core_genes[0], "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(core_genes[0], "h10", 10, 10.0)
         mh10 = ModelHit(h10, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
-        h11 = CoreHit(core_genes[0], "h11", 10, "replicon_1", 10, 1.0, 11.0, 1.0, 1.0, 10, 20)
+        h11 = _core_hit(core_genes[0], "h11", 10, 11.0)
         mh11 = ModelHit(h11, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
 
-        h20 = CoreHit(core_genes[1], "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
+        h20 = _core_hit(core_genes[1], "h20", 20, 20.0)
         mh20 = ModelHit(h20, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
-        h21 = CoreHit(core_genes[2], "h21", 10, "replicon_1", 20, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h21 = _core_hit(core_genes[2], "h21", 20, 21.0)
         mh21 = ModelHit(h21, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
 
-        h30 = CoreHit(core_genes[2], "h30", 10, "replicon_1", 30, 1.0, 30.0, 1.0, 1.0, 10, 20)
+        h30 = _core_hit(core_genes[2], "h30", 30, 30.0)
         mh30 = ModelHit(h30, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h31 = CoreHit(core_genes[1], "h31", 10, "replicon_1", 30, 1.0, 31.0, 1.0, 1.0, 10, 20)
+        h31 = _core_hit(core_genes[1], "h31", 30, 31.0)
         mh31 = ModelHit(h31, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
 
-        h50 = CoreHit(core_genes[2], "h50", 10, "replicon_1", 50, 1.0, 50.0, 1.0, 1.0, 10, 20)
+        h50 = _core_hit(core_genes[2], "h50", 50, 50.0)
         mh50 = ModelHit(h50, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h51 = CoreHit(core_genes[2], "h51", 10, "replicon_1", 50, 1.0, 51.0, 1.0, 1.0, 10, 20)
+        h51 = _core_hit(core_genes[2], "h51", 50, 51.0)
         mh51 = ModelHit(h51, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
 
-        h60 = CoreHit(core_genes[2], "h60", 10, "replicon_1", 60, 1.0, 60.0, 1.0, 1.0, 10, 20)
+        h60 = _core_hit(core_genes[2], "h60", 60, 60.0)
         mh60 = ModelHit(h60, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h61 = CoreHit(core_genes[3], "h61", 10, "replicon_1", 60, 1.0, 61.0, 1.0, 1.0, 10, 20)
+        h61 = _core_hit(core_genes[3], "h61", 60, 61.0)
         mh61 = ModelHit(h61, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
 
         # case replicon is linear, 2 clusters
         hits = [mh10, mh11, mh20, mh21, mh30, mh31, mh50, mh51, mh60, mh61]
-        random.shuffle(hits)
         true_clusters, special_clusters = build_clusters(hits, rep_info, model, self.hit_weights)
         self.assertEqual(len(true_clusters), 2)
-        self.assertListEqual(true_clusters[0].hits, [mh11, mh21, mh31])
-        self.assertListEqual(true_clusters[1].hits, [mh51, mh61])
+        self.assertSameHits(true_clusters[0].hits, [mh11, mh21, mh31])
+        self.assertSameHits(true_clusters[1].hits, [mh51, mh61])
         self.assertEqual(special_clusters, {})
 
         # case replicon is linear with a single hit (not loner) between 2 clusters
-        h70 = CoreHit(core_genes[3], "h70", 10, "replicon_1", 70, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h70 = _core_hit(core_genes[3], "h70", 70, 80.0)
         mh70 = ModelHit(h70, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
-        h80 = CoreHit(core_genes[4], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[4], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[4], gene_status=GeneStatus.NEUTRAL)
         hits = [mh10, mh11, mh20, mh21, mh50, mh51, mh70, mh80]
-        random.shuffle(hits)
         true_clusters, special_clusters = build_clusters(hits, rep_info, model, self.hit_weights)
         self.assertEqual(len(true_clusters), 2)
-        self.assertListEqual(true_clusters[0].hits, [mh11, mh21])
-        self.assertListEqual(true_clusters[1].hits, [mh70, mh80])
+        self.assertSameHits(true_clusters[0].hits, [mh11, mh21])
+        self.assertSameHits(true_clusters[1].hits, [mh70, mh80])
         self.assertEqual(special_clusters, {})
 
         # replicon is linear, 3 clusters, the last one contains only one hit (loner h80)
         rep_info = RepliconInfo('linear', 1, 100, [(f"g_{i}", i*10) for i in range(1, 101)])
-        h80 = CoreHit(core_genes[4], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[4], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[4], gene_status=GeneStatus.NEUTRAL)
         hits = [mh10, mh11, mh20, mh21, mh30, mh31, mh50, mh51, mh60, mh61, mh80]
-        random.shuffle(hits)
         true_clusters, special_clusters = build_clusters(hits, rep_info, model, self.hit_weights)
         self.assertEqual(len(true_clusters), 2)
-        self.assertListEqual(true_clusters[0].hits, [mh11, mh21, mh31])
-        self.assertListEqual(true_clusters[1].hits, [mh51, mh61])
+        self.assertSameHits(true_clusters[0].hits, [mh11, mh21, mh31])
+        self.assertSameHits(true_clusters[1].hits, [mh51, mh61])
         self.assertEqual(len(special_clusters), 1)
         self.assertListEqual(special_clusters['abc'].hits, [mh80])
 
@@ -148,7 +177,7 @@ class TestBuildCluster(MacsyTest):
         hits = [mh10, mh20, mh30]
         true_clusters, special_clusters = build_clusters(hits, rep_info, model, self.hit_weights)
         self.assertEqual(len(true_clusters), 1)
-        self.assertListEqual(true_clusters[0].hits, [mh10, mh20, mh30])
+        self.assertSameHits(true_clusters[0].hits, [mh10, mh20, mh30])
         self.assertEqual(special_clusters, {})
 
         # replicon is circular the last cluster is merge  with the first So we have only one cluster
@@ -156,56 +185,52 @@ class TestBuildCluster(MacsyTest):
         hits = [mh10, mh11, mh20, mh21, mh30, mh31, mh50, mh51, mh60, mh61]
         true_clusters, special_clusters = build_clusters(hits, rep_info, model, self.hit_weights)
         self.assertEqual(len(true_clusters), 1)
-        self.assertListEqual(true_clusters[0].hits, [mh51, mh61, mh11, mh21, mh31])
+        self.assertSameHits(true_clusters[0].hits, [mh51, mh61, mh11, mh21, mh31])
         self.assertEqual(special_clusters, {})
 
         # replicon is circular the last hit is incorporate to the first cluster
         # mh80 is not considered as loner it is included in a cluster
         rep_info = RepliconInfo('circular', 1, 80, [(f"g_{i}", i*10) for i in range(1, 9)])
-        h80 = CoreHit(core_genes[3], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[3], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[4], gene_status=GeneStatus.NEUTRAL)
         hits = [mh10, mh11, mh20, mh21, mh30, mh31, mh50, mh51, mh60, mh61, mh80]
-        random.shuffle(hits)
         true_clusters, special_clusters = build_clusters(hits, rep_info, model, self.hit_weights)
         self.assertEqual(len(true_clusters), 2)
-        self.assertListEqual(true_clusters[0].hits, [mh80, mh11, mh21, mh31])
-        self.assertListEqual(true_clusters[1].hits, [mh51, mh61])
+        self.assertSameHits(true_clusters[0].hits, [mh80, mh11, mh21, mh31])
+        self.assertSameHits(true_clusters[1].hits, [mh51, mh61])
         self.assertEqual(special_clusters, {})
 
         # replicon is linear the last hit is not merged with the first cluster
         # mh80 is link to gene_4 'abc'. So, in this test, it's not a loner.
         rep_info = RepliconInfo('linear', 1, 62, [(f"g_{i}", i*10) for i in range(1, 7)])
         hits = [mh10, mh11, mh20, mh21, mh30, mh31, mh50, mh51, mh60, mh61]
-        random.shuffle(hits)
         true_clusters, special_clusters = build_clusters(hits, rep_info, model, self.hit_weights)
         self.assertEqual(len(true_clusters), 2)
-        self.assertListEqual(true_clusters[0].hits, [mh11, mh21, mh31])
-        self.assertListEqual(true_clusters[1].hits, [mh51, mh61])
+        self.assertSameHits(true_clusters[0].hits, [mh11, mh21, mh31])
+        self.assertSameHits(true_clusters[1].hits, [mh51, mh61])
         self.assertEqual(special_clusters, {})
 
         # case replicon is linear, 2 clusters, the hits 11,21,31 and 51,61 are contiguous
-        #                                                              pos
-        h10 = CoreHit(core_genes[0], "h10", 10, "replicon_1", 10, 1.0, 11.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(core_genes[0], "h10", 10, 11.0)
         mh10 = ModelHit(h10, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
-        h11 = CoreHit(core_genes[2], "h11", 10, "replicon_1", 11, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h11 = _core_hit(core_genes[2], "h11", 11, 21.0)
         mh11 = ModelHit(h11, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h12 = CoreHit(core_genes[1], "h12", 10, "replicon_1", 12, 1.0, 31.0, 1.0, 1.0, 10, 20)
+        h12 = _core_hit(core_genes[1], "h12", 12, 31.0)
         mh12 = ModelHit(h12, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
-        h50 = CoreHit(core_genes[2], "h50", 10, "replicon_1", 50, 1.0, 51.0, 1.0, 1.0, 10, 20)
+        h50 = _core_hit(core_genes[2], "h50", 50, 51.0)
         mh50 = ModelHit(h50, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h51 = CoreHit(core_genes[3], "h51", 10, "replicon_1", 51, 1.0, 61.0, 1.0, 1.0, 10, 20)
+        h51 = _core_hit(core_genes[3], "h51", 51, 61.0)
         mh51 = ModelHit(h51, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
         hits = [mh10, mh11, mh12, mh50, mh51]
-        random.shuffle(hits)
         true_clusters, special_clusters = build_clusters(hits, rep_info, model, self.hit_weights)
         self.assertEqual(len(true_clusters), 2)
-        self.assertListEqual(true_clusters[0].hits, [mh10, mh11, mh12])
-        self.assertListEqual(true_clusters[1].hits, [mh50, mh51])
+        self.assertSameHits(true_clusters[0].hits, [mh10, mh11, mh12])
+        self.assertSameHits(true_clusters[1].hits, [mh50, mh51])
         self.assertEqual(special_clusters, {})
 
         # case replicon is linear
         # one cluster with one hit loner
-        h80 = CoreHit(core_genes[4], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[4], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[4], gene_status=GeneStatus.NEUTRAL)
         hits = [mh80]
         true_clusters, special_clusters = build_clusters(hits, rep_info, model, self.hit_weights)
@@ -219,18 +244,18 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
         model.add_mandatory_gene(model_genes[0])
         model.add_accessory_gene(model_genes[1])
 
-        h80 = CoreHit(core_genes[1], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[1], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[1], gene_status=GeneStatus.ACCESSORY)
         hits = [mh80]
         true_clusters, special_clusters = build_clusters(hits, rep_info, model, self.hit_weights)
         self.assertEqual(len(true_clusters), 1)
-        self.assertListEqual(true_clusters[0].hits, [mh80])
+        self.assertSameHits(true_clusters[0].hits, [mh80])
         self.assertEqual(special_clusters, {})
 
         # case replicon is linear
@@ -240,22 +265,21 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
         model.add_mandatory_gene(model_genes[0])
         model.add_accessory_gene(model_genes[1])
 
-        h10 = CoreHit(core_genes[0], "h10", 10, "replicon_1", 10, 1.0, 11.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(core_genes[0], "h10", 10, 11.0)
         mh10 = ModelHit(h10, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
-        h80 = CoreHit(core_genes[1], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[1], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[1], gene_status=GeneStatus.ACCESSORY)
         hits = [mh10, mh80]
-        random.shuffle(hits)
         true_clusters, special_clusters = build_clusters(hits, rep_info, model, self.hit_weights)
         self.assertEqual(len(true_clusters), 2)
-        self.assertListEqual(true_clusters[0].hits, [mh10])
-        self.assertListEqual(true_clusters[1].hits, [mh80])
+        self.assertSameHits(true_clusters[0].hits, [mh10])
+        self.assertSameHits(true_clusters[1].hits, [mh80])
         self.assertEqual(special_clusters, {})
 
         # case replicon is linear
@@ -264,12 +288,12 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
         model.add_mandatory_gene(model_genes[0])
         model.add_accessory_gene(model_genes[1])
-        h80 = CoreHit(core_genes[1], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[1], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[1], gene_status=GeneStatus.ACCESSORY)
         hits = [mh80]
         true_clusters, special_clusters = build_clusters(hits, rep_info, model, self.hit_weights)
@@ -282,6 +306,48 @@ class TestBuildCluster(MacsyTest):
         self.assertEqual(special_clusters, {})
 
 
+    def test_build_clusters_order_independent(self):
+        # the clusters must not depend on the order of the input hits
+        # check it on a few permutations, with a fixed seed to be able to reproduce a failure
+        model = Model("foo/T2SS", 11)
+        core_genes = []
+        model_genes = []
+        for g_name in ('gspD', 'sctC', 'sctJ', 'sctN', 'abc'):
+            core_gene = self.core_gene(g_name)
+            core_genes.append(core_gene)
+            model_genes.append(ModelGene(core_gene, model))
+        model_genes[4]._loner = True
+        model.add_mandatory_gene(model_genes[0])
+        model.add_mandatory_gene(model_genes[1])
+        model.add_accessory_gene(model_genes[2])
+        model.add_accessory_gene(model_genes[3])
+        model.add_neutral_gene(model_genes[4])
+
+        #       gene idx, pos, score
+        schedule = [(0, 10, 10.0), (0, 10, 11.0), (1, 20, 20.0), (2, 20, 21.0), (2, 30, 30.0), (1, 30, 31.0),
+                    (2, 50, 50.0), (2, 50, 51.0), (2, 60, 60.0), (3, 60, 61.0), (4, 80, 80.0)]
+        statuses = [GeneStatus.MANDATORY, GeneStatus.MANDATORY, GeneStatus.ACCESSORY, GeneStatus.ACCESSORY,
+                    GeneStatus.NEUTRAL]
+        hits = [ModelHit(_core_hit(core_genes[g_idx], f"h{pos}_{i}", pos, score),
+                         gene_ref=model_genes[g_idx], gene_status=statuses[g_idx])
+                for i, (g_idx, pos, score) in enumerate(schedule)]
+
+        rng = random.Random(1234)
+        for topology, max_pos in (('linear', 100), ('circular', 80)):
+            rep_info = RepliconInfo(topology, 1, max_pos, [(f"g_{i}", i * 10) for i in range(1, max_pos // 10 + 1)])
+            exp_clusters, exp_loners = build_clusters(hits[:], rep_info, model, self.hit_weights)
+            exp_clusters = [[h.id for h in c.hits] for c in exp_clusters]
+            exp_loners = {f: [h.id for h in c.hits] for f, c in exp_loners.items()}
+            for _ in range(5):
+                shuffled = hits[:]
+                rng.shuffle(shuffled)
+                true_clusters, special_clusters = build_clusters(shuffled, rep_info, model, self.hit_weights)
+                with self.subTest(topology=topology, order=[h.id for h in shuffled]):
+                    self.assertListEqual([[h.id for h in c.hits] for c in true_clusters], exp_clusters)
+                    self.assertDictEqual({f: [h.id for h in c.hits] for f, c in special_clusters.items()},
+                                         exp_loners)
+
+
     def test_colocates(self):
         rep_info = RepliconInfo('linear', 1, 60, [(f"g_{i}", i * 10) for i in range(1, 7)])
 
@@ -291,7 +357,7 @@ class TestBuildCluster(MacsyTest):
         core_genes = {}
         model_genes = {}
         for g_name in ('gspD', 'sctC', 'sctJ', 'sctN'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes[g_name] = core_gene
             model_genes[g_name] = ModelGene(core_gene, model)
 
@@ -300,14 +366,14 @@ class TestBuildCluster(MacsyTest):
         model.add_accessory_gene(model_genes['sctJ'])
         model.add_accessory_gene(model_genes['sctN'])
 
-        h10 = CoreHit(core_genes['gspD'], "h10", 10, "replicon_1", 10, 1.0, 11.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(core_genes['gspD'], "h10", 10, 11.0)
         mh10 = ModelHit(h10, gene_ref=model_genes['gspD'], gene_status=GeneStatus.MANDATORY)
 
-        h15 = CoreHit(core_genes['sctC'], "h15", 10, "replicon_1", 15, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h15 = _core_hit(core_genes['sctC'], "h15", 15, 21.0)
         mh15 = ModelHit(h15, gene_ref=model_genes['sctC'], gene_status=GeneStatus.ACCESSORY)
         self.assertTrue(_colocates(mh10, mh15, rep_info))
 
-        h20 = CoreHit(core_genes['sctJ'], "h20", 10, "replicon_1", 20, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h20 = _core_hit(core_genes['sctJ'], "h20", 20, 21.0)
         mh20 = ModelHit(h20, gene_ref=model_genes['sctJ'], gene_status=GeneStatus.ACCESSORY)
         self.assertFalse(_colocates(mh10, mh20, rep_info))
 
@@ -315,37 +381,37 @@ class TestBuildCluster(MacsyTest):
         self.assertTrue(_colocates(mh10, mh20, rep_info))
 
         # case inter_gene_max_space is define at gene level sctJ and > than model intergene_max_space
-        h30 = CoreHit(core_genes['sctJ'], "h30", 10, "replicon_1", 30, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h30 = _core_hit(core_genes['sctJ'], "h30", 30, 21.0)
         mh30 = ModelHit(h30, gene_ref=model_genes['sctJ'], gene_status=GeneStatus.ACCESSORY)
         model_genes['sctJ']._inter_gene_max_space = 30
         self.assertTrue(_colocates(mh10, mh30, rep_info))
 
         # same case but inter_gene_max_space is define in first gene
-        h30 = CoreHit(core_genes['sctJ'], "h30", 10, "replicon_1", 30, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h30 = _core_hit(core_genes['sctJ'], "h30", 30, 21.0)
         mh30 = ModelHit(h30, gene_ref=model_genes['sctJ'], gene_status=GeneStatus.ACCESSORY)
         model_genes['sctJ']._inter_gene_max_space = 5
-        h35 = CoreHit(core_genes['sctN'], "h35", 10, "replicon_1", 35, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h35 = _core_hit(core_genes['sctN'], "h35", 35, 21.0)
         mh35 = ModelHit(h35, gene_ref=model_genes['sctN'], gene_status=GeneStatus.ACCESSORY)
         self.assertTrue(_colocates(mh30, mh35, rep_info))
 
         # case inter_gene_max_sapce is define at gene level sctJ and > than model intergene_max_space
-        h30 = CoreHit(core_genes['sctJ'], "h30", 10, "replicon_1", 15, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h30 = _core_hit(core_genes['sctJ'], "h30", 15, 21.0)
         mh30 = ModelHit(h30, gene_ref=model_genes['sctJ'], gene_status=GeneStatus.ACCESSORY)
         model_genes['sctJ']._inter_gene_max_space = 5
         self.assertTrue(_colocates(mh10, mh30, rep_info))
 
-        h30 = CoreHit(core_genes['sctJ'], "h30", 10, "replicon_1", 17, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h30 = _core_hit(core_genes['sctJ'], "h30", 17, 21.0)
         mh30 = ModelHit(h30, gene_ref=model_genes['sctJ'], gene_status=GeneStatus.ACCESSORY)
         model_genes['sctJ']._inter_gene_max_space = 5
         self.assertFalse(_colocates(mh10, mh30, rep_info))
 
         # case inter_gene_max_sapce is define at gene level sctJ and gspD use the smallest one
         model_genes['gspD']._inter_gene_max_space = 7
-        h30 = CoreHit(core_genes['sctJ'], "h30", 10, "replicon_1", 17, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h30 = _core_hit(core_genes['sctJ'], "h30", 17, 21.0)
         mh30 = ModelHit(h30, gene_ref=model_genes['sctJ'], gene_status=GeneStatus.ACCESSORY)
         self.assertFalse(_colocates(mh10, mh30, rep_info))
 
-        h30 = CoreHit(core_genes['sctJ'], "h30", 10, "replicon_1", 15, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h30 = _core_hit(core_genes['sctJ'], "h30", 15, 21.0)
         mh30 = ModelHit(h30, gene_ref=model_genes['sctJ'], gene_status=GeneStatus.ACCESSORY)
         model_genes['sctJ']._inter_gene_max_space = 5
         self.assertTrue(_colocates(mh10, mh30, rep_info))
@@ -362,7 +428,7 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC', 'sctJ', 'sctN', 'abc', 'tadZ'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
         model_genes[4]._loner = True
@@ -374,32 +440,29 @@ class TestBuildCluster(MacsyTest):
         model.add_accessory_gene(model_genes[4])  # loner
         model.add_neutral_gene(model_genes[5])
 
-        #     CoreHit(gene, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        #                                                     pos     score
-        h10 = CoreHit(core_genes[0], "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(core_genes[0], "h10", 10, 10.0)
         mh10 = ModelHit(h10, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
-        h11 = CoreHit(core_genes[0], "h11", 10, "replicon_1", 10, 1.0, 11.0, 1.0, 1.0, 10, 20)
+        h11 = _core_hit(core_genes[0], "h11", 10, 11.0)
         mh11 = ModelHit(h11, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
 
-        h20 = CoreHit(core_genes[1], "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
+        h20 = _core_hit(core_genes[1], "h20", 20, 20.0)
         mh20 = ModelHit(h20, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
-        h21 = CoreHit(core_genes[2], "h21", 10, "replicon_1", 20, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h21 = _core_hit(core_genes[2], "h21", 20, 21.0)
         mh21 = ModelHit(h21, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
 
-        h30 = CoreHit(core_genes[2], "h30", 10, "replicon_1", 30, 1.0, 30.0, 1.0, 1.0, 10, 20)
+        h30 = _core_hit(core_genes[2], "h30", 30, 30.0)
         mh30 = ModelHit(h30, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h31 = CoreHit(core_genes[1], "h31", 10, "replicon_1", 30, 1.0, 31.0, 1.0, 1.0, 10, 20)
+        h31 = _core_hit(core_genes[1], "h31", 30, 31.0)
         mh31 = ModelHit(h31, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
 
-        h50 = CoreHit(core_genes[2], "h50", 10, "replicon_1", 50, 1.0, 50.0, 1.0, 1.0, 10, 20)
+        h50 = _core_hit(core_genes[2], "h50", 50, 50.0)
         mh50 = ModelHit(h50, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h51 = CoreHit(core_genes[2], "h51", 10, "replicon_1", 50, 1.0, 51.0, 1.0, 1.0, 10, 20)
+        h51 = _core_hit(core_genes[2], "h51", 50, 51.0)
         mh51 = ModelHit(h51, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
 
-        h60 = CoreHit(core_genes[3], "h60", 10, "replicon_1", 60, 1.0, 60.0, 1.0, 1.0, 10, 20)
+        h60 = _core_hit(core_genes[3], "h60", 60, 60.0)
         mh60 = ModelHit(h60, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
-        h61 = CoreHit(core_genes[3], "h61", 10, "replicon_1", 60, 1.0, 61.0, 1.0, 1.0, 10, 20)
+        h61 = _core_hit(core_genes[3], "h61", 60, 61.0)
         mh61 = ModelHit(h61, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
 
         # case replicon is linear, 2 clusters
@@ -407,112 +470,112 @@ class TestBuildCluster(MacsyTest):
         random.shuffle(hits)
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 2)
-        self.assertListEqual(got_clusters[0].hits, [mh11, mh21, mh31])
-        self.assertListEqual(got_clusters[1].hits, [mh51, mh61])
+        self.assertSameHits(got_clusters[0].hits, [mh11, mh21, mh31])
+        self.assertSameHits(got_clusters[1].hits, [mh51, mh61])
 
         # case replicon is linear with a single hit (not loner) between 2 clusters
-        h70 = CoreHit(core_genes[3], "h70", 10, "replicon_1", 70, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h70 = _core_hit(core_genes[3], "h70", 70, 80.0)
         mh70 = ModelHit(h70, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
-        h80 = CoreHit(core_genes[4], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[4], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[4], gene_status=GeneStatus.ACCESSORY)
         hits = [mh10, mh11, mh20, mh21, mh50, mh51, mh70, mh80]
         random.shuffle(hits)
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 2)
-        self.assertListEqual(got_clusters[0].hits, [mh11, mh21])
-        self.assertListEqual(got_clusters[1].hits, [mh70, mh80])
+        self.assertSameHits(got_clusters[0].hits, [mh11, mh21])
+        self.assertSameHits(got_clusters[1].hits, [mh70, mh80])
 
         # replicon is linear, 3 clusters, the last one contains only one hit (loner h80)
         rep_info = RepliconInfo('linear', 1, 100, [(f"g_{i}", i * 10) for i in range(1, 101)])
-        h80 = CoreHit(core_genes[4], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[4], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[4], gene_status=GeneStatus.ACCESSORY)
         hits = [mh10, mh11, mh20, mh21, mh30, mh31, mh50, mh51, mh60, mh61, mh80]
         random.shuffle(hits)
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 3)
-        self.assertListEqual(got_clusters[0].hits, [mh11, mh21, mh31])
-        self.assertListEqual(got_clusters[1].hits, [mh51, mh61])
-        self.assertListEqual(got_clusters[2].hits, [mh80])
+        self.assertSameHits(got_clusters[0].hits, [mh11, mh21, mh31])
+        self.assertSameHits(got_clusters[1].hits, [mh51, mh61])
+        self.assertSameHits(got_clusters[2].hits, [mh80])
 
         # replicon is circular contains only one cluster
         rep_info = RepliconInfo('circular', 1, 60, [(f"g_{i}", i * 10) for i in range(1, 7)])
         hits = [mh10, mh20, mh30]
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 1)
-        self.assertListEqual(got_clusters[0].hits, [mh10, mh20, mh30])
+        self.assertSameHits(got_clusters[0].hits, [mh10, mh20, mh30])
 
         # replicon is circular the last cluster is merge  with the first So we have only one cluster
         rep_info = RepliconInfo('circular', 1, 60, [(f"g_{i}", i * 10) for i in range(1, 7)])
         hits = [mh10, mh11, mh20, mh21, mh30, mh31, mh50, mh51, mh60, mh61]
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 1)
-        self.assertListEqual(got_clusters[0].hits, [mh51, mh61, mh11, mh21, mh31])
+        self.assertSameHits(got_clusters[0].hits, [mh51, mh61, mh11, mh21, mh31])
 
         # replicon is linear the last cluster SHOULD NOT be merged with the first So we have 2 clusters
         rep_info = RepliconInfo('linear', 1, 60, [(f"g_{i}", i * 10) for i in range(1, 7)])
         hits = [mh10, mh11, mh20, mh21, mh30, mh31, mh50, mh51, mh60, mh61]
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 2)
-        self.assertListEqual(got_clusters[0].hits, [mh11, mh21, mh31])
-        self.assertListEqual(got_clusters[1].hits, [mh51, mh61])
+        self.assertSameHits(got_clusters[0].hits, [mh11, mh21, mh31])
+        self.assertSameHits(got_clusters[1].hits, [mh51, mh61])
 
         # replicon is circular the last hit is incorporate to the first cluster
         # mh80 is not considered as loner it is included in a cluster
         rep_info = RepliconInfo('circular', 1, 80, [(f"g_{i}", i * 10) for i in range(1, 9)])
-        h80 = CoreHit(core_genes[3], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[3], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
         hits = [mh10, mh11, mh20, mh21, mh30, mh31, mh50, mh51, mh60, mh61, mh80]
         random.shuffle(hits)
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 2)
-        self.assertListEqual(got_clusters[0].hits, [mh80, mh11, mh21, mh31])
-        self.assertListEqual(got_clusters[1].hits, [mh51, mh61])
+        self.assertSameHits(got_clusters[0].hits, [mh80, mh11, mh21, mh31])
+        self.assertSameHits(got_clusters[1].hits, [mh51, mh61])
 
         # replicon is linear the last hit SHOULD NOT be incorporated to the first cluster
         # mh80 is not considered as loner it is included in a cluster
         rep_info = RepliconInfo('linear', 1, 80, [(f"g_{i}", i * 10) for i in range(1, 9)])
-        h80 = CoreHit(core_genes[3], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[3], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
         hits = [mh10, mh11, mh20, mh21, mh30, mh31, mh50, mh51, mh60, mh61, mh80]
         random.shuffle(hits)
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 2)
-        self.assertListEqual(got_clusters[0].hits, [mh11, mh21, mh31])
-        self.assertListEqual(got_clusters[1].hits, [mh51, mh61])
+        self.assertSameHits(got_clusters[0].hits, [mh11, mh21, mh31])
+        self.assertSameHits(got_clusters[1].hits, [mh51, mh61])
 
         # replicon is circular
         # last hit colocalize with first hit which is not in a cluster
         rep_info = RepliconInfo('circular', 1, 80, [(f"g_{i}", i * 10) for i in range(1, 9)])
-        h80 = CoreHit(core_genes[3], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[3], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
         hits = [mh10, mh11, mh30, mh31, mh50, mh51, mh60, mh61, mh80]
         random.shuffle(hits)
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 2)
-        self.assertListEqual(got_clusters[0].hits, [mh51, mh61])
-        self.assertListEqual(got_clusters[1].hits, [mh80, mh11])
+        self.assertSameHits(got_clusters[0].hits, [mh51, mh61])
+        self.assertSameHits(got_clusters[1].hits, [mh80, mh11])
 
         # replicon is circular
         # last hit mh80 colocalize with first hit mh10_alt which is not in a cluster but the 2 hits are neutral: it's not a cluster
         rep_info = RepliconInfo('circular', 1, 80, [(f"g_{i}", i * 10) for i in range(1, 9)])
 
-        h10_alt = CoreHit(core_genes[3], "h10_alt", 10, "replicon_1", 10, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h10_alt = _core_hit(core_genes[3], "h10_alt", 10, 80.0)
         mh10_alt = ModelHit(h10_alt, gene_ref=model_genes[5], gene_status=GeneStatus.ACCESSORY)
-        h80 = CoreHit(core_genes[3], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[3], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[5], gene_status=GeneStatus.ACCESSORY)
         hits = [mh10_alt, mh30, mh31, mh50, mh51, mh60, mh61, mh80]
         random.shuffle(hits)
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 1)
-        self.assertListEqual(got_clusters[0].hits, [mh51, mh61])
+        self.assertSameHits(got_clusters[0].hits, [mh51, mh61])
 
         # replicon is circular
         # last hit mh80 does not colocates whit first one mh50
         rep_info = RepliconInfo('circular', 1, 80, [(f"g_{i}", i * 10) for i in range(1, 9)])
 
-        h10_alt = CoreHit(core_genes[3], "h10_alt", 10, "replicon_1", 10, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h10_alt = _core_hit(core_genes[3], "h10_alt", 10, 80.0)
         mh10_alt = ModelHit(h10_alt, gene_ref=model_genes[5], gene_status=GeneStatus.ACCESSORY)
-        h80 = CoreHit(core_genes[3], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[3], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[5], gene_status=GeneStatus.ACCESSORY)
         hits = [mh10_alt,  mh50]
         random.shuffle(hits)
@@ -522,13 +585,13 @@ class TestBuildCluster(MacsyTest):
         # # replicon is linear
         # # last hit DO NOT colocalize with first hit which is not in a cluster
         rep_info = RepliconInfo('linear', 1, 80, [(f"g_{i}", i * 10) for i in range(1, 9)])
-        h80 = CoreHit(core_genes[3], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[3], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
         hits = [mh10, mh11, mh30, mh31, mh50, mh51, mh60, mh61, mh80]
         random.shuffle(hits)
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 1)
-        self.assertListEqual(got_clusters[0].hits, [mh51, mh61])
+        self.assertSameHits(got_clusters[0].hits, [mh51, mh61])
 
 
         # replicon is linear the last hit is not merged with the first cluster
@@ -538,36 +601,35 @@ class TestBuildCluster(MacsyTest):
         random.shuffle(hits)
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 2)
-        self.assertListEqual(got_clusters[0].hits, [mh11, mh21, mh31])
-        self.assertListEqual(got_clusters[1].hits, [mh51, mh61])
+        self.assertSameHits(got_clusters[0].hits, [mh11, mh21, mh31])
+        self.assertSameHits(got_clusters[1].hits, [mh51, mh61])
 
         # case replicon is linear, 2 clusters, the hits 11,21,31 and 51,61 are contiguous
-        #                                                              pos
-        h10 = CoreHit(core_genes[0], "h10", 10, "replicon_1", 10, 1.0, 11.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(core_genes[0], "h10", 10, 11.0)
         mh10 = ModelHit(h10, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
-        h11 = CoreHit(core_genes[2], "h11", 10, "replicon_1", 11, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        h11 = _core_hit(core_genes[2], "h11", 11, 21.0)
         mh11 = ModelHit(h11, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h12 = CoreHit(core_genes[1], "h12", 10, "replicon_1", 12, 1.0, 31.0, 1.0, 1.0, 10, 20)
+        h12 = _core_hit(core_genes[1], "h12", 12, 31.0)
         mh12 = ModelHit(h12, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
-        h50 = CoreHit(core_genes[2], "h50", 10, "replicon_1", 50, 1.0, 51.0, 1.0, 1.0, 10, 20)
+        h50 = _core_hit(core_genes[2], "h50", 50, 51.0)
         mh50 = ModelHit(h50, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h51 = CoreHit(core_genes[3], "h51", 10, "replicon_1", 51, 1.0, 61.0, 1.0, 1.0, 10, 20)
+        h51 = _core_hit(core_genes[3], "h51", 51, 61.0)
         mh51 = ModelHit(h51, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
         hits = [mh10, mh11, mh12, mh50, mh51]
         random.shuffle(hits)
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 2)
-        self.assertListEqual(got_clusters[0].hits, [mh10, mh11, mh12])
-        self.assertListEqual(got_clusters[1].hits, [mh50, mh51])
+        self.assertSameHits(got_clusters[0].hits, [mh10, mh11, mh12])
+        self.assertSameHits(got_clusters[1].hits, [mh50, mh51])
 
         # case replicon is linear
         # one cluster with one hit loner
-        h80 = CoreHit(core_genes[4], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[4], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[4], gene_status=GeneStatus.ACCESSORY)
         hits = [mh80]
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 1)
-        self.assertListEqual(got_clusters[0].hits, [mh80])
+        self.assertSameHits(got_clusters[0].hits, [mh80])
 
         # case replicon is linear
         # one cluster with one hit min_gene_required == 1
@@ -576,18 +638,18 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
         model.add_mandatory_gene(model_genes[0])
         model.add_accessory_gene(model_genes[1])
 
-        h80 = CoreHit(core_genes[1], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[1], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[1], gene_status=GeneStatus.ACCESSORY)
         hits = [mh80]
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 1)
-        self.assertListEqual(got_clusters[0].hits, [mh80])
+        self.assertSameHits(got_clusters[0].hits, [mh80])
 
         # case replicon is linear
         # one cluster with one hit min_gene_required == 1
@@ -596,22 +658,22 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
         model.add_mandatory_gene(model_genes[0])
         model.add_accessory_gene(model_genes[1])
 
-        h10 = CoreHit(core_genes[0], "h10", 10, "replicon_1", 10, 1.0, 11.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(core_genes[0], "h10", 10, 11.0)
         mh10 = ModelHit(h10, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
-        h80 = CoreHit(core_genes[1], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[1], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[1], gene_status=GeneStatus.ACCESSORY)
         hits = [mh10, mh80]
         random.shuffle(hits)
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 2)
-        self.assertListEqual(got_clusters[0].hits, [mh10])
-        self.assertListEqual(got_clusters[1].hits, [mh80])
+        self.assertSameHits(got_clusters[0].hits, [mh10])
+        self.assertSameHits(got_clusters[1].hits, [mh80])
 
         # case replicon is linear
         # one cluster with one hit min_gene_required != 1
@@ -619,12 +681,12 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
         model.add_mandatory_gene(model_genes[0])
         model.add_accessory_gene(model_genes[1])
-        h80 = CoreHit(core_genes[1], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[1], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[1], gene_status=GeneStatus.ACCESSORY)
         hits = [mh80]
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
@@ -639,7 +701,7 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC', 'sctJ', 'sctN', 'abc', 'tadZ'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
         model_genes[4]._loner = True
@@ -653,11 +715,11 @@ class TestBuildCluster(MacsyTest):
 
         # case replicon is linear
         # one cluster composed of only loners
-        h80 = CoreHit(core_genes[4], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h80 = _core_hit(core_genes[4], "h80", 80, 80.0)
         mh80 = ModelHit(h80, gene_ref=model_genes[4], gene_status=GeneStatus.ACCESSORY)
-        h85 = CoreHit(core_genes[4], "h85", 10, "replicon_1", 85, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h85 = _core_hit(core_genes[4], "h85", 85, 80.0)
         mh85 = ModelHit(h85, gene_ref=model_genes[4], gene_status=GeneStatus.ACCESSORY)
-        h89 = CoreHit(core_genes[4], "h89", 10, "replicon_1", 89, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h89 = _core_hit(core_genes[4], "h89", 89, 80.0)
         mh89 = ModelHit(h89, gene_ref=model_genes[4], gene_status=GeneStatus.ACCESSORY)
 
         hits = [mh80, mh85, mh89]
@@ -668,16 +730,16 @@ class TestBuildCluster(MacsyTest):
         # in _get_tue_loners
         # I should get one cluster of 3 loners
         self.assertEqual(len(got_clusters), 1)
-        self.assertListEqual(got_clusters[0].hits, [mh80, mh85, mh89])
+        self.assertSameHits(got_clusters[0].hits, [mh80, mh85, mh89])
 
         # case replicon is linear
         # one cluster composed of only one type of gene
         # I should not get cluster
-        h10 = CoreHit(core_genes[1], "h10", 10, "replicon_1", 10, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(core_genes[1], "h10", 10, 80.0)
         mh10 = ModelHit(h10, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
-        h15 = CoreHit(core_genes[1], "h15", 10, "replicon_1", 15, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h15 = _core_hit(core_genes[1], "h15", 15, 80.0)
         mh15 = ModelHit(h15, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
-        h19 = CoreHit(core_genes[1], "h19", 10, "replicon_1", 19, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h19 = _core_hit(core_genes[1], "h19", 19, 80.0)
         mh19 = ModelHit(h19, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
 
         hits = [mh10, mh15, mh19]
@@ -687,20 +749,20 @@ class TestBuildCluster(MacsyTest):
 
         # case replicon is linear
         # one cluster composed of only one type of gene and it's exhangeable
-        core_flgB = CoreGene(self.model_location, 'flgB', self.profile_factory)
+        core_flgB = self.core_gene('flgB')
         exchangeable = Exchangeable(core_flgB, model_genes[2])
-        h20 = CoreHit(core_genes[2], "h20", 10, "replicon_1", 20, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h20 = _core_hit(core_genes[2], "h20", 20, 80.0)
         mh20 = ModelHit(h20, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h25 = CoreHit(core_genes[2], "h25", 10, "replicon_1", 25, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h25 = _core_hit(core_genes[2], "h25", 25, 80.0)
         mh25 = ModelHit(h25, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h29 = CoreHit(core_flgB, "h29", 10, "replicon_1", 29, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        h29 = _core_hit(core_flgB, "h29", 29, 80.0)
         mh29 = ModelHit(h29, gene_ref=exchangeable, gene_status=GeneStatus.ACCESSORY)
 
         hits = [mh20, mh25, mh29]
         random.shuffle(hits)
         got_clusters = clusterize_hits_on_distance_only(hits, model, self.hit_weights, rep_info)
         self.assertEqual(len(got_clusters), 1)
-        self.assertListEqual(got_clusters[0].hits, [mh20, mh25, mh29])
+        self.assertSameHits(got_clusters[0].hits, [mh20, mh25, mh29])
 
 
     def test_split_cluster_on_key_genes(self):
@@ -708,7 +770,7 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC', 'sctJ', 'sctN', 'abc', 'tadZ', 'flgB'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
 
@@ -720,27 +782,27 @@ class TestBuildCluster(MacsyTest):
         model.add_accessory_gene(model_genes[5]) # integrase
         model.add_accessory_gene(model_genes[6])
 
-        int_20 = CoreHit(core_genes[1], "int_h20", 10, "replicon_1", 20, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        int_20 = _core_hit(core_genes[1], "int_h20", 20, 10.0)
         mh_int_20 = ModelHit(int_20, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
-        int_60 = CoreHit(core_genes[5], "int_h20", 10, "replicon_1", 60, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        int_60 = _core_hit(core_genes[5], "int_h20", 60, 10.0)
         mh_int_60 = ModelHit(int_60, gene_ref=model_genes[5], gene_status=GeneStatus.MANDATORY)
         key_genes = [mh_int_20, mh_int_60]
 
-        h_10 = CoreHit(core_genes[0], "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_10 = _core_hit(core_genes[0], "h10", 10, 10.0)
         mh_10 = ModelHit(h_10, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
-        h_30 = CoreHit(core_genes[2], "h30", 10, "replicon_1", 30, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_30 = _core_hit(core_genes[2], "h30", 30, 10.0)
         mh_30 = ModelHit(h_30, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h_40 = CoreHit(core_genes[3], "h40", 10, "replicon_1", 40, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_40 = _core_hit(core_genes[3], "h40", 40, 10.0)
         mh_40 = ModelHit(h_40, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
-        h_50 = CoreHit(core_genes[4], "h50", 10, "replicon_1", 50, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_50 = _core_hit(core_genes[4], "h50", 50, 10.0)
         mh_50 = ModelHit(h_50, gene_ref=model_genes[4], gene_status=GeneStatus.ACCESSORY)
-        h_70 = CoreHit(core_genes[6], "h70", 10, "replicon_1", 70, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_70 = _core_hit(core_genes[6], "h70", 70, 10.0)
         mh_70 = ModelHit(h_70, gene_ref=model_genes[6], gene_status=GeneStatus.ACCESSORY)
         c = Cluster([mh_10, mh_int_20, mh_30, mh_40, mh_50, mh_int_60, mh_70], model, self.hit_weights)
         clusters = split_cluster_on_key_genes({h.gene_ref.name for h in key_genes}, c)
         self.assertEqual(len(clusters), 2)
-        self.assertEqual(clusters[0].hits, [mh_10, mh_int_20, mh_30, mh_40])
-        self.assertEqual(clusters[1].hits, [mh_50, mh_int_60, mh_70])
+        self.assertSameHits(clusters[0].hits, [mh_10, mh_int_20, mh_30, mh_40])
+        self.assertSameHits(clusters[1].hits, [mh_50, mh_int_60, mh_70])
 
         c = Cluster([mh_10, mh_30, mh_40, mh_50, mh_70], model, self.hit_weights)
         clusters = split_cluster_on_key_genes({h.gene_ref.name for h in (mh_int_20, mh_int_60)}, c)
@@ -753,7 +815,7 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC', 'sctJ', 'sctN', 'abc', 'tadZ', 'flgB'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
 
@@ -765,30 +827,30 @@ class TestBuildCluster(MacsyTest):
         model.add_accessory_gene(model_genes[5])  # integrase
         model.add_accessory_gene(model_genes[6])
 
-        int_20 = CoreHit(core_genes[1], "int_h20", 10, "replicon_1", 20, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        int_20 = _core_hit(core_genes[1], "int_h20", 20, 10.0)
         mh_int_20 = ModelHit(int_20, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
-        int_60 = CoreHit(core_genes[5], "int_h20", 10, "replicon_1", 60, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        int_60 = _core_hit(core_genes[5], "int_h20", 60, 10.0)
         mh_int_60 = ModelHit(int_60, gene_ref=model_genes[5], gene_status=GeneStatus.MANDATORY)
         key_genes = [mh.gene_ref.name for mh in (mh_int_20, mh_int_60)]
 
         # mh_10 -> mh_70 colocalize and contains 2 integrases the cluster must be split in 2
-        h_10 = CoreHit(core_genes[0], "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_10 = _core_hit(core_genes[0], "h10", 10, 10.0)
         mh_10 = ModelHit(h_10, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
-        h_30 = CoreHit(core_genes[2], "h30", 10, "replicon_1", 30, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_30 = _core_hit(core_genes[2], "h30", 30, 10.0)
         mh_30 = ModelHit(h_30, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h_40 = CoreHit(core_genes[3], "h40", 10, "replicon_1", 40, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_40 = _core_hit(core_genes[3], "h40", 40, 10.0)
         mh_40 = ModelHit(h_40, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
-        h_50 = CoreHit(core_genes[4], "h50", 10, "replicon_1", 50, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_50 = _core_hit(core_genes[4], "h50", 50, 10.0)
         mh_50 = ModelHit(h_50, gene_ref=model_genes[4], gene_status=GeneStatus.ACCESSORY)
-        h_70 = CoreHit(core_genes[6], "h70", 10, "replicon_1", 70, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_70 = _core_hit(core_genes[6], "h70", 70, 10.0)
         mh_70 = ModelHit(h_70, gene_ref=model_genes[6], gene_status=GeneStatus.ACCESSORY)
 
         # mh_100, mh_110, mh_120 colocalize but it does not contains an integrase so it's not a cluster
-        h_100 = CoreHit(core_genes[2], "h30", 10, "replicon_1", 100, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_100 = _core_hit(core_genes[2], "h30", 100, 10.0)
         mh_100 = ModelHit(h_100, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
-        h_110 = CoreHit(core_genes[3], "h110", 10, "replicon_1", 110, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_110 = _core_hit(core_genes[3], "h110", 110, 10.0)
         mh_110 = ModelHit(h_110, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
-        h_120 = CoreHit(core_genes[4], "h120", 10, "replicon_1", 120, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_120 = _core_hit(core_genes[4], "h120", 120, 10.0)
         mh_120 = ModelHit(h_120, gene_ref=model_genes[4], gene_status=GeneStatus.ACCESSORY)
 
         # One cluster with 2 integrases which need to be split
@@ -799,8 +861,8 @@ class TestBuildCluster(MacsyTest):
                                              model, self.hit_weights, rep_info)
 
         self.assertEqual(len(clusters), 2)
-        self.assertEqual(clusters[0].hits, [mh_10, mh_int_20, mh_30, mh_40])
-        self.assertEqual(clusters[1].hits, [mh_50, mh_int_60, mh_70])
+        self.assertSameHits(clusters[0].hits, [mh_10, mh_int_20, mh_30, mh_40])
+        self.assertSameHits(clusters[1].hits, [mh_50, mh_int_60, mh_70])
 
         # One cluster with One integrase
         clusters = clusterize_hits_around_key_genes(key_genes,
@@ -808,7 +870,7 @@ class TestBuildCluster(MacsyTest):
                                              model, self.hit_weights, rep_info)
 
         self.assertEqual(len(clusters), 1)
-        self.assertEqual(clusters[0].hits, [mh_10, mh_int_20, mh_30, mh_40])
+        self.assertSameHits(clusters[0].hits, [mh_10, mh_int_20, mh_30, mh_40])
 
 
     def test_closest_hit(self):
@@ -817,7 +879,7 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC', 'sctJ', 'sctN', 'abc', 'tadZ'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
 
@@ -828,27 +890,27 @@ class TestBuildCluster(MacsyTest):
         model.add_accessory_gene(model_genes[4])
         model.add_accessory_gene(model_genes[5])
 
-        int_20 = CoreHit(core_genes[1], "int_h20", 10, "replicon_1", 20, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        int_20 = _core_hit(core_genes[1], "int_h20", 20, 10.0)
         mh_int_20 = ModelHit(int_20, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
-        int_60 = CoreHit(core_genes[5], "int_h20", 10, "replicon_1", 60, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        int_60 = _core_hit(core_genes[5], "int_h20", 60, 10.0)
         mh_int_60 = ModelHit(int_60, gene_ref=model_genes[5], gene_status=GeneStatus.MANDATORY)
         ref_hits = [mh_int_20, mh_int_60]  # 'sctC', 'abc'
 
-        h_10 = CoreHit(core_genes[0], "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_10 = _core_hit(core_genes[0], "h10", 10, 10.0)
         mh_10 = ModelHit(h_10, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
         self.assertEqual(closest_hit(mh_10, ref_hits), mh_int_20)
 
-        h_30 = CoreHit(core_genes[2], "h30", 10, "replicon_1", 30, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_30 = _core_hit(core_genes[2], "h30", 30, 10.0)
         mh_30 = ModelHit(h_30, gene_ref=model_genes[2], gene_status=GeneStatus.MANDATORY)
         self.assertEqual(closest_hit(mh_30, ref_hits), mh_int_20)
 
-        h_50 = CoreHit(core_genes[4], "h50", 10, "replicon_1", 50, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_50 = _core_hit(core_genes[4], "h50", 50, 10.0)
         mh_50 = ModelHit(h_50, gene_ref=model_genes[4], gene_status=GeneStatus.MANDATORY)
         self.assertEqual(closest_hit(mh_50, ref_hits), mh_int_60)
 
         # h40 is at same distance from int_20 and int_60
         # but algorithm favor the first solution
-        h_40 = CoreHit(core_genes[3], "h40", 10, "replicon_1", 40, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h_40 = _core_hit(core_genes[3], "h40", 40, 10.0)
         mh_40 = ModelHit(h_40, gene_ref=model_genes[3], gene_status=GeneStatus.MANDATORY)
         self.assertEqual(closest_hit(mh_40, ref_hits), mh_int_20)
 
@@ -859,20 +921,17 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC', 'sctJ', 'sctN'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
 
         model.add_mandatory_gene(model_genes[0])
         model.add_mandatory_gene(model_genes[1])
 
-        #     CoreHit(gene, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        #                                                     pos     score
-        h10 = CoreHit(core_genes[0], "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(core_genes[0], "h10", 10, 10.0)
         mh10 = ModelHit(h10, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
 
-        h20 = CoreHit(core_genes[1], "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
+        h20 = _core_hit(core_genes[1], "h20", 20, 20.0)
         mh20 = ModelHit(h20, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
 
         self.assertFalse(is_a(mh10, {'sctC', 'sctN'}))
@@ -886,7 +945,7 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC', 'sctJ', 'sctN', 'abc', 'tadZ'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
         model_genes[3]._loner = True
@@ -898,25 +957,22 @@ class TestBuildCluster(MacsyTest):
         model.add_neutral_gene(model_genes[4])
         model.add_neutral_gene(model_genes[5])
 
-        #     CoreHit(gene, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        #                                                     pos     score
-        h10 = CoreHit(core_genes[0], "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(core_genes[0], "h10", 10, 10.0)
         mh10 = ModelHit(h10, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
 
-        h20 = CoreHit(core_genes[1], "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
+        h20 = _core_hit(core_genes[1], "h20", 20, 20.0)
         mh20 = ModelHit(h20, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
 
-        h30 = CoreHit(core_genes[2], "h30", 10, "replicon_1", 30, 1.0, 30.0, 1.0, 1.0, 10, 20)
+        h30 = _core_hit(core_genes[2], "h30", 30, 30.0)
         mh30 = ModelHit(h30, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
 
-        h40 = CoreHit(core_genes[3], "h40", 10, "replicon_1", 40, 1.0, 50.0, 1.0, 1.0, 10, 20)
+        h40 = _core_hit(core_genes[3], "h40", 40, 50.0)
         mh40 = ModelHit(h40, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
 
-        h50 = CoreHit(core_genes[4], "h50", 10, "replicon_1", 50, 1.0, 60.0, 1.0, 1.0, 10, 20)
+        h50 = _core_hit(core_genes[4], "h50", 50, 60.0)
         mh50 = ModelHit(h50, gene_ref=model_genes[4], gene_status=GeneStatus.NEUTRAL)
 
-        h60 = CoreHit(core_genes[5], "h60", 10, "replicon_1", 60, 1.0, 61.0, 1.0, 1.0, 10, 20)
+        h60 = _core_hit(core_genes[5], "h60", 60, 61.0)
         mh60 = ModelHit(h60, gene_ref=model_genes[5], gene_status=GeneStatus.NEUTRAL)
 
         hits = [mh10, mh20, mh30, mh40, mh50, mh60]
@@ -926,7 +982,7 @@ class TestBuildCluster(MacsyTest):
         c = scaffold_to_cluster(hits, model, self.hit_weights)
         self.assertTrue(isinstance(c, Cluster))
         self.assertEqual(len(c), len(hits))
-        self.assertEqual(c.hits, hits)
+        self.assertSameHits(c.hits, hits)
 
         # 1 hit model min_gene_required > 1
         c = scaffold_to_cluster([mh10], model, self.hit_weights)
@@ -935,15 +991,15 @@ class TestBuildCluster(MacsyTest):
         # 1 hit but a Loner
         # it's a cluster
         c = scaffold_to_cluster([mh40], model, self.hit_weights)
-        self.assertEqual(c.hits, [mh40])
+        self.assertSameHits(c.hits, [mh40])
 
         # several hits but all Loner
         # it's a cluster
-        h400 = CoreHit(core_genes[3], "h400", 10, "replicon_1", 400, 1.0, 50.0, 1.0, 1.0, 10, 20)
+        h400 = _core_hit(core_genes[3], "h400", 400, 50.0)
         mh400 = ModelHit(h400, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
         hits = [mh40, mh400]
         c = scaffold_to_cluster([mh40, mh400], model, self.hit_weights)
-        self.assertEqual(c.hits, [mh40, mh400])
+        self.assertSameHits(c.hits, [mh40, mh400])
 
 
         # several hits but only neutral
@@ -953,11 +1009,11 @@ class TestBuildCluster(MacsyTest):
 
         # several hits but same type of gene
         # it's not a cluster
-        h100 = CoreHit(core_genes[0], "h100", 10, "replicon_1", 100, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h100 = _core_hit(core_genes[0], "h100", 100, 10.0)
         mh100 = ModelHit(h100, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
-        h200 = CoreHit(core_genes[0], "h200", 10, "replicon_1", 200, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h200 = _core_hit(core_genes[0], "h200", 200, 10.0)
         mh200 = ModelHit(h200, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
-        h300 = CoreHit(core_genes[0], "h300", 10, "replicon_1", 300, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h300 = _core_hit(core_genes[0], "h300", 300, 10.0)
         mh300 = ModelHit(h300, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
         c = scaffold_to_cluster([mh100, mh200, mh300], model, self.hit_weights)
         self.assertIsNone(c)
@@ -966,7 +1022,7 @@ class TestBuildCluster(MacsyTest):
         # it's a cluster
         model._min_genes_required = 1
         c = scaffold_to_cluster([mh10], model, self.hit_weights)
-        self.assertEqual(c.hits, [mh10])
+        self.assertSameHits(c.hits, [mh10])
 
         # 1 hit NEUTRAL model min_gene_required == 1
         # it's NOT a cluster
@@ -980,7 +1036,7 @@ class TestBuildCluster(MacsyTest):
         core_genes = []
         model_genes = []
         for g_name in ('gspD', 'sctC', 'sctJ', 'sctN', 'abc',  'flgB'):
-            core_gene = CoreGene(self.model_location, g_name, self.profile_factory)
+            core_gene = self.core_gene(g_name)
             core_genes.append(core_gene)
             model_genes.append(ModelGene(core_gene, model))
         model_genes[4]._loner = True
@@ -995,39 +1051,36 @@ class TestBuildCluster(MacsyTest):
         model.add_accessory_gene(model_genes[5])
 
 
-        #     CoreHit(gene, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        #                                                     pos     score
-        ch_11 = CoreHit(core_genes[0], "h11", 10, "replicon_1", 10, 1.0, 11.0, 1.0, 1.0, 10, 20)
+        ch_11 = _core_hit(core_genes[0], "h11", 10, 11.0)
         mh_11 = ModelHit(ch_11, gene_ref=model_genes[0], gene_status=GeneStatus.MANDATORY)
 
-        ch_21 = CoreHit(core_genes[2], "h21", 10, "replicon_1", 20, 1.0, 21.0, 1.0, 1.0, 10, 20)
+        ch_21 = _core_hit(core_genes[2], "h21", 20, 21.0)
         mh_21 = ModelHit(ch_21, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
 
-        h31 = CoreHit(core_genes[1], "h31", 10, "replicon_1", 30, 1.0, 31.0, 1.0, 1.0, 10, 20)
+        h31 = _core_hit(core_genes[1], "h31", 30, 31.0)
         mh31 = ModelHit(h31, gene_ref=model_genes[1], gene_status=GeneStatus.MANDATORY)
 
-        ch_51 = CoreHit(core_genes[2], "h51", 10, "replicon_1", 50, 1.0, 51.0, 1.0, 1.0, 10, 20)
+        ch_51 = _core_hit(core_genes[2], "h51", 50, 51.0)
         mh_51 = ModelHit(ch_51, gene_ref=model_genes[2], gene_status=GeneStatus.ACCESSORY)
 
-        ch_61 = CoreHit(core_genes[3], "h61", 10, "replicon_1", 60, 1.0, 61.0, 1.0, 1.0, 10, 20)
+        ch_61 = _core_hit(core_genes[3], "h61", 60, 61.0)
         mh_61 = ModelHit(ch_61, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
 
         # case replicon is linear with a single hit (not loner) between 2 clusters
-        ch_70 = CoreHit(core_genes[3], "h70", 10, "replicon_1", 70, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        ch_70 = _core_hit(core_genes[3], "h70", 70, 80.0)
         mh_70 = ModelHit(ch_70, gene_ref=model_genes[3], gene_status=GeneStatus.ACCESSORY)
-        ch_80 = CoreHit(core_genes[4], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        ch_80 = _core_hit(core_genes[4], "h80", 80, 80.0)
         mh_80 = ModelHit(ch_80, gene_ref=model_genes[4], gene_status=GeneStatus.NEUTRAL)
         c0 = Cluster([mh_11, mh_21], model, self.hit_weights)
         c1 = Cluster([mh_70, mh_80], model, self.hit_weights)
         true_loners, true_clusters = _get_true_loners([c0, c1])
         self.assertEqual(len(true_clusters), 2)
-        self.assertListEqual(true_clusters[0].hits, [mh_11, mh_21])
-        self.assertListEqual(true_clusters[1].hits, [mh_70, mh_80])
+        self.assertSameHits(true_clusters[0].hits, [mh_11, mh_21])
+        self.assertSameHits(true_clusters[1].hits, [mh_70, mh_80])
         self.assertEqual(true_loners, {})
 
         # replicon is linear, 3 clusters, the last one contains only one hit (loner h80)
-        ch_80 = CoreHit(core_genes[4], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        ch_80 = _core_hit(core_genes[4], "h80", 80, 80.0)
         mh_80 = ModelHit(ch_80, gene_ref=model_genes[4], gene_status=GeneStatus.NEUTRAL)
 
         c0 = Cluster([mh_11, mh_21, mh31], model, self.hit_weights)
@@ -1035,8 +1088,8 @@ class TestBuildCluster(MacsyTest):
         c2 = Cluster([mh_80], model, self.hit_weights)
         true_loners, true_clusters = _get_true_loners([c0, c1, c2])
         self.assertEqual(len(true_clusters), 2)
-        self.assertListEqual(true_clusters[0].hits, [mh_11, mh_21, mh31])
-        self.assertListEqual(true_clusters[1].hits, [mh_51, mh_61])
+        self.assertSameHits(true_clusters[0].hits, [mh_11, mh_21, mh31])
+        self.assertSameHits(true_clusters[1].hits, [mh_51, mh_61])
         self.assertEqual(len(true_loners), 1)
         self.assertListEqual(true_loners['abc'].hits, [mh_80])
 
@@ -1044,22 +1097,22 @@ class TestBuildCluster(MacsyTest):
         # although the gene is mark as loner as the hit is in cluster
         # it is not considered as True Loner
         # so it's type should be a ModelHit not Loner
-        ch_80 = CoreHit(core_genes[4], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        ch_80 = _core_hit(core_genes[4], "h80", 80, 80.0)
         mh_80 = ModelHit(ch_80, gene_ref=model_genes[4], gene_status=GeneStatus.NEUTRAL)
 
         c0 = Cluster([mh_11, mh_21, mh31], model, self.hit_weights)
         c1 = Cluster([mh_51, mh_61, mh_80], model, self.hit_weights)
         true_loners, true_clusters = _get_true_loners([c0, c1])
         self.assertEqual(len(true_clusters), 2)
-        self.assertListEqual(true_clusters[0].hits, [mh_11, mh_21, mh31])
-        self.assertListEqual(true_clusters[1].hits, [mh_51, mh_61, mh_80])
+        self.assertSameHits(true_clusters[0].hits, [mh_11, mh_21, mh31])
+        self.assertSameHits(true_clusters[1].hits, [mh_51, mh_61, mh_80])
         self.assertEqual(len(true_loners), 0)
         self.assertTrue(isinstance(true_clusters[1].hits[-1], ModelHit))
         self.assertFalse(isinstance(true_clusters[1].hits[-1], Loner))
 
         # case replicon is linear
         # one cluster with one hit loner
-        ch_80 = CoreHit(core_genes[4], "h80", 10, "replicon_1", 80, 1.0, 80.0, 1.0, 1.0, 10, 20)
+        ch_80 = _core_hit(core_genes[4], "h80", 80, 80.0)
         mh_80 = ModelHit(ch_80, gene_ref=model_genes[4], gene_status=GeneStatus.NEUTRAL)
         c0 = Cluster([mh_80], model, self.hit_weights)
         true_loners, true_clusters = _get_true_loners([c0])
@@ -1072,9 +1125,9 @@ class TestBuildCluster(MacsyTest):
         # 2 clusters,
         #  - one regular cluster
         #  - 3 loner multisystem (same gene)
-        ch_90 = CoreHit(core_genes[5], "h90", 10, "replicon_1", 90, 1.0, 90.0, 1.0, 1.0, 10, 20)
-        ch_100 = CoreHit(core_genes[5], "h100", 10, "replicon_1", 100, 1.0, 100.0, 1.0, 1.0, 10, 20)
-        ch_110 = CoreHit(core_genes[5], "h110", 10, "replicon_1", 110, 1.0, 110.0, 1.0, 1.0, 10, 20)
+        ch_90 = _core_hit(core_genes[5], "h90", 90, 90.0)
+        ch_100 = _core_hit(core_genes[5], "h100", 100, 100.0)
+        ch_110 = _core_hit(core_genes[5], "h110", 110, 110.0)
         mh_90 = MultiSystem(ch_90, gene_ref=model_genes[5], gene_status=GeneStatus.ACCESSORY)
         mh_100 = MultiSystem(ch_100, gene_ref=model_genes[5], gene_status=GeneStatus.ACCESSORY)
         mh_110 = MultiSystem(ch_110, gene_ref=model_genes[5], gene_status=GeneStatus.ACCESSORY)
@@ -1099,38 +1152,24 @@ class TestBuildCluster(MacsyTest):
         self.assertSetEqual(set(true_loners['flgB'][0].counterpart), set([mh_90, mh_100]))
 
 
-class TestCluster(MacsyTest):
-
-    def setUp(self) -> None:
-        self.args = argparse.Namespace()
-        self.args.sequence_db = self.find_data("base", "test_1.fasta")
-        self.args.db_type = 'gembase'
-        self.args.models_dir = self.find_data('models')
-        self.args.res_search_dir = "blabla"
-
-        self.cfg = Config(MacsyDefaults(), self.args)
-        self.model_name = 'foo'
-        self.model_location = ModelLocation(path=os.path.join(self.args.models_dir, self.model_name))
-        self.profile_factory = ProfileFactory(self.cfg)
-        self.hit_weights = HitWeight(**self.cfg.hit_weights())
-
+class TestCluster(ClusterTestCase):
 
     def test_init(self):
         model_1 = Model("foo/T2SS", 11)
 
-        c_gene_1 = CoreGene(self.model_location, "gspD", self.profile_factory)
-        c_gene_2 = CoreGene(self.model_location, "sctC", self.profile_factory)
-        c_gene_3 = CoreGene(self.model_location, "sctJ", self.profile_factory)
+        c_gene_1 = self.core_gene("gspD")
+        c_gene_2 = self.core_gene("sctC")
+        c_gene_3 = self.core_gene("sctJ")
 
         gene_1 = ModelGene(c_gene_1, model_1)
 
-        h10 = CoreHit(c_gene_1, "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(c_gene_1, "h10", 10, 10.0)
         mh10 = ModelHit(h10, gene_1, GeneStatus.MANDATORY)
-        h20 = CoreHit(c_gene_2, "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
+        h20 = _core_hit(c_gene_2, "h20", 20, 20.0)
         mh20 = ModelHit(h20, gene_1, GeneStatus.MANDATORY)
-        h30 = CoreHit(c_gene_3, "h30", 10, "replicon_2", 30, 1.0, 30.0, 1.0, 1.0, 10, 20)
+        h30 = _core_hit(c_gene_3, "h30", 30, 30.0, replicon_name="replicon_2")
         mh30 = ModelHit(h30, gene_1, GeneStatus.ACCESSORY)
-        h50 = CoreHit(c_gene_3, "h50", 10, "replicon_2", 50, 1.0, 50.0, 1.0, 1.0, 10, 20)
+        h50 = _core_hit(c_gene_3, "h50", 50, 50.0, replicon_name="replicon_2")
         mh50 = ModelHit(h50, gene_1, GeneStatus.ACCESSORY)
 
         with self.assertRaises(MacsylibError) as ctx:
@@ -1139,23 +1178,22 @@ class TestCluster(MacsyTest):
         msg = "Cannot build a cluster from hits coming from different replicons"
         self.assertEqual(str(ctx.exception), msg)
 
+        c1 = Cluster([mh10, mh20], model_1, self.hit_weights)
+        self.assertFalse(hasattr(c1, '__dict__'))
+
 
     def test_replicon_name(self):
         model = Model("foo/T2SS", 11)
 
-        c_gene_1 = CoreGene(self.model_location, "gspD", self.profile_factory)
-        c_gene_2 = CoreGene(self.model_location, "sctC", self.profile_factory)
+        c_gene_1 = self.core_gene("gspD")
+        c_gene_2 = self.core_gene("sctC")
 
         gene_1 = ModelGene(c_gene_1, model)
         gene_2 = ModelGene(c_gene_2, model)
 
         replicon_name = "replicon_1"
-        #     CoreHit(gene, model, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        h10 = CoreHit(c_gene_1, "h10", 10, replicon_name, 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
-        mh10 = ModelHit(h10, gene_1, GeneStatus.MANDATORY)
-        h20 = CoreHit(c_gene_2, "h20", 10, replicon_name, 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
-        mh20 = ModelHit(h20, gene_2, GeneStatus.MANDATORY)
+        mh10 = _model_hit(gene_1, "h10", 10, GeneStatus.MANDATORY, replicon_name=replicon_name)
+        mh20 = _model_hit(gene_2, "h20", 20, GeneStatus.MANDATORY, replicon_name=replicon_name)
 
         c1 = Cluster([mh10, mh20], model, self.hit_weights)
         self.assertEqual(c1.replicon_name, replicon_name)
@@ -1164,18 +1202,14 @@ class TestCluster(MacsyTest):
     def test_len(self):
         model = Model("foo/T2SS", 11)
 
-        c_gene_1 = CoreGene(self.model_location, "gspD", self.profile_factory)
-        c_gene_2 = CoreGene(self.model_location, "sctC", self.profile_factory)
+        c_gene_1 = self.core_gene("gspD")
+        c_gene_2 = self.core_gene("sctC")
 
         gene_1 = ModelGene(c_gene_1, model)
         gene_2 = ModelGene(c_gene_2, model)
 
-        #     CoreHit(gene, model, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        h10 = CoreHit(c_gene_1, "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
-        mh10 = ModelHit(h10, gene_1, GeneStatus.MANDATORY)
-        h20 = CoreHit(c_gene_2, "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
-        mh20 = ModelHit(h20, gene_2, GeneStatus.MANDATORY)
+        mh10 = _model_hit(gene_1, "h10", 10, GeneStatus.MANDATORY)
+        mh20 = _model_hit(gene_2, "h20", 20, GeneStatus.MANDATORY)
 
         c1 = Cluster([mh10, mh20], model, self.hit_weights)
         self.assertEqual(len(c1), 2)
@@ -1183,19 +1217,16 @@ class TestCluster(MacsyTest):
     def test_loner(self):
         model = Model("foo/bar", 11)
 
-        c_gene_1 = CoreGene(self.model_location, "gspD", self.profile_factory)
-        c_gene_2 = CoreGene(self.model_location, "sctC", self.profile_factory)
+        c_gene_1 = self.core_gene("gspD")
+        c_gene_2 = self.core_gene("sctC")
 
         gene_1 = ModelGene(c_gene_1, model, loner=True)
         gene_2 = ModelGene(c_gene_2, model)
 
-        #     CoreHit(gene, model, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        h10 = CoreHit(c_gene_1, "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(c_gene_1, "h10", 10, 10.0)
         mh10 = ModelHit(h10, gene_1, GeneStatus.MANDATORY)
         l_h10 = Loner(h10, gene_1, GeneStatus.MANDATORY)
-        h20 = CoreHit(c_gene_2, "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
-        mh20 = ModelHit(h20, gene_2, GeneStatus.MANDATORY)
+        mh20 = _model_hit(gene_2, "h20", 20, GeneStatus.MANDATORY)
 
         c1 = Cluster([l_h10], model, self.hit_weights)
         c2 = Cluster([mh20], model, self.hit_weights)
@@ -1208,19 +1239,16 @@ class TestCluster(MacsyTest):
     def test_multi_system(self):
         model = Model("foo/bar", 11)
 
-        c_gene_1 = CoreGene(self.model_location, "gspD", self.profile_factory)
-        c_gene_2 = CoreGene(self.model_location, "sctC", self.profile_factory)
+        c_gene_1 = self.core_gene("gspD")
+        c_gene_2 = self.core_gene("sctC")
 
         gene_1 = ModelGene(c_gene_1, model, multi_system=True)
         gene_2 = ModelGene(c_gene_2, model)
 
-        #     CoreHit(gene, model, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        h10 = CoreHit(c_gene_1, "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
+        h10 = _core_hit(c_gene_1, "h10", 10, 10.0)
         mh10 = ModelHit(h10, gene_1, GeneStatus.MANDATORY)
         l_h10 = MultiSystem(h10, gene_1, GeneStatus.MANDATORY)
-        h20 = CoreHit(c_gene_2, "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
-        mh20 = ModelHit(h20, gene_2, GeneStatus.MANDATORY)
+        mh20 = _model_hit(gene_2, "h20", 20, GeneStatus.MANDATORY)
 
         c1 = Cluster([l_h10], model, self.hit_weights)
         c2 = Cluster([mh20], model, self.hit_weights)
@@ -1233,37 +1261,42 @@ class TestCluster(MacsyTest):
     def test_contains(self):
         model = Model("foo/T2SS", 11)
 
-        c_gene_1 = CoreGene(self.model_location, "gspD", self.profile_factory)
-        c_gene_2 = CoreGene(self.model_location, "sctC", self.profile_factory)
-        c_gene_3 = CoreGene(self.model_location, "sctJ", self.profile_factory)
+        c_gene_1 = self.core_gene("gspD")
+        c_gene_2 = self.core_gene("sctC")
+        c_gene_3 = self.core_gene("sctJ")
 
         gene_1 = ModelGene(c_gene_1, model)
         gene_2 = ModelGene(c_gene_2, model)
         gene_3 = ModelGene(c_gene_3, model)
 
-        #     CoreHit(gene, model, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        h10 = CoreHit(c_gene_1, "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
-        mh10 = ModelHit(h10, gene_1, GeneStatus.MANDATORY)
-        h20 = CoreHit(c_gene_2, "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
-        mh20 = ModelHit(h20, gene_2, GeneStatus.MANDATORY)
-        h30 = CoreHit(c_gene_3, "h30", 10, "replicon_1", 30, 1.0, 30.0, 1.0, 1.0, 10, 20)
-        mh30 = ModelHit(h30, gene_3, GeneStatus.ACCESSORY)
-        h50 = CoreHit(c_gene_3, "h50", 10, "replicon_1", 50, 1.0, 50.0, 1.0, 1.0, 10, 20)
-        mh50 = ModelHit(h50, gene_3, GeneStatus.ACCESSORY)
+        mh10 = _model_hit(gene_1, "h10", 10, GeneStatus.MANDATORY)
+        mh20 = _model_hit(gene_2, "h20", 20, GeneStatus.MANDATORY)
+        mh30 = _model_hit(gene_3, "h30", 30, GeneStatus.ACCESSORY)
+        mh50 = _model_hit(gene_3, "h50", 50, GeneStatus.ACCESSORY)
         c1 = Cluster([mh10, mh20, mh50], model, self.hit_weights)
 
         self.assertTrue(mh10 in c1)
         self.assertFalse(mh30 in c1)
 
+        # the membership must follow the modifications of the cluster
+        c1.replace(mh50, mh30)
+        self.assertTrue(mh30 in c1)
+        self.assertFalse(mh50 in c1)
+
+        # the hits equal to a hit of the cluster but not the same object are in the cluster too
+        self.assertTrue(ModelHit(mh10.hit, gene_1, GeneStatus.MANDATORY) in c1)
+        self.assertTrue(mh10.hit in c1)
+        model_2 = Model("foo/T3SS", 11)
+        self.assertTrue(ModelHit(mh10.hit, ModelGene(c_gene_1, model_2), GeneStatus.MANDATORY) in c1)
+
 
     def test_fulfilled_function(self):
         model = Model("foo/T2SS", 11)
 
-        c_gene_1 = CoreGene(self.model_location, "gspD", self.profile_factory)
-        c_gene_2 = CoreGene(self.model_location, "sctC", self.profile_factory)
-        c_gene_3 = CoreGene(self.model_location, "sctJ", self.profile_factory)
-        c_gene_4 = CoreGene(self.model_location, "sctJ_FLG", self.profile_factory)
+        c_gene_1 = self.core_gene("gspD")
+        c_gene_2 = self.core_gene("sctC")
+        c_gene_3 = self.core_gene("sctJ")
+        c_gene_4 = self.core_gene("sctJ_FLG")
 
         gene_1 = ModelGene(c_gene_1, model)
         gene_2 = ModelGene(c_gene_2, model)
@@ -1271,12 +1304,8 @@ class TestCluster(MacsyTest):
         gene_4 = Exchangeable(c_gene_4, gene_3)
         gene_3.add_exchangeable(gene_4)
 
-        #     CoreHit(gene, model, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        h10 = CoreHit(c_gene_1, "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
-        mh10 = ModelHit(h10, gene_1, GeneStatus.MANDATORY)
-        h20 = CoreHit(c_gene_2, "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
-        mh20 = ModelHit(h20, gene_2, GeneStatus.MANDATORY)
+        mh10 = _model_hit(gene_1, "h10", 10, GeneStatus.MANDATORY)
+        mh20 = _model_hit(gene_2, "h20", 20, GeneStatus.MANDATORY)
 
         c = Cluster([mh10, mh20], model, self.hit_weights)
 
@@ -1290,8 +1319,7 @@ class TestCluster(MacsyTest):
                             {'gspD'})
 
         # The cluster contains exchangeable
-        h50 = CoreHit(c_gene_4, "h50", 10, "replicon_1", 50, 1.0, 50.0, 1.0, 1.0, 10, 20)
-        mh50 = ModelHit(h50, gene_4, GeneStatus.ACCESSORY)
+        mh50 = _model_hit(gene_4, "h50", 50, GeneStatus.ACCESSORY)
         c = Cluster([mh10, mh50], model, self.hit_weights)
         self.assertSetEqual(c.fulfilled_function(gene_3),
                             {'sctJ'})
@@ -1299,57 +1327,52 @@ class TestCluster(MacsyTest):
 
     def test_score(self):
         model = Model("foo/T2SS", 10)
-        c_gene_gspd = CoreGene(self.model_location, "gspD", self.profile_factory)
+        c_gene_gspd = self.core_gene("gspD")
         gene_gspd = ModelGene(c_gene_gspd, model)
         model.add_mandatory_gene(gene_gspd)
 
-        c_gene_tadZ = CoreGene(self.model_location, "tadZ", self.profile_factory)
+        c_gene_tadZ = self.core_gene("tadZ")
         gene_tadZ = ModelGene(c_gene_tadZ, model)
         model.add_mandatory_gene(gene_tadZ)
 
-        c_gene_sctj = CoreGene(self.model_location, "sctC", self.profile_factory)
+        c_gene_sctj = self.core_gene("sctC")
         gene_sctj = ModelGene(c_gene_sctj, model)
 
-        c_gene_sctJ_FLG = CoreGene(self.model_location, "sctJ_FLG", self.profile_factory)
+        c_gene_sctJ_FLG = self.core_gene("sctJ_FLG")
 
         analog_sctJ_FLG = Exchangeable(c_gene_sctJ_FLG, gene_sctj)
         gene_sctj.add_exchangeable(analog_sctJ_FLG)
         model.add_accessory_gene(gene_sctj)
 
-        c_gene_sctn = CoreGene(self.model_location, "sctN", self.profile_factory)
+        c_gene_sctn = self.core_gene("sctN")
         gene_sctn = ModelGene(c_gene_sctn, model, loner=True)
-        c_gene_sctn_FLG = CoreGene(self.model_location, "sctN_FLG", self.profile_factory)
+        c_gene_sctn_FLG = self.core_gene("sctN_FLG")
         homolog_sctn_FLG = Exchangeable(c_gene_sctn_FLG, gene_sctn)
         gene_sctn.add_exchangeable(homolog_sctn_FLG)
         model.add_accessory_gene(gene_sctn)
 
-        c_gene_toto = CoreGene(self.model_location, "toto", self.profile_factory)
+        c_gene_toto = self.core_gene("toto")
         gene_toto = ModelGene(c_gene_toto, model)
         model.add_neutral_gene(gene_toto)
 
-        c_gene_flie = CoreGene(self.model_location, "fliE", self.profile_factory)
+        c_gene_flie = self.core_gene("fliE")
         gene_flie = ModelGene(c_gene_flie, model, loner=True, multi_system=True)
         model.add_mandatory_gene(gene_flie)
 
-        #     CoreHit(gene, model, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        h_gspd = CoreHit(c_gene_gspd, "h_gspd", 10, "replicon_id", 1, 1.0, 1.0, 1.0, 1.0, 10, 20)
-        mh_gspd = ModelHit(h_gspd, gene_gspd, GeneStatus.MANDATORY)
-        h_tadz = CoreHit(c_gene_tadZ, "h_tadz", 20, "replicon_id", 1, 1.0, 1.0, 1.0, 1.0, 10, 20)
-        mh_tadz = ModelHit(h_tadz, gene_tadZ, GeneStatus.MANDATORY)
-
-        h_sctj = CoreHit(c_gene_sctj, "h_sctj", 30, "replicon_id", 1, 1.0, 1.0, 1.0, 1.0, 10, 20)
-        mh_sctj = ModelHit(h_sctj, gene_sctj, GeneStatus.ACCESSORY)
-
-        h_sctn = CoreHit(c_gene_sctn, "sctn", 40, "replicon_id", 1, 1.0, 1.0, 1.0, 1.0, 10, 20)
+        mh_gspd, mh_tadz, mh_sctj, mh_sctn_hom = [
+            _model_hit(gene, hit_id, 1, status, replicon_name="replicon_id", seq_length=seq_length)
+            for gene, hit_id, seq_length, status in ((gene_gspd, "h_gspd", 10, GeneStatus.MANDATORY),
+                                                     (gene_tadZ, "h_tadz", 20, GeneStatus.MANDATORY),
+                                                     (gene_sctj, "h_sctj", 30, GeneStatus.ACCESSORY),
+                                                     (homolog_sctn_FLG, "h_scth_hom", 30, GeneStatus.ACCESSORY))
+        ]
+        h_sctn = _core_hit(c_gene_sctn, "sctn", 1, 1.0, replicon_name="replicon_id", seq_length=40)
         mh_sctn = ModelHit(h_sctn, gene_sctn, GeneStatus.ACCESSORY)
-        h_sctn_hom = CoreHit(c_gene_sctn_FLG, "h_scth_hom", 30, "replicon_id", 1, 1.0, 1.0, 1.0, 1.0, 10, 20)
-        mh_sctn_hom = ModelHit(h_sctn_hom, homolog_sctn_FLG, GeneStatus.ACCESSORY)
 
-        h_toto = CoreHit(c_gene_sctn, "toto", 50, "replicon_id", 1, 1.0, 1.0, 1.0, 1.0, 10, 20)
+        h_toto = _core_hit(c_gene_sctn, "toto", 1, 1.0, replicon_name="replicon_id", seq_length=50)
         mh_toto = ModelHit(h_toto, gene_toto, GeneStatus.NEUTRAL)
 
-        h_flie = CoreHit(c_gene_flie, "h_flie", 100, "replicon_id", 1, 1.0, 1.0, 1.0, 1.0, 10, 20)
+        h_flie = _core_hit(c_gene_flie, "h_flie", 1, 1.0, replicon_name="replicon_id", seq_length=100)
 
         l_flie = Loner(h_flie, gene_flie, GeneStatus.MANDATORY)
         ms_flie = MultiSystem(h_flie, gene_flie, GeneStatus.MANDATORY)
@@ -1406,47 +1429,50 @@ class TestCluster(MacsyTest):
     def test_merge(self):
         model = Model("foo/T2SS", 11)
 
-        c_gene_1 = CoreGene(self.model_location, "gspD", self.profile_factory)
-        c_gene_2 = CoreGene(self.model_location, "sctC", self.profile_factory)
-        c_gene_3 = CoreGene(self.model_location, "sctJ", self.profile_factory)
+        c_gene_1 = self.core_gene("gspD")
+        c_gene_2 = self.core_gene("sctC")
+        c_gene_3 = self.core_gene("sctJ")
 
         gene_1 = ModelGene(c_gene_1, model)
         gene_2 = ModelGene(c_gene_2, model)
         gene_3 = ModelGene(c_gene_3, model)
 
-        #     CoreHit(gene, model, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        h10 = CoreHit(c_gene_1, "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
-        mh10 = ModelHit(h10, gene_1, GeneStatus.MANDATORY)
-        h20 = CoreHit(c_gene_2, "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
-        mh20 = ModelHit(h20, gene_2, GeneStatus.MANDATORY)
-        h30 = CoreHit(c_gene_3, "h30", 10, "replicon_1", 30, 1.0, 30.0, 1.0, 1.0, 10, 20)
-        mh30 = ModelHit(h30, gene_3, GeneStatus.ACCESSORY)
-        h50 = CoreHit(c_gene_3, "h50", 10, "replicon_1", 50, 1.0, 50.0, 1.0, 1.0, 10, 20)
-        mh50 = ModelHit(h50, gene_3, GeneStatus.ACCESSORY)
+        mh10 = _model_hit(gene_1, "h10", 10, GeneStatus.MANDATORY)
+        mh20 = _model_hit(gene_2, "h20", 20, GeneStatus.MANDATORY)
+        mh30 = _model_hit(gene_3, "h30", 30, GeneStatus.ACCESSORY)
+        mh50 = _model_hit(gene_3, "h50", 50, GeneStatus.ACCESSORY)
 
         c1 = Cluster([mh10, mh20], model, self.hit_weights)
         c2 = Cluster([mh30, mh50], model, self.hit_weights)
         c1.merge(c2)
-        self.assertListEqual(c1.hits, [mh10, mh20, mh30, mh50])
+        self.assertSameHits(c1.hits, [mh10, mh20, mh30, mh50])
 
         c1 = Cluster([mh10, mh20], model, self.hit_weights)
         c2 = Cluster([mh30, mh50], model, self.hit_weights)
         c2.merge(c1)
-        self.assertListEqual(c2.hits, [mh30, mh50, mh10, mh20])
+        self.assertSameHits(c2.hits, [mh30, mh50, mh10, mh20])
 
         c1 = Cluster([mh10, mh20], model, self.hit_weights)
         c2 = Cluster([mh30, mh50], model, self.hit_weights)
         c1.merge(c2, before=True)
-        self.assertListEqual(c1.hits, [mh30, mh50, mh10, mh20])
+        self.assertSameHits(c1.hits, [mh30, mh50, mh10, mh20])
+
+        # the score and functions computed before the merge must not be kept
+        c1 = Cluster([mh10, mh20], model, self.hit_weights)
+        c2 = Cluster([mh30, mh50], model, self.hit_weights)
+        self.assertEqual(c1.score, 2)
+        self.assertSetEqual(c1.functions, {'gspD', 'sctC'})
+        c1.merge(c2)
+        self.assertEqual(c1.score, 2.5)
+        self.assertSetEqual(c1.functions, {'gspD', 'sctC', 'sctJ'})
 
         model_2 = Model("foo/T3SS", 11)
-        c_gene_3 = CoreGene(self.model_location, "sctJ", self.profile_factory)
+        c_gene_3 = self.core_gene("sctJ")
         gene_3 = ModelGene(c_gene_3, model)
 
-        h30 = CoreHit(c_gene_3, "h30", 10, "replicon_2", 30, 1.0, 30.0, 1.0, 1.0, 10, 20)
+        h30 = _core_hit(c_gene_3, "h30", 30, 30.0, replicon_name="replicon_2")
         mh30 = ModelHit(h30, gene_3, GeneStatus.ACCESSORY)
-        h50 = CoreHit(c_gene_3, "h50", 10, "replicon_2", 50, 1.0, 50.0, 1.0, 1.0, 10, 20)
+        h50 = _core_hit(c_gene_3, "h50", 50, 50.0, replicon_name="replicon_2")
         mh50 = ModelHit(h50, gene_3, GeneStatus.ACCESSORY)
         c3 = Cluster([mh30, mh50], model_2, self.hit_weights)
         with self.assertRaises(MacsylibError) as ctx:
@@ -1457,18 +1483,14 @@ class TestCluster(MacsyTest):
     def test_str(self):
         model = Model("foo/T2SS", 11)
 
-        c_gene_1 = CoreGene(self.model_location, "gspD", self.profile_factory)
-        c_gene_2 = CoreGene(self.model_location, "sctC", self.profile_factory)
+        c_gene_1 = self.core_gene("gspD")
+        c_gene_2 = self.core_gene("sctC")
 
         gene_1 = ModelGene(c_gene_1, model)
         gene_2 = ModelGene(c_gene_2, model)
 
-        #     CoreHit(gene, model, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        h10 = CoreHit(c_gene_1, "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
-        mh10 = ModelHit(h10, gene_1, GeneStatus.MANDATORY)
-        h20 = CoreHit(c_gene_2, "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
-        mh20 = ModelHit(h20, gene_2, GeneStatus.MANDATORY)
+        mh10 = _model_hit(gene_1, "h10", 10, GeneStatus.MANDATORY)
+        mh20 = _model_hit(gene_2, "h20", 20, GeneStatus.MANDATORY)
         c1 = Cluster([mh10, mh20], model, self.hit_weights)
         s ="""Cluster:
 - model = T2SS
@@ -1480,26 +1502,39 @@ class TestCluster(MacsyTest):
     def test_replace(self):
         model = Model("foo/T2SS", 11)
 
-        c_gene_1 = CoreGene(self.model_location, "gspD", self.profile_factory)
-        c_gene_2 = CoreGene(self.model_location, "sctC", self.profile_factory)
-        c_gene_3 = CoreGene(self.model_location, "sctJ", self.profile_factory)
+        c_gene_1 = self.core_gene("gspD")
+        c_gene_2 = self.core_gene("sctC")
+        c_gene_3 = self.core_gene("sctJ")
 
         gene_1 = ModelGene(c_gene_1, model)
         gene_2 = ModelGene(c_gene_2, model)
         gene_3 = ModelGene(c_gene_3, model)
 
-        #     CoreHit(gene, model, hit_id, hit_seq_length, replicon_name, position, i_eval, score,
-        #         profile_coverage, sequence_coverage, begin_match, end_match
-        h10 = CoreHit(c_gene_1, "h10", 10, "replicon_1", 10, 1.0, 10.0, 1.0, 1.0, 10, 20)
-        h20 = CoreHit(c_gene_2, "h20", 10, "replicon_1", 20, 1.0, 20.0, 1.0, 1.0, 10, 20)
-        h30 = CoreHit(c_gene_3, "h30", 10, "replicon_1", 30, 1.0, 30.0, 1.0, 1.0, 10, 20)
-        h50 = CoreHit(c_gene_3, "h50", 10, "replicon_1", 50, 1.0, 50.0, 1.0, 1.0, 10, 20)
-        mh10 = ModelHit(h10, gene_1, GeneStatus.MANDATORY)
-        mh20 = ModelHit(h20, gene_2, GeneStatus.MANDATORY)
-        mh30 = ModelHit(h30, gene_3, GeneStatus.ACCESSORY)
-        mh50 = ModelHit(h50, gene_3, GeneStatus.ACCESSORY)
+        mh10 = _model_hit(gene_1, "h10", 10, GeneStatus.MANDATORY)
+        mh20 = _model_hit(gene_2, "h20", 20, GeneStatus.MANDATORY)
+        mh30 = _model_hit(gene_3, "h30", 30, GeneStatus.ACCESSORY)
+        mh50 = _model_hit(gene_3, "h50", 50, GeneStatus.ACCESSORY)
 
         c1 = Cluster([mh10, mh20, mh30], model, self.hit_weights)
+        self.assertEqual(c1.score, 2.5)
         c1.replace(mh20, mh50)
-        self.assertEqual(c1.hits,
-                         [mh10, mh50, mh30])
+        self.assertSameHits(c1.hits, [mh10, mh50, mh30])
+        # the score computed before the replacement must not be kept
+        self.assertEqual(c1.score, 1.5)
+        self.assertSetEqual(c1.functions, {'gspD', 'sctJ'})
+
+        # an hit equal to an hit of the cluster but not the same object can be replaced too
+        mh30_neutral = ModelHit(mh30.hit, gene_3, GeneStatus.NEUTRAL)
+        self.assertIsNot(mh30_neutral, mh30)
+        c1.replace(mh30_neutral, mh20)
+        self.assertSameHits(c1.hits, [mh10, mh50, mh20])
+
+        with self.assertRaises(ValueError):
+            c1.replace(mh30, mh20)
+
+        # the hit itself is replaced, not the first hit equal to it
+        mh10_bis = ModelHit(mh10.hit, gene_1, GeneStatus.MANDATORY)
+        c2 = Cluster([mh10, mh10_bis], model, self.hit_weights)
+        c2.replace(mh10_bis, mh20)
+        self.assertIs(c2.hits[0], mh10)
+        self.assertIs(c2.hits[1], mh20)
@@ -142,6 +142,15 @@ class CoreHitTest(MacsyTest):
         self.assertNotEqual(hash(h0), hash(h2))
 
 
+    def test_slots(self):
+        gene = CoreGene(self.model_location, "gspD", self.profile_factory)
+        h0 = CoreHit(gene, "PSAE001c01_006940", 803, "PSAE001c01", 3450, float(1.2e-234), float(779.2),
+                     float(1.000000), (741.0 - 104.0 + 1) / 803, 104, 741)
+        self.assertFalse(hasattr(h0, '__dict__'))
+        with self.assertRaises(AttributeError):
+            h0.nimportnaoik = 1
+
+
 class ModelHitTest(MacsyTest):
 
     def setUp(self) -> None:
@@ -247,6 +256,12 @@ class ModelHitTest(MacsyTest):
         mhit_2 = ModelHit(self.chit_2, self.mg_gspd, GeneStatus.MANDATORY)
         self.assertFalse(mhit_2.loner)
 
+    def test_slots(self):
+        mhit_1 = ModelHit(self.chit_1, self.mg_gspd, GeneStatus.MANDATORY)
+        self.assertFalse(hasattr(mhit_1, '__dict__'))
+        loner = Loner(self.chit_2, gene_ref=self.mg_sctj, gene_status=GeneStatus.ACCESSORY)
+        self.assertFalse(hasattr(loner, '__dict__'))
+
 
 class LonerTest(MacsyTest):
 
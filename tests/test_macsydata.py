@@ -33,6 +33,8 @@ import tarfile
 import unittest
 import io
 import shlex
+import contextlib
+from unittest import mock
 from collections import namedtuple
 
 import yaml
@@ -40,7 +42,7 @@ import macsylib.registries
 from macsylib.registries import scan_models_dir, ModelRegistry
 from macsylib import model_package
 
-from tests import MacsyTest
+from tests import MacsyTest, link_file
 from macsylib.scripts import macsydata
 from macsylib.error import MacsydataError, MacsyDataLimitError
 import warnings
@@ -51,21 +53,18 @@ except ModuleNotFoundError:
     git = None
 
 
-class TestMacsydata(MacsyTest):
+# do_init_package call localtime to get year
+# and put it in copyright filed of metadata
+# so the init tests mock it to get reliable year
+# otherwise I have to adapt the tests each new year ;-(
+FakeTime = namedtuple('FakeTime', ['tm_year'])
 
-    def setUp(self):
-        self._tmpdir = tempfile.TemporaryDirectory(prefix='test_msl_macsydata_')
-        self.tmpdir = self._tmpdir.name
-        self.models_dir = [os.path.join(self.tmpdir, 'models')]
-        os.mkdir(self.models_dir[0])
 
-        self.args = argparse.Namespace()
-        self.args.org = 'foo'
-        self.args.package_name = 'macsylib'
-        self._remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        macsydata._log = macsydata.init_logger(20)  # 20 logging.INFO
-        self.definition_1 = """<model inter_gene_max_space="20" min_mandatory_genes_required="1" min_genes_required="2" vers="2.0">
+class TestMacsydata(MacsyTest):
+
+    # the definitions of the fake packages, the same for all tests
+    # they are written as bytes to skip the encoding at each package creation
+    definition_1 = """<model inter_gene_max_space="20" min_mandatory_genes_required="1" min_genes_required="2" vers="2.0">
     <gene name="flgB" presence="mandatory"/>
     <gene name="flgC" presence="mandatory" inter_gene_max_space="2">
         <exchangeables>
@@ -73,27 +72,146 @@ class TestMacsydata(MacsyTest):
         </exchangeables>
     </gene>
 </model>"""
-        self.definition_2 = """<model inter_gene_max_space="20" min_mandatory_genes_required="1" min_genes_required="2" vers="2.0">
+    definition_2 = """<model inter_gene_max_space="20" min_mandatory_genes_required="1" min_genes_required="2" vers="2.0">
     <gene name="fliE" presence="mandatory" multi_system="True"/>
     <gene name="tadZ" presence="accessory" loner="True"/>
     <gene name="sctC" presence="forbidden"/>
 </model>"""
+    _definition_1_bytes = definition_1.encode()
+    _definition_2_bytes = definition_2.encode()
+    _readme_bytes = b"# This a README\n"
+    _license_bytes = b"# This the License\n"
+
+    # the expected outputs of the msl_data commands which do not depend on the test
+    expected_info = """fake_pack (0.0b2)
+
+maintainer: auth_name <auth_name@mondomain.fr>
+
+this is a short description of the repos
+
+how to cite:
+\t- bla bla
+\t- link to publication
+\t- ligne 1
+\t  ligne 2
+\t  ligne 3 et bbbbb
+
+documentation
+\thttp://link/to/the/documentation
+
+This data are released under CC BY-NC-SA 4.0 (https://creativecommons.org/licenses/by-nc-sa/4.0/)
+copyright: 2019, Institut Pasteur, CNRS"""
+    expected_citation = """To cite fake_pack:
+
+_ bla bla
+- link to publication
+- ligne 1
+  ligne 2
+  ligne 3 et bbbbb
+
+To cite MacSyLib:
+
+- Néron, Bertrand; Denise, Rémi; Coluzzi, Charles; Touchon, Marie; Rocha, Eduardo P.C.; Abby, Sophie S.
+  MacSyFinder v2: Improved modelling and search engine to identify molecular systems in genomes.
+  Peer Community Journal, Volume 3 (2023), article no. e28. doi : 10.24072/pcjournal.250.
+  https://peercommunityjournal.org/articles/10.24072/pcjournal.250/"""
+    expected_check = """If everyone were like you, I'd be out of business
+To push the models in organization:
+\tcd {pack_dir}
+Transform the models into a git repository
+\tgit init .
+\tgit add .
+\tgit commit -m 'initial commit'
+add a remote repository to host the models
+for instance if you want to add the models to 'macsy-models'
+\tgit remote add origin https://github.com/macsy-models/
+\tgit tag -a <tag vers>  # check https://macsylib.readthedocs.io/en/latest/modeler_guide/publish_package.html#sharing-your-models
+\tgit push origin <tag vers>"""
+    expected_check_warnings = """The model package 'fake_1' have not any LICENSE file. May be you have not right to use it.
+The model package 'fake_1' have not any README file.
+The field 'vers' is not required anymore.
+  It will be ignored and set by macsydata during installation phase according to the git tag.
+
+msl_data says: You're only giving me a partial QA payment?
+I'll take it this time, but I'm not happy.
+I'll be really happy, if you fix warnings above, before to publish these models."""
+    expected_check_errors = """The model package 'fake_1' have no 'definitions' directory.
+The model package 'fake_1' have no 'profiles' directory.
+Please fix issues above, before publishing these models."""
+
+    # the log of do_install which depend only on the package and where it is installed
+    expected_already_installed = """Requirement already satisfied: {requirement} in {pack_path}.
+To force installation use option -f --force-reinstall."""
+    expected_installed = """Extracting {name} ({vers}).
+Installing {name} ({vers}) in {dest}
+Cleaning.
+The models {name} ({vers}) have been installed successfully."""
+
+    # the files generated by do_init_package which are compared to the reference ones
+    init_files = ('README.md', 'metadata.yml', 'model_conf.xml', os.path.join('definitions', 'model_example.xml'))
+
+    # the metadata of the package 'FOO' of the remote index used by the search tests
+    search_metadata = {'vers': '0.1', 'short_desc': 'this is a foo desc_pattern'}
+
+    @classmethod
+    def setUpClass(cls):
+        # the fake packages are built from the same metadata and profiles
+        # read and serialize the metadata (with and without version) once for all tests
+        with open(cls.find_data('pack_metadata', 'good_metadata.yml')) as meta_file:
+            good_metadata = yaml.safe_load(meta_file)
+        cls.good_metadata_yml = {
+            True: yaml.dump(good_metadata, allow_unicode=True, indent=2),
+            False: yaml.dump({**good_metadata, 'vers': None}, allow_unicode=True, indent=2)
+        }
+        cls.profiles_dir = cls.find_data('models', 'foo', 'profiles')
+        # each test works in its own directory inside this one
+        # all of them are removed at once at the end of the class
+        cls._tmp_root = tempfile.TemporaryDirectory(prefix='test_msl_macsydata_')
+        # no test must reach the network,
+        # the tests which need another behavior patch remote_exists themselves
+        remote_exists = mock.patch.object(macsydata.RemoteModelIndex, 'remote_exists', lambda x: True)
+        remote_exists.start()
+        cls.addClassCleanup(remote_exists.stop)
+        # the handler of the msl_data logger is set once for all tests
+        cls._log = macsydata.init_logger(20)  # 20 logging.INFO
+        cls._log_handlers = cls._log.handlers[:]
+        # the fake archives written by _write_fake_archive, {(pack_name, metadata): gzipped tar}
+        cls._archives = {}
+        # the fake packages templates built by create_fake_package, {options: path}
+        cls._templates = {}
+        # the content of the reference files of the init tests, {pack_name: {file_name: content}}
+        cls._init_refs = {}
+        # the parser tests only parse command lines, they share one parser
+        cls._parser = macsydata.build_arg_parser(macsydata._cmde_line_header(), 'msl_data version message',
+                                                 package_name='macsylib', tool_name='msl_data')
+
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp_root.cleanup()
+        for handler in cls._log_handlers:
+            cls._log.removeHandler(handler)
+
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp(dir=self._tmp_root.name)
+        self.models_dir = [os.path.join(self.tmpdir, 'models')]
+        os.mkdir(self.models_dir[0])
+
+        self.args = argparse.Namespace(org='foo', package_name='macsylib')
+        self._log.setLevel(20)
+        macsydata._log = self._log
 
 
     def tearDown(self):
-        macsydata.RemoteModelIndex.remote_exists = self._remote_exists
-        self._tmpdir.cleanup()
         # some function in macsydata script suppress the traceback
         # but without traceback it's hard to debug test :-(
         sys.tracebacklimit = 1000  # the default value
 
         # at each call of macsydata.main
         # init_logger is called and new handler is add
-        # remove them
-        logger = macsydata._log
-        if logger:
-            for handler in logger.handlers[:]:
-                logger.removeHandler(handler)
+        # get back the handlers set in setUpClass
+        self._log.handlers = self._log_handlers[:]
 
 
     def create_fake_package(self, model,
@@ -106,101 +224,287 @@ class TestMacsydata(MacsyTest):
                             dest='',
                             complex=False):
         pack_path = os.path.join(self.tmpdir, dest, model)
+        # the content of a fake package does not depend on its name or location
+        # so each variant is built once in a template and the packages are hard linked on it
+        options = (definitions, profiles, metadata, bool(vers), readme, license, complex)
+        template = self._templates.get(options)
+        if template is None:
+            template = os.path.join(self._tmp_root.name, 'templates', str(len(self._templates)))
+            self._build_fake_package(template, *options)
+            self._templates[options] = template
+        shutil.copytree(template, pack_path, copy_function=link_file)
+        return pack_path
+
+    def _build_fake_package(self, pack_path, definitions, profiles, metadata, vers, readme, license, complex):
         os.makedirs(pack_path)
         if definitions:
             def_dir = os.path.join(pack_path, 'definitions')
-            os.mkdir(def_dir)
             sub_fam_1 = os.path.join(def_dir, 'sub_fam_1')
-            os.mkdir(sub_fam_1)
             sub_fam_2 = os.path.join(def_dir, 'sub_fam_2')
-            os.mkdir(sub_fam_2)
-            with open(os.path.join(sub_fam_1, "model_1.xml"), 'w') as f:
-                f.write(self.definition_1)
-            with open(os.path.join(sub_fam_2, "model_2.xml"), 'w') as f:
-                f.write(self.definition_2)
+            for sub_fam in (sub_fam_1, sub_fam_2):
+                os.makedirs(sub_fam)
+            with open(os.path.join(sub_fam_1, "model_1.xml"), 'wb') as f:
+                f.write(self._definition_1_bytes)
+            with open(os.path.join(sub_fam_2, "model_2.xml"), 'wb') as f:
+                f.write(self._definition_2_bytes)
             if complex:
-                with open(os.path.join(sub_fam_1, "model_1_2.xml"), 'w') as f:
-                    f.write(self.definition_1)
-                with open(os.path.join(sub_fam_2, "model_2_2.xml"), 'w') as f:
-                    f.write(self.definition_2)
+                with open(os.path.join(sub_fam_1, "model_1_2.xml"), 'wb') as f:
+                    f.write(self._definition_1_bytes)
+                with open(os.path.join(sub_fam_2, "model_2_2.xml"), 'wb') as f:
+                    f.write(self._definition_2_bytes)
 
         if profiles:
             profile_dir = os.path.join(pack_path, 'profiles')
             os.mkdir(profile_dir)
             for name in ('flgB', 'flgC', 'fliE', 'tadZ', 'sctC', 'abc'):
-                shutil.copyfile(self.find_data('models', 'foo', 'profiles', f'{name}.hmm'),
-                                os.path.join(profile_dir, f"{name}.hmm")
-                                )
+                link_file(os.path.join(self.profiles_dir, f'{name}.hmm'),
+                          os.path.join(profile_dir, f"{name}.hmm")
+                          )
         if metadata:
-            meta_path = self.find_data('pack_metadata', 'good_metadata.yml')
             meta_dest = os.path.join(pack_path, model_package.Metadata.name)
-            with open(meta_path) as meta_file:
-                meta = yaml.safe_load(meta_file)
-            if not vers:
-                meta['vers'] = None
             with open(meta_dest, 'w') as meta_file:
-                yaml.dump(meta, meta_file, allow_unicode=True, indent=2)
+                meta_file.write(self.good_metadata_yml[vers])
         if readme:
-            with open(os.path.join(pack_path, "README"), 'w') as f:
-                f.write("# This a README\n")
+            with open(os.path.join(pack_path, "README"), 'wb') as f:
+                f.write(self._readme_bytes)
         if license:
-            with open(os.path.join(pack_path, "LICENSE"), 'w') as f:
-                f.write("# This the License\n")
-        return pack_path
+            with open(os.path.join(pack_path, "LICENSE"), 'wb') as f:
+                f.write(self._license_bytes)
+
+    def _fake_archive(self, pack_name, metadata=True):
+        """
+        build in memory the gzipped tar of a fake package
+        with the same content as the one created by create_fake_package with the default options
+
+        :param pack_name: the name of the package, it is also the root directory of the archive
+        :param metadata: False to build a package without metadata file
+        :return: the content of the archive
+        :rtype: bytes
+        """
+        members = [
+            ('definitions', None),
+            ('definitions/sub_fam_1', None),
+            ('definitions/sub_fam_1/model_1.xml', self._definition_1_bytes),
+            ('definitions/sub_fam_2', None),
+            ('definitions/sub_fam_2/model_2.xml', self._definition_2_bytes),
+            ('profiles', None)
+        ]
+        for name in ('flgB', 'flgC', 'fliE', 'tadZ', 'sctC', 'abc'):
+            with open(os.path.join(self.profiles_dir, f'{name}.hmm'), 'rb') as profile:
+                members.append((f'profiles/{name}.hmm', profile.read()))
+        if metadata:
+            members.append((model_package.Metadata.name, self.good_metadata_yml[True].encode()))
+        members.extend([
+            ('README', self._readme_bytes),
+            ('LICENSE', self._license_bytes)
+        ])
+        arch = io.BytesIO()
+        # RemoteModelIndex.unarchive_package opens the archive in 'r:gz' mode so it must be gzipped
+        # but the size of the archive does not matter, so store the data without compression
+        with tarfile.open(fileobj=arch, mode="w:gz", compresslevel=0) as tar:
+            # the first member must be the root directory of the package
+            for name, content in [(None, None)] + members:
+                info = tarfile.TarInfo(pack_name if name is None else f'{pack_name}/{name}')
+                if content is None:
+                    info.type = tarfile.DIRTYPE
+                    info.mode = 0o755
+                    tar.addfile(info)
+                else:
+                    info.size = len(content)
+                    info.mode = 0o644
+                    tar.addfile(info, io.BytesIO(content))
+        return arch.getvalue()
+
+    def _write_fake_archive(self, pack_name, vers, metadata=True):
+        """
+        write the archive of a fake package in the tmp directory of the test
+
+        :param pack_name: the name of the package
+        :param vers: the version of the package, it is part of the archive name
+        :param metadata: False to archive a package without metadata file
+        :return: the path of the archive
+        """
+        # the content of the archive depends only on the package name and the metadata option
+        # so each archive is built once and written again for the other tests
+        key = (pack_name, metadata)
+        if key not in self._archives:
+            self._archives[key] = self._fake_archive(pack_name, metadata=metadata)
+        arch_dir = os.path.join(self.tmpdir, 'tmp')
+        os.makedirs(arch_dir, exist_ok=True)
+        arch_path = f"{os.path.join(arch_dir, pack_name)}-{vers}.tar.gz"
+        with open(arch_path, 'wb') as arch_file:
+            arch_file.write(self._archives[key])
+        return arch_path
+
+    def _mk_args(self, **kwargs):
+        """
+        :param kwargs: the options of the install command which differ from the defaults
+        :return: the arguments of the install command
+        """
+        defaults = dict(org='foo', package_name='macsylib',
+                        user=False, upgrade=False, force=False, no_clean=False, target=None)
+        defaults.update(kwargs)
+        return argparse.Namespace(**defaults)
+
+    def _mk_init_args(self, **kwargs):
+        """
+        :param kwargs: the options of the init command which differ from the defaults
+        :return: the arguments of the init command for the package 'init_pack' in the models directory of the test
+        """
+        defaults = dict(org='foo', package_name='macsylib',
+                        model_package='init_pack',
+                        maintainer='John Doe',
+                        email='john.doe@domain.org',
+                        authors='Jim Doe, John Doe',
+                        license='cc-by-nc-sa',
+                        holders='Pasteur',
+                        desc='description in one line of this package',
+                        models_dir=self.models_dir[0],
+                        no_clean=False)
+        defaults.update(kwargs)
+        return argparse.Namespace(**defaults)
+
+    def _std_dirs(self):
+        """
+        create the cache and tmp directories used by do_install in the test directory
+
+        :return: the paths of the cache, tmp, models and target directories.
+                 The models directory is created by setUp,
+                 the target directory is left to the test (do_install creates it)
+        """
+        dirs = {name: os.path.join(self.tmpdir, name) for name in ('cache', 'tmp', 'models', 'target')}
+        for name in ('cache', 'tmp'):
+            os.mkdir(dirs[name])
+        return dirs
 
     def _fake_download(self, pack_name, vers, dest=None):
-        unarch_pack_path = self.create_fake_package(pack_name, dest='tmp')
-        arch_path = f"{os.path.join(self.tmpdir, 'tmp', pack_name)}-{vers}.tar.gz"
-        with tarfile.open(arch_path, "w:gz") as arch:
-            arch.add(unarch_pack_path, arcname=pack_name)
-        shutil.rmtree(unarch_pack_path)
-        return arch_path
+        return self._write_fake_archive(pack_name, vers)
+
+    @contextlib.contextmanager
+    def _mock_remote(self, versions, download=None):
+        """
+        mock the functions of macsydata which do net operations
+        (RemoteModelIndex.remote_exists is already mocked for the whole class)
+        and install the packages in the models directory of the test
+
+        :param versions: the available versions of the remote package
+        :param download: the replacement of RemoteModelIndex.download, by default :meth:`_fake_download`
+        """
+        with mock.patch.object(macsydata, '_get_remote_available_versions', lambda p_nam, org: versions), \
+                mock.patch.object(macsydata.RemoteModelIndex, 'download', download or self._fake_download), \
+                mock.patch.object(macsydata.Config, 'models_dir', lambda x: self.models_dir):
+            yield
+
+    def _mock_search(self, versions, metadata=None, **kwargs):
+        """
+        mock the functions of RemoteModelIndex which do net operations during a search
+        the remote index contains only one package 'FOO'
+
+        :param versions: the available versions of the package
+        :param metadata: the metadata of the package, by default :attr:`search_metadata`
+        :param kwargs: the other methods of RemoteModelIndex to mock
+        """
+        metadata = self.search_metadata if metadata is None else metadata
+        return mock.patch.multiple(macsydata.RemoteModelIndex,
+                                   list_packages=lambda x: ['FOO'],
+                                   list_package_vers=lambda x, pack_nam: versions,
+                                   get_metadata=lambda x, pack_nam: metadata,
+                                   **kwargs)
+
+    def _models_registry(self, *pack_names):
+        """
+        create the fake packages in the models directory
+        and register them in one scan of this directory
+
+        :param pack_names: the names of the packages to create
+        :return: the registry of the fake packages
+        :rtype: :class:`macsylib.registries.ModelRegistry`
+        """
+        for name in pack_names:
+            self.create_fake_package(name, dest=self.models_dir[0])
+        registry = ModelRegistry()
+        for model_loc in scan_models_dir(self.models_dir[0]):
+            registry.add(model_loc)
+        return registry
+
+    def assertInstalledPackage(self, pack_path):
+        """
+        check that the package is installed in pack_path
+        the entries of the package are read in one directory scan
+
+        :param pack_path: the path where the package should be installed
+        """
+        self.assertTrue(os.path.isdir(pack_path), f"{pack_path} is not a directory")
+        with os.scandir(pack_path) as it:
+            entries = {entry.name: entry for entry in it}
+        for name in ('metadata.yml', 'README'):
+            self.assertIn(name, entries)
+            self.assertTrue(entries[name].is_file())
+        for name in ('definitions', 'profiles'):
+            self.assertIn(name, entries)
+            self.assertTrue(entries[name].is_dir())
+
+    def assertInitPackage(self, pack_name):
+        """
+        check that the files generated by do_init_package in the models directory of the test
+        are the same as the reference ones
+
+        :param pack_name: the name of the package, it is also the name of the reference data directory
+        """
+        # several tests generate the same package, so the reference files are read once
+        if pack_name not in self._init_refs:
+            refs = {}
+            for f_name in self.init_files:
+                with open(self.find_data(pack_name, f_name)) as ref_file:
+                    refs[f_name] = ref_file.read()
+            self._init_refs[pack_name] = refs
+        for f_name, expected in self._init_refs[pack_name].items():
+            with self.subTest(file_name=f_name):
+                got_file = os.path.join(self.models_dir[0], pack_name, f_name)
+                with open(got_file) as got:
+                    if got.read() != expected:
+                        # compare line by line to get a readable report
+                        self.assertFileEqual(self.find_data(pack_name, f_name), got_file)
+
+    def _capture_stdout(self, command, args):
+        """
+        run a msl_data command and catch what it displays
+
+        :param command: the msl_data command to run (do_list, do_info, ...)
+        :param args: the parsed arguments passed to the command
+        :return: the standard output of the command without leading and trailing whitespaces
+        :rtype: str
+        """
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            command(args)
+        return out.getvalue().strip()
 
 
     def test_available(self):
-        list_pack = macsydata.RemoteModelIndex.list_packages
-        list_pack_vers = macsydata.RemoteModelIndex.list_package_vers
-        meta = macsydata.RemoteModelIndex.get_metadata
         pack_name = 'fake_model'
         pack_vers = '1.0'
         pack_meta = {'short_desc': 'desc about fake_model'}
-        macsydata.RemoteModelIndex.list_packages = lambda x: [pack_name]
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, pack: [pack_vers]
-        macsydata.RemoteModelIndex.get_metadata = lambda x, pack, vers: pack_meta
         self.create_fake_package('fake_model')
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_available(self.args)
-                get_pack = sys.stdout.getvalue().strip()
-            pack_name_vers = f"{pack_name} ({pack_vers})"
-            # use same formatting as in do_available
-            expected_pack = f"{pack_name_vers:26.25} - {pack_meta['short_desc']}"
-            self.assertEqual(get_pack, expected_pack)
-        finally:
-            macsydata.RemoteModelIndex.list_packages = list_pack
-            macsydata.RemoteModelIndex.list_package_vers = list_pack_vers
-            macsydata.RemoteModelIndex.get_metadata = meta
+        with mock.patch.object(macsydata.RemoteModelIndex, 'list_packages', lambda x: [pack_name]), \
+                mock.patch.object(macsydata.RemoteModelIndex, 'list_package_vers', lambda x, pack: [pack_vers]), \
+                mock.patch.object(macsydata.RemoteModelIndex, 'get_metadata', lambda x, pack, vers: pack_meta):
+            get_pack = self._capture_stdout(macsydata.do_available, self.args)
+        pack_name_vers = f"{pack_name} ({pack_vers})"
+        # use same formatting as in do_available
+        expected_pack = f"{pack_name_vers:26.25} - {pack_meta['short_desc']}"
+        self.assertEqual(get_pack, expected_pack)
 
         # test package with no version available
         # no version = no tags
-        list_pack = macsydata.RemoteModelIndex.list_packages
-        list_pack_vers = macsydata.RemoteModelIndex.list_package_vers
-        meta = macsydata.RemoteModelIndex.get_metadata
         pack_name = 'fake_model_no_vers'
         pack_meta = {'short_desc': 'desc about fake_model'}
-        macsydata.RemoteModelIndex.list_packages = lambda x: [pack_name]
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, pack: []
-        macsydata.RemoteModelIndex.get_metadata = lambda x, pack, vers: pack_meta
         self.create_fake_package('fake_model_no_vers')
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_available(self.args)
-                get_pack = sys.stdout.getvalue().strip()
-            self.assertEqual(get_pack, '')
-        finally:
-            macsydata.RemoteModelIndex.list_packages = list_pack
-            macsydata.RemoteModelIndex.list_package_vers = list_pack_vers
-            macsydata.RemoteModelIndex.get_metadata = meta
+        with mock.patch.object(macsydata.RemoteModelIndex, 'list_packages', lambda x: [pack_name]), \
+                mock.patch.object(macsydata.RemoteModelIndex, 'list_package_vers', lambda x, pack: []), \
+                mock.patch.object(macsydata.RemoteModelIndex, 'get_metadata', lambda x, pack, vers: pack_meta):
+            get_pack = self._capture_stdout(macsydata.do_available, self.args)
+        self.assertEqual(get_pack, '')
 
 
     def test_info(self):
@@ -223,183 +527,50 @@ class TestMacsydata(MacsyTest):
         def fake_find_installed_package(model_pack_name, models_dir=None, package_name='macsylib'):
             return macsydata.ModelPackage(fake_pack_path)
 
-        find_local_package = macsydata._find_installed_package
-        macsydata._find_installed_package = fake_find_installed_package
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_info(self.args)
-                msg = sys.stdout.getvalue().strip()
-        finally:
-            macsydata._find_installed_package = find_local_package
-
-        expected_info = """fake_pack (0.0b2)
+        with mock.patch.object(macsydata, '_find_installed_package', fake_find_installed_package):
+            msg = self._capture_stdout(macsydata.do_info, self.args)
 
-maintainer: auth_name <auth_name@mondomain.fr>
-
-this is a short description of the repos
-
-how to cite:
-\t- bla bla
-\t- link to publication
-\t- ligne 1
-\t  ligne 2
-\t  ligne 3 et bbbbb
-
-documentation
-\thttp://link/to/the/documentation
-
-This data are released under CC BY-NC-SA 4.0 (https://creativecommons.org/licenses/by-nc-sa/4.0/)
-copyright: 2019, Institut Pasteur, CNRS"""
-        self.assertEqual(expected_info, msg)
+        self.assertEqual(self.expected_info, msg)
 
 
     def test_list(self):
         fake_packs = ('fake_1', 'fake_2')
-        for name in fake_packs:
-            self.create_fake_package(name, dest=self.models_dir[0])
-        registry = ModelRegistry()
-        for model_loc in scan_models_dir(self.models_dir[0]):
-            registry.add(model_loc)
-
-        def fake_find_all_installed_package(models_dir=None, package_name='macsylib'):
-            return registry
-
-        find_all_packages = macsydata._find_all_installed_packages
-        macsydata._find_all_installed_packages = fake_find_all_installed_package
-
-        self.args.verbose = 1
-        self.args.outdated = False
-        self.args.uptodate = False
-        self.args.models_dir = None
-        self.args.long = False
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_list(self.args)
-                packs = sys.stdout.getvalue().strip()
-        finally:
-            macsydata._find_all_installed_packages = find_all_packages
-        expected_output = "fake_1-0.0b2\nfake_2-0.0b2"
-        self.assertEqual(packs,
-                         expected_output)
-
-
-    def test_list_long(self):
-        fake_packs = ('fake_1', 'fake_2')
-        for name in fake_packs:
-            self.create_fake_package(name, dest=self.models_dir[0])
-        model_dir = self.tmpdir
-        registry = ModelRegistry()
-        for model_loc in scan_models_dir(self.models_dir[0]):
-            registry.add(model_loc)
-
-        def fake_find_all_installed_package(models_dir=None, package_name='macsylib'):
-            return registry
-
-        find_all_packages = macsydata._find_all_installed_packages
-        macsydata._find_all_installed_packages = fake_find_all_installed_package
-
-        self.args.verbose = 1
-        self.args.outdated = False
-        self.args.uptodate = False
-        self.args.models_dir = None
-        self.args.long = True
-
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_list(self.args)
-                packs = sys.stdout.getvalue().strip()
-        finally:
-            macsydata._find_all_installed_packages = find_all_packages
-        expected_output  = f"""fake_1-0.0b2   ({os.path.join(model_dir, 'models', fake_packs[0])})
-fake_2-0.0b2   ({os.path.join(model_dir, 'models', fake_packs[1])})"""
-
-        self.assertEqual(packs,
-                         expected_output)
-
-
-    def test_list_outdated(self):
-        fake_packs = ('fake_1', 'fake_2')
-        for name in fake_packs:
-            self.create_fake_package(name, dest=self.models_dir[0], metadata=True)
-        registry = ModelRegistry()
-        for model_loc in scan_models_dir(self.models_dir[0]):
-            registry.add(model_loc)
-
-        def fake_find_all_installed_package(models_dir=None, package_name='macsylib'):
-            return registry
-
-        find_all_packages = macsydata._find_all_installed_packages
-        macsydata._find_all_installed_packages = fake_find_all_installed_package
-
-        remote_list_packages_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, name: {'fake_1': ['1.0'],
-                                                                        'fake_2': ['0.0b2']}[name]
-        self.args.verbose = 1
-        self.args.outdated = True
-        self.args.uptodate = False
-        self.args.models_dir = None
-        self.args.long = False
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_list(self.args)
-                packs = sys.stdout.getvalue().strip()
-        finally:
-            macsydata._find_all_installed_packages = find_all_packages
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_packages_vers
-
-        expected_output = 'fake_1-1.0 [0.0b2]'
-        self.assertEqual(packs,
-                         expected_output)
-
-
-    def test_list_uptodate(self):
-        fake_packs = ('fake_1', 'fake_2')
-        for name in fake_packs:
-            self.create_fake_package(name, dest=self.models_dir[0])
-        registry = ModelRegistry()
-        for model_loc in scan_models_dir(self.models_dir[0]):
-            registry.add(model_loc)
-
-        def fake_find_all_installed_package(models_dir=None, package_name='macsylib'):
-            return registry
+        # the options of do_list do not modify the installed packages
+        # so all of them are checked against the same registry
+        registry = self._models_registry(*fake_packs)
+        model_dir = self.models_dir[0]
+        remote_vers = {'fake_1': ['1.0'], 'fake_2': ['0.0b2']}
 
-        find_all_packages = macsydata._find_all_installed_packages
-        macsydata._find_all_installed_packages = fake_find_all_installed_package
-        remote_list_packages_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, name: {'fake_1': ['1.0'],
-                                                                        'fake_2': ['0.0b2']}[name]
         self.args.verbose = 1
-        self.args.outdated = False
-        self.args.uptodate = True
         self.args.models_dir = None
-        self.args.long = False
-
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_list(self.args)
-                packs = sys.stdout.getvalue().strip()
-        finally:
-            macsydata._find_all_installed_packages = find_all_packages
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_packages_vers
-        expected_output = 'fake_2-0.0b2'
-        self.assertEqual(packs, expected_output)
+        cases = (
+            ({'outdated': False, 'uptodate': False, 'long': False},
+             "fake_1-0.0b2\nfake_2-0.0b2"),
+            ({'outdated': False, 'uptodate': False, 'long': True},
+             f"""fake_1-0.0b2   ({os.path.join(model_dir, fake_packs[0])})
+fake_2-0.0b2   ({os.path.join(model_dir, fake_packs[1])})"""),
+            ({'outdated': True, 'uptodate': False, 'long': False},
+             'fake_1-1.0 [0.0b2]'),
+            ({'outdated': False, 'uptodate': True, 'long': False},
+             'fake_2-0.0b2'),
+        )
+        with mock.patch.object(macsydata, '_find_all_installed_packages',
+                               lambda models_dir=None, package_name='macsylib': registry), \
+                mock.patch.object(macsydata.RemoteModelIndex, 'list_package_vers',
+                                  lambda x, name: remote_vers[name]):
+            for options, expected_output in cases:
+                with self.subTest(**options):
+                    for opt, value in options.items():
+                        setattr(self.args, opt, value)
+                    packs = self._capture_stdout(macsydata.do_list, self.args)
+                    self.assertEqual(packs, expected_output)
 
 
     def test_list_verbose(self):
         fake_packs = ('fake_1', 'fake_2')
-        for name in fake_packs:
-            self.create_fake_package(name, dest=self.models_dir[0])
-        registry = ModelRegistry()
-        for model_loc in scan_models_dir(self.models_dir[0]):
-            registry.add(model_loc)
+        registry = self._models_registry(*fake_packs)
 
-        def fake_find_all_installed_package(models_dir=None, package_name='macsylib'):
-            return registry
-        find_all_packages = macsydata._find_all_installed_packages
-        macsydata._find_all_installed_packages = fake_find_all_installed_package
-        remote_list_packages_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, name: {'fake_1': ['1.0'],
-                                                                        'fake_2': ['0.0b2']}[name]
+        remote_vers = {'fake_1': ['1.0'], 'fake_2': ['0.0b2']}
         os.unlink(os.path.join(self.models_dir[0], 'fake_1', 'metadata.yml'))
         self.args.verbose = 2
         self.args.outdated = False
@@ -407,34 +578,22 @@ fake_2-0.0b2   ({os.path.join(model_dir, 'models', fake_packs[1])})"""
         self.args.models_dir = None
         self.args.long = False
 
-        try:
-            with self.catch_io(out=True):
-                with self.catch_log(log_name='macsydata') as log:
-                    macsydata.do_list(self.args)
-                    log_msg = log.get_value().strip()
-                packs = sys.stdout.getvalue().strip()
-        finally:
-            macsydata._find_all_installed_packages = find_all_packages
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_packages_vers
+        with mock.patch.object(macsydata, '_find_all_installed_packages',
+                               lambda models_dir=None, package_name='macsylib': registry), \
+                mock.patch.object(macsydata.RemoteModelIndex, 'list_package_vers',
+                                  lambda x, name: remote_vers[name]):
+            with self.catch_log(log_name='macsydata') as log:
+                packs = self._capture_stdout(macsydata.do_list, self.args)
+                log_msg = log.get_value().strip()
         self.assertEqual(packs, 'fake_2-0.0b2')
         self.assertEqual(log_msg, f"[Errno 2] No such file or directory: '{self.models_dir[0]}/fake_1/metadata.yml'")
 
 
     def test_freeze(self):
         fake_packs = ('fake_1', 'fake_2')
-        for name in fake_packs:
-            self.create_fake_package(name, dest=self.models_dir[0])
-        registry = ModelRegistry()
-        for model_loc in scan_models_dir(self.models_dir[0]):
-            registry.add(model_loc)
-        find_all_packages = macsydata._find_all_installed_packages
-        macsydata._find_all_installed_packages = lambda package_name: registry
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_freeze(self.args)
-                packs = sys.stdout.getvalue().strip()
-        finally:
-            macsydata._find_all_installed_packages = find_all_packages
+        registry = self._models_registry(*fake_packs)
+        with mock.patch.object(macsydata, '_find_all_installed_packages', lambda package_name: registry):
+            packs = self._capture_stdout(macsydata.do_freeze, self.args)
         self.assertEqual(packs,
                          "fake_1==0.0b2\nfake_2==0.0b2")
 
@@ -454,29 +613,10 @@ fake_2-0.0b2   ({os.path.join(model_dir, 'models', fake_packs[1])})"""
         self.args.model_package = pack_name
         fake_pack_path = self.create_fake_package(pack_name)
 
-        find_local_package = macsydata._find_installed_package
-        macsydata._find_installed_package = lambda model_pack_name, models_dir, package_name: macsydata.ModelPackage(fake_pack_path)
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_cite(self.args)
-                citation = sys.stdout.getvalue().strip()
-        finally:
-            macsydata._find_installed_package = find_local_package
-        expected_citation = """To cite fake_pack:
-
-_ bla bla
-- link to publication
-- ligne 1
-  ligne 2
-  ligne 3 et bbbbb
-
-To cite MacSyLib:
-
-- Néron, Bertrand; Denise, Rémi; Coluzzi, Charles; Touchon, Marie; Rocha, Eduardo P.C.; Abby, Sophie S.
-  MacSyFinder v2: Improved modelling and search engine to identify molecular systems in genomes.
-  Peer Community Journal, Volume 3 (2023), article no. e28. doi : 10.24072/pcjournal.250.
-  https://peercommunityjournal.org/articles/10.24072/pcjournal.250/"""
-        self.assertEqual(expected_citation, citation)
+        with mock.patch.object(macsydata, '_find_installed_package',
+                               lambda model_pack_name, models_dir, package_name: macsydata.ModelPackage(fake_pack_path)):
+            citation = self._capture_stdout(macsydata.do_cite, self.args)
+        self.assertEqual(self.expected_citation, citation)
 
 
     def test_help(self):
@@ -499,14 +639,8 @@ To cite MacSyLib:
         def fake_find_installed_package(model_pack_name, models_dir=None, package_name='macsylib'):
             return macsydata.ModelPackage(fake_pack_path)
 
-        find_local_package = macsydata._find_installed_package
-        macsydata._find_installed_package = fake_find_installed_package
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_help(self.args)
-                citation = sys.stdout.getvalue().strip()
-        finally:
-            macsydata._find_installed_package = find_local_package
+        with mock.patch.object(macsydata, '_find_installed_package', fake_find_installed_package):
+            citation = self._capture_stdout(macsydata.do_help, self.args)
         expected_citation = '# This a README'
 
         self.assertEqual(expected_citation, citation)
@@ -518,14 +652,9 @@ To cite MacSyLib:
         self.args.models_dir = None
         fake_pack_path = self.create_fake_package(model_pack_name)
 
-        find_local_package = macsydata._find_installed_package
-        macsydata._find_installed_package = lambda model_pack_name, models_dir, package_name: macsylib.registries.ModelLocation(path=fake_pack_path)
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_show_definition(self.args)
-                stdout = sys.stdout.getvalue().strip()
-        finally:
-            macsydata._find_installed_package = find_local_package
+        with mock.patch.object(macsydata, '_find_installed_package',
+                               lambda model_pack_name, models_dir, package_name: macsylib.registries.ModelLocation(path=fake_pack_path)):
+            stdout = self._capture_stdout(macsydata.do_show_definition, self.args)
 
         expected_output = f"""<!-- fake_1/sub_fam_1/model_1 {fake_pack_path}/definitions/sub_fam_1/model_1.xml -->
 {self.definition_1}
@@ -542,14 +671,9 @@ To cite MacSyLib:
         self.args.models_dir = None
         fake_pack_path = self.create_fake_package(pack_name)
 
-        find_local_package = macsydata._find_installed_package
-        macsydata._find_installed_package = lambda model_pack_name, models_dir, package_name: macsylib.registries.ModelLocation(path=fake_pack_path)
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_show_definition(self.args)
-                stdout = sys.stdout.getvalue().strip()
-        finally:
-            macsydata._find_installed_package = find_local_package
+        with mock.patch.object(macsydata, '_find_installed_package',
+                               lambda model_pack_name, models_dir, package_name: macsylib.registries.ModelLocation(path=fake_pack_path)):
+            stdout = self._capture_stdout(macsydata.do_show_definition, self.args)
 
         expected_output = f"""<!-- fake_1/sub_fam_1/model_1 {fake_pack_path}/definitions/sub_fam_1/model_1.xml -->
 {self.definition_1}
@@ -567,9 +691,7 @@ To cite MacSyLib:
         self.args.model = [pack_name, 'sub_fam_1/model_1', 'sub_fam_2/model_2']
         self.args.models_dir = os.path.dirname(fake_pack_path)
 
-        with self.catch_io(out=True):
-            macsydata.do_show_definition(self.args)
-            stdout = sys.stdout.getvalue().strip()
+        stdout = self._capture_stdout(macsydata.do_show_definition, self.args)
 
         expected_output = f"""<!-- fake_1/sub_fam_1/model_1 {fake_pack_path}/definitions/sub_fam_1/model_1.xml -->
 {self.definition_1}
@@ -586,14 +708,11 @@ To cite MacSyLib:
         self.args.model = [pack_name, 'niportnaoik']
         self.args.models_dir = None
         fake_pack_path = self.create_fake_package(pack_name)
-        find_local_package = macsydata._find_installed_package
-        macsydata._find_installed_package = lambda model_package_name, models_dir, package_name: macsylib.registries.ModelLocation(path=fake_pack_path)
-        try:
+        with mock.patch.object(macsydata, '_find_installed_package',
+                               lambda model_package_name, models_dir, package_name: macsylib.registries.ModelLocation(path=fake_pack_path)):
             with self.catch_log(log_name='macsydata') as log:
                 macsydata.do_show_definition(self.args)
                 log_msg = log.get_value().strip()
-        finally:
-            macsydata._find_installed_package = find_local_package
 
         self.assertEqual(log_msg, "Model 'fake_1/niportnaoik' not found.")
 
@@ -618,15 +737,12 @@ To cite MacSyLib:
         self.args.model = ['/'.join([pack_name, 'niportnaoik'])]
         self.args.models_dir = None
         fake_pack_path = self.create_fake_package(pack_name)
-        find_local_package = macsydata._find_installed_package
-        macsydata._find_installed_package = lambda model_package_name, models_dir, package_name: macsylib.registries.ModelLocation(path=fake_pack_path)
-        try:
+        with mock.patch.object(macsydata, '_find_installed_package',
+                               lambda model_package_name, models_dir, package_name: macsylib.registries.ModelLocation(path=fake_pack_path)):
             with self.catch_log(log_name='macsydata') as log:
                 with self.assertRaises(ValueError):
                     macsydata.do_show_definition(self.args)
                 log_msg = log.get_value().strip()
-        finally:
-            macsydata._find_installed_package = find_local_package
 
         self.assertEqual(log_msg,
                          f"'niportnaoik' not found in package '{pack_name}'.")
@@ -638,14 +754,9 @@ To cite MacSyLib:
         self.args.models_dir = None
         fake_pack_path = self.create_fake_package(pack_name, complex=True)
 
-        find_local_package = macsydata._find_installed_package
-        macsydata._find_installed_package = lambda model_pack_name, models_dir, package_name: macsylib.registries.ModelLocation(path=fake_pack_path)
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_show_package(self.args)
-                stdout = sys.stdout.getvalue().strip()
-        finally:
-            macsydata._find_installed_package = find_local_package
+        with mock.patch.object(macsydata, '_find_installed_package',
+                               lambda model_pack_name, models_dir, package_name: macsylib.registries.ModelLocation(path=fake_pack_path)):
+            stdout = self._capture_stdout(macsydata.do_show_package, self.args)
 
         expected_output = """fake_1
     ├-sub_fam_1
@@ -685,18 +796,7 @@ fake_1 (0.0b2) : 4 models"""
         with self.catch_log(log_name='macsydata') as log:
             macsydata.do_check(self.args)
             log_msg = log.get_value().strip()
-        expected_msg = f"""If everyone were like you, I'd be out of business
-To push the models in organization:
-\tcd {os.path.join(self.tmpdir, pack_name)}
-Transform the models into a git repository
-\tgit init .
-\tgit add .
-\tgit commit -m 'initial commit'
-add a remote repository to host the models
-for instance if you want to add the models to 'macsy-models'
-\tgit remote add origin https://github.com/macsy-models/
-\tgit tag -a <tag vers>  # check https://macsylib.readthedocs.io/en/latest/modeler_guide/publish_package.html#sharing-your-models
-\tgit push origin <tag vers>"""
+        expected_msg = self.expected_check.format(pack_dir=os.path.join(self.tmpdir, pack_name))
         self.maxDiff = None
         self.assertEqual(expected_msg, log_msg)
 
@@ -710,16 +810,7 @@ for instance if you want to add the models to 'macsy-models'
         with self.catch_log(log_name='macsydata') as log:
             macsydata.do_check(self.args)
             log_msg = log.get_value().strip()
-        expected_msg = """The model package 'fake_1' have not any LICENSE file. May be you have not right to use it.
-The model package 'fake_1' have not any README file.
-The field 'vers' is not required anymore.
-  It will be ignored and set by macsydata during installation phase according to the git tag.
-
-msl_data says: You're only giving me a partial QA payment?
-I'll take it this time, but I'm not happy.
-I'll be really happy, if you fix warnings above, before to publish these models."""
-
-        self.assertEqual(expected_msg, log_msg)
+        self.assertEqual(self.expected_check_warnings, log_msg)
 
 
     def test_check_with_errors(self):
@@ -731,10 +822,7 @@ I'll be really happy, if you fix warnings above, before to publish these models.
             with self.assertRaises(ValueError):
                 macsydata.do_check(self.args)
             log_msg = log.get_value().strip()
-        expected_msg = """The model package 'fake_1' have no 'definitions' directory.
-The model package 'fake_1' have no 'profiles' directory.
-Please fix issues above, before publishing these models."""
-        self.assertEqual(expected_msg, log_msg)
+        self.assertEqual(self.expected_check_errors, log_msg)
 
 
     def test_download(self):
@@ -743,60 +831,41 @@ Please fix issues above, before publishing these models."""
             os.mkdir(path)
             return path
 
+        remote_vers = {'fake_1': ['1.0'], 'fake_2': ['0.0b2']}
+        list_package_vers = mock.patch.object(macsydata.RemoteModelIndex, 'list_package_vers',
+                                              lambda x, name: remote_vers[name])
+
         # The package requested exists download it
-        remote_list_packages_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, name: {'fake_1': ['1.0'],
-                                                                        'fake_2': ['0.0b2']}[name]
-        remote_download = macsydata.RemoteModelIndex.download
-        macsydata.RemoteModelIndex.download = fake_download
         self.args.package = 'fake_1'
         self.args.dest = None
-        try:
+        with list_package_vers, mock.patch.object(macsydata.RemoteModelIndex, 'download', fake_download):
             with self.catch_log(log_name='macsydata') as log:
                 macsydata.do_download(self.args)
                 log_msg = log.get_value().strip()
-        finally:
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_packages_vers
-            macsydata.RemoteModelIndex.download = remote_download
         expected_msg = f"""Downloading {self.args.package} 1.0
 Successfully downloaded models fake_1 in {os.path.join(self.tmpdir, 'fake_1-1.0.tar.gz')}"""
         self.assertEqual(log_msg, expected_msg)
 
         # The package requested does NOT exists
-        remote_list_packages_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, name: {'fake_1': ['1.0'],
-                                                                        'fake_2': ['0.0b2']}[name]
-        remote_download = macsydata.RemoteModelIndex.download
-        macsydata.RemoteModelIndex.download = fake_download
         self.args.package = 'fake_1>2.0'
         self.args.dest = None
-        try:
+        with list_package_vers, mock.patch.object(macsydata.RemoteModelIndex, 'download', fake_download):
             with self.catch_log(log_name='macsydata') as log:
                 macsydata.do_download(self.args)
                 log_msg = log.get_value().strip()
-        finally:
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_packages_vers
-            macsydata.RemoteModelIndex.download = remote_download
 
         expected_msg = """No version that satisfy requirements '>2.0' for 'fake_1'.
 Available versions: 1.0"""
         self.assertEqual(log_msg, expected_msg)
 
         # The package requested is NOT versioned
-        remote_list_packages_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, name: {'fake_1': [],
-                                                                        'fake_2': ['0.0b2']}[name]
-        remote_download = macsydata.RemoteModelIndex.download
-        macsydata.RemoteModelIndex.download = fake_download
         self.args.package = 'fake_1>2.0'
         self.args.dest = None
-        try:
+        with mock.patch.dict(remote_vers, {'fake_1': []}), list_package_vers, \
+                mock.patch.object(macsydata.RemoteModelIndex, 'download', fake_download):
             with self.catch_log(log_name='macsydata') as log:
                 macsydata.do_download(self.args)
                 log_msg = log.get_value().strip()
-        finally:
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_packages_vers
-            macsydata.RemoteModelIndex.download = remote_download
 
         self.assertEqual(log_msg, '')
 
@@ -804,20 +873,12 @@ Available versions: 1.0"""
         def fake_download_limit(_, pack_name, vers, dest=None):
             raise MacsyDataLimitError('github limit error')
 
-        remote_download = macsydata.RemoteModelIndex.download
-        macsydata.RemoteModelIndex.download = fake_download_limit
-        remote_list_packages_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, name: {'fake_1': ['1.0'],
-                                                                        'fake_2': ['0.0b2']}[name]
         self.args.package = 'fake_1'
         self.args.dest = None
-        try:
+        with list_package_vers, mock.patch.object(macsydata.RemoteModelIndex, 'download', fake_download_limit):
             with self.catch_log(log_name='macsydata') as log:
                 macsydata.do_download(self.args)
                 log_msg = log.get_value().strip()
-        finally:
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_packages_vers
-            macsydata.RemoteModelIndex.download = remote_download
         expected_msg = "Downloading fake_1 1.0\ngithub limit error"
         self.assertEqual(log_msg, expected_msg)
 
@@ -825,173 +886,95 @@ Available versions: 1.0"""
     def test_install_local(self):
         model_pack_name = 'fake_pack'
         model_pack_vers = '3.0'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
-        macsydata_dest = os.path.join(self.tmpdir, 'models')
-
-        unarch_pack_path = self.create_fake_package(model_pack_name, dest='tmp')
-        arch_path = f"{os.path.join(macsydata_tmp, model_pack_name)}-{model_pack_vers}.tar.gz"
-
-        with tarfile.open(arch_path, "w:gz") as arch:
-            arch.add(unarch_pack_path, arcname=model_pack_name)
-        shutil.rmtree(unarch_pack_path)
-
-        self.args.model_package = arch_path
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = False
-        self.args.target = macsydata_dest
-        self.args.no_clean = False
+        dirs = self._std_dirs()
+
+        arch_path = self._write_fake_archive(model_pack_name, model_pack_vers)
 
-        macsydata.Config.models_dir = lambda x: self.models_dir
-        try:
+        self.args = self._mk_args(model_package=arch_path,
+                                  cache=dirs['cache'],
+                                  target=dirs['models'])
+
+        with mock.patch.object(macsydata.Config, 'models_dir', lambda x: self.models_dir):
             with self.catch_log(log_name='macsydata'):
                 macsydata.do_install(self.args)
             expected_pack_path = os.path.join(self.models_dir[0], model_pack_name)
-            self.assertTrue(os.path.exists(expected_pack_path))
-            self.assertTrue(os.path.isdir(expected_pack_path))
-            self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'metadata.yml')))
-            self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'README')))
-            self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'definitions')))
-            self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'profiles')))
-        finally:
-            del macsydata.Config.models_dir
+            self.assertInstalledPackage(expected_pack_path)
 
 
     def test_install_target(self):
         model_pack_name = 'fake_pack'
         model_pack_vers = '3.0'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
-        macsydata_target = os.path.join(self.tmpdir, 'target')
-
-        unarch_pack_path = self.create_fake_package(model_pack_name, dest='tmp')
-        arch_path = f"{os.path.join(macsydata_tmp, model_pack_name)}-{model_pack_vers}.tar.gz"
-
-        with tarfile.open(arch_path, "w:gz") as arch:
-            arch.add(unarch_pack_path, arcname=model_pack_name)
-        shutil.rmtree(unarch_pack_path)
-
-        self.args.model_package = arch_path
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = False
-        self.args.target = macsydata_target
-        self.args.no_clean = False
+        dirs = self._std_dirs()
+
+        arch_path = self._write_fake_archive(model_pack_name, model_pack_vers)
+
+        self.args = self._mk_args(model_package=arch_path,
+                                  cache=dirs['cache'],
+                                  target=dirs['target'])
 
         with self.catch_log(log_name='macsydata'):
             macsydata.do_install(self.args)
-        expected_pack_path = os.path.join(macsydata_target, model_pack_name)
-        self.assertTrue(os.path.exists(expected_pack_path))
-        self.assertTrue(os.path.isdir(expected_pack_path))
-        self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'metadata.yml')))
-        self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'README')))
-        self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'definitions')))
-        self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'profiles')))
+        expected_pack_path = os.path.join(dirs['target'], model_pack_name)
+        self.assertInstalledPackage(expected_pack_path)
 
 
     def test_install_bad_target(self):
         model_pack_name = 'fake_pack'
         model_pack_vers = '3.0'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
-        macsydata_target = os.path.join(self.tmpdir, 'target')
-        open(macsydata_target, 'w').close()
-
-        unarch_pack_path = self.create_fake_package(model_pack_name, dest='tmp')
-        arch_path = f"{os.path.join(macsydata_tmp, model_pack_name)}-{model_pack_vers}.tar.gz"
-
-        with tarfile.open(arch_path, "w:gz") as arch:
-            arch.add(unarch_pack_path, arcname=model_pack_name)
-        shutil.rmtree(unarch_pack_path)
-
-        self.args.model_package = arch_path
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = False
-        self.args.target = macsydata_target
-        self.args.no_clean = False
+        dirs = self._std_dirs()
+        open(dirs['target'], 'w').close()
+
+        # do_install fails on the target before opening the archive
+        # so only the archive name matters, not its content
+        arch_path = os.path.join(dirs['tmp'], f"{model_pack_name}-{model_pack_vers}.tar.gz")
+        open(arch_path, 'w').close()
+
+        self.args = self._mk_args(model_package=arch_path,
+                                  cache=dirs['cache'],
+                                  target=dirs['target'])
 
         with self.assertRaises(RuntimeError) as ctx:
             macsydata.do_install(self.args)
         self.assertEqual(str(ctx.exception),
-                         f"'{macsydata_target}' already exist and is not a directory."
+                         f"'{dirs['target']}' already exist and is not a directory."
                          )
 
 
     def test_install_local_already_installed(self):
         model_pack_name = 'fake_pack'
         model_pack_vers = '0.0b2'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
-        macsydata_dest = os.path.join(self.tmpdir, 'models')
-
-        unarch_pack_path = self.create_fake_package(model_pack_name, dest='tmp')
-        arch_path = f"{os.path.join(macsydata_tmp, model_pack_name)}-{model_pack_vers}.tar.gz"
-
-        with tarfile.open(arch_path, "w:gz") as arch:
-            arch.add(unarch_pack_path, arcname=model_pack_name)
-        shutil.rmtree(unarch_pack_path)
-
-        self.args.model_package = arch_path
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = False
-        self.args.target = macsydata_dest
-        self.args.no_clean = False
+        dirs = self._std_dirs()
+
+        arch_path = self._write_fake_archive(model_pack_name, model_pack_vers)
 
-        macsydata.Config.models_dir = lambda x: self.models_dir
-        try:
+        self.args = self._mk_args(model_package=arch_path,
+                                  cache=dirs['cache'],
+                                  target=dirs['models'])
+
+        with mock.patch.object(macsydata.Config, 'models_dir', lambda x: self.models_dir):
             with self.catch_log(log_name='macsydata'):
                 macsydata.do_install(self.args)
             with self.catch_log(log_name='macsydata') as log:
                 macsydata.do_install(self.args)
                 msg_log = log.get_value().strip()
-            expected_log = f"""Requirement already satisfied: {model_pack_name}=={model_pack_vers} in {os.path.join(self.models_dir[0], model_pack_name)}.
-To force installation use option -f --force-reinstall."""
+            expected_log = self.expected_already_installed.format(
+                requirement=f"{model_pack_name}=={model_pack_vers}",
+                pack_path=os.path.join(self.models_dir[0], model_pack_name))
             self.assertEqual(msg_log, expected_log)
-        finally:
-            del macsydata.Config.models_dir
 
 
     def test_install_local_already_installed_force(self):
         model_pack_name = 'fake_pack'
         model_pack_vers = '0.0b2'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
-        macsydata_dest = os.path.join(self.tmpdir, 'models')
-
-        unarch_pack_path = self.create_fake_package(model_pack_name, dest='tmp')
-        arch_path = f"{os.path.join(macsydata_tmp, model_pack_name)}-{model_pack_vers}.tar.gz"
-
-        with tarfile.open(arch_path, "w:gz") as arch:
-            arch.add(unarch_pack_path, arcname=model_pack_name)
-        shutil.rmtree(unarch_pack_path)
-
-        self.args.model_package = arch_path
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = False
-        self.args.target = macsydata_dest
-        self.args.no_clean = False
+        dirs = self._std_dirs()
+
+        arch_path = self._write_fake_archive(model_pack_name, model_pack_vers)
+
+        self.args = self._mk_args(model_package=arch_path,
+                                  cache=dirs['cache'],
+                                  target=dirs['models'])
 
-        macsydata.Config.models_dir = lambda x: self.models_dir
-        try:
+        with mock.patch.object(macsydata.Config, 'models_dir', lambda x: self.models_dir):
             with self.catch_log(log_name='macsydata'):
                 macsydata.do_install(self.args)
 
@@ -1002,14 +985,11 @@ To force installation use option -f --force-reinstall."""
             with self.catch_log(log_name='macsydata') as log:
                 macsydata.do_install(self.args)
                 msg_log = log.get_value().strip()
-            expected_log = f"""Extracting {model_pack_name} ({model_pack_vers}).
-Installing {model_pack_name} ({model_pack_vers}) in {self.models_dir[0]}
-Cleaning.
-The models {model_pack_name} ({model_pack_vers}) have been installed successfully."""
+            expected_log = self.expected_installed.format(name=model_pack_name,
+                                                          vers=model_pack_vers,
+                                                          dest=self.models_dir[0])
             self.assertEqual(msg_log, expected_log)
             self.assertTrue(os.path.exists(os.path.join(self.models_dir[0], model_pack_name, 'README')))
-        finally:
-            del macsydata.Config.models_dir
 
 
     def test_install_installed_package_corrupted(self):
@@ -1018,30 +998,15 @@ The models {model_pack_name} ({model_pack_vers}) have been installed successfull
 
         model_pack_name = 'fake_pack'
         model_pack_vers = '0.0b2'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
-        macsydata_dest = os.path.join(self.tmpdir, 'models')
-
-        unarch_pack_path = self.create_fake_package(model_pack_name, metadata=False, dest='tmp')
-        arch_path = f"{os.path.join(macsydata_tmp, model_pack_name)}-{model_pack_vers}.tar.gz"
-
-        # create a archive of the fake pack
-        with tarfile.open(arch_path, "w:gz") as arch:
-            arch.add(unarch_pack_path, arcname=model_pack_name)
-        shutil.rmtree(unarch_pack_path)
-
-        self.args.model_package = arch_path
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = False
-        self.args.target = macsydata_dest
-        self.args.no_clean = False
+        dirs = self._std_dirs()
 
-        macsydata.Config.models_dir = lambda x: self.models_dir
-        try:
+        arch_path = self._write_fake_archive(model_pack_name, model_pack_vers, metadata=False)
+
+        self.args = self._mk_args(model_package=arch_path,
+                                  cache=dirs['cache'],
+                                  target=dirs['models'])
+
+        with mock.patch.object(macsydata.Config, 'models_dir', lambda x: self.models_dir):
             with self.catch_log(log_name='macsydata') as log:
                 with self.assertRaises(MacsydataError):
                     macsydata.do_install(self.args)
@@ -1050,297 +1015,160 @@ The models {model_pack_name} ({model_pack_vers}) have been installed successfull
                                 f"\nFailed to install '{model_pack_name}-{model_pack_vers}' : The model package has no 'metadata.yml' file."
                                 f"\nPlease contact the package maintainer. (local)")
                 self.assertEqual(expected_log, msg_log)
-        finally:
-            del macsydata.Config.models_dir
 
 
     def test_install_remote(self):
         model_pack_name = 'fake_pack'
         model_pack_vers = '0.0b2'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
-        macsydata_dest = os.path.join(self.tmpdir, 'models')
+        dirs = self._std_dirs()
 
-        self.args.model_package = model_pack_name
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = False
-        self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.target = macsydata_dest
-        self.args.no_clean = False
+        # org is fake to be sure that the network function are mocked
+        self.args = self._mk_args(model_package=model_pack_name,
+                                  cache=dirs['cache'],
+                                  org='macsy-foo-bar',
+                                  target=dirs['models'])
 
         # functions which do net operations
         # so we need to mock them
-        get_remote_available_versions = macsydata._get_remote_available_versions
-        macsydata._get_remote_available_versions = lambda p_nam, org: [model_pack_vers]
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_download = macsydata.RemoteModelIndex.download
-        macsydata.RemoteModelIndex.download = self._fake_download
-        macsydata.Config.models_dir = lambda x: self.models_dir
-        try:
+        with self._mock_remote([model_pack_vers]):
             with self.catch_log(log_name='macsydata'):
                 macsydata.do_install(self.args)
             expected_pack_path = os.path.join(self.models_dir[0], model_pack_name)
-            self.assertTrue(os.path.exists(expected_pack_path))
-            self.assertTrue(os.path.isdir(expected_pack_path))
-            self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'metadata.yml')))
-            self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'README')))
-            self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'definitions')))
-            self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'profiles')))
-        finally:
-            del macsydata.Config.models_dir
-            macsydata._get_remote_available_versions = get_remote_available_versions
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.download = remote_download
+            self.assertInstalledPackage(expected_pack_path)
 
 
     def test_install_remote_spec_not_found(self):
         model_pack_name = 'fake_pack'
         model_pack_vers = '0.0b2'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
-
-        self.args.model_package = f"{model_pack_name}>{model_pack_vers}"
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = False
-        self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.target = None
-        self.args.no_clean = False
+        dirs = self._std_dirs()
+
+        # org is fake to be sure that the network function are mocked
+        self.args = self._mk_args(model_package=f"{model_pack_name}>{model_pack_vers}",
+                                  cache=dirs['cache'],
+                                  org='macsy-foo-bar')
 
         # functions which do net operations
         # so we need to mock them
-        get_remote_available_versions = macsydata._get_remote_available_versions
-        macsydata._get_remote_available_versions = lambda p_nam, org: [model_pack_vers]
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_download = macsydata.RemoteModelIndex.download
-        macsydata.RemoteModelIndex.download = self._fake_download
-        macsydata.Config.models_dir = lambda x: self.models_dir
-        try:
+        with self._mock_remote([model_pack_vers]):
             with self.catch_log(log_name='macsydata') as log:
                 macsydata.do_install(self.args)
                 log_msg = log.get_value().strip()
             self.assertEqual(log_msg,
                              f"Could not find version that satisfied '{self.args.model_package}'")
-        finally:
-            del macsydata.Config.models_dir
-            macsydata._get_remote_available_versions = get_remote_available_versions
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.download = remote_download
 
 
     def test_install_remote_already_in_local(self):
         model_pack_name = 'fake_pack'
         model_pack_vers = '0.0b2'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
+        dirs = self._std_dirs()
 
         self.create_fake_package(model_pack_name, dest='models')
 
-        self.args.model_package = f"{model_pack_name}>{model_pack_vers}"
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = False
-        self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.target = None
-        self.args.no_clean = False
+        # org is fake to be sure that the network function are mocked
+        self.args = self._mk_args(model_package=f"{model_pack_name}>{model_pack_vers}",
+                                  cache=dirs['cache'],
+                                  org='macsy-foo-bar')
 
         # function which doing net operations
         # so we need to mock them
-        get_remote_available_versions = macsydata._get_remote_available_versions
-        macsydata._get_remote_available_versions = lambda p_nam, org: [model_pack_vers]
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_download = macsydata.RemoteModelIndex.download
-        macsydata.RemoteModelIndex.download = self._fake_download
-        macsydata.Config.models_dir = lambda x: self.models_dir
-        try:
+        with self._mock_remote([model_pack_vers]):
             with self.catch_log(log_name='macsydata') as log:
                 macsydata.do_install(self.args)
                 log_msg = log.get_value().strip()
-            self.assertEqual(log_msg,
-                             f"""Requirement already satisfied: {self.args.model_package} in {os.path.join(self.models_dir[0], model_pack_name)}.
-To force installation use option -f --force-reinstall.""")
-        finally:
-            del macsydata.Config.models_dir
-            macsydata._get_remote_available_versions = get_remote_available_versions
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.download = remote_download
+            expected_log = self.expected_already_installed.format(
+                requirement=self.args.model_package,
+                pack_path=os.path.join(self.models_dir[0], model_pack_name))
+            self.assertEqual(log_msg, expected_log)
 
 
     def test_install_remote_already_in_local_force(self):
         model_pack_name = 'fake_pack'
         model_pack_vers = '0.0b2'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
-        macsydata_dest = os.path.join(self.tmpdir, 'models')
+        dirs = self._std_dirs()
 
         self.create_fake_package(model_pack_name, dest='models')
 
-        self.args.model_package = f"{model_pack_name}>{model_pack_vers}"
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = True
-        self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.target = macsydata_dest
-        self.args.no_clean = False
+        # org is fake to be sure that the network function are mocked
+        self.args = self._mk_args(model_package=f"{model_pack_name}>{model_pack_vers}",
+                                  cache=dirs['cache'],
+                                  force=True,
+                                  org='macsy-foo-bar',
+                                  target=dirs['models'])
 
         # function which doing net operations
         # so we need to mock them
-        get_remote_available_versions = macsydata._get_remote_available_versions
-        macsydata._get_remote_available_versions = lambda p_nam, org: [model_pack_vers]
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_download = macsydata.RemoteModelIndex.download
-        macsydata.RemoteModelIndex.download = self._fake_download
-        macsydata.Config.models_dir = lambda x: self.models_dir
-        try:
+        with self._mock_remote([model_pack_vers]):
             with self.catch_log(log_name='macsydata'):
                 macsydata.do_install(self.args)
             expected_pack_path = os.path.join(self.models_dir[0], model_pack_name)
-            self.assertTrue(os.path.exists(expected_pack_path))
-            self.assertTrue(os.path.isdir(expected_pack_path))
-            self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'metadata.yml')))
-            self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'README')))
-            self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'definitions')))
-            self.assertTrue(os.path.exists(os.path.join(expected_pack_path, 'profiles')))
-        finally:
-            del macsydata.Config.models_dir
-            macsydata._get_remote_available_versions = get_remote_available_versions
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.download = remote_download
+            self.assertInstalledPackage(expected_pack_path)
 
 
     def test_install_remote_lower_in_local(self):
         model_pack_name = 'fake_pack'
         model_pack_vers = '1.0'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
+        dirs = self._std_dirs()
 
         self.create_fake_package(model_pack_name, dest='models')
 
-        self.args.model_package = f"{model_pack_name}=={model_pack_vers}"
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = False
-        self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.target = None
-        self.args.no_clean = False
-        self.args.tool_name = 'msl_data'
+        # org is fake to be sure that the network function are mocked
+        self.args = self._mk_args(model_package=f"{model_pack_name}=={model_pack_vers}",
+                                  cache=dirs['cache'],
+                                  org='macsy-foo-bar',
+                                  tool_name='msl_data')
 
         # function which doing net operations
         # so we need to mock them
-        get_remote_available_versions = macsydata._get_remote_available_versions
-        macsydata._get_remote_available_versions = lambda p_nam, org: [model_pack_vers]
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_download = macsydata.RemoteModelIndex.download
-        macsydata.RemoteModelIndex.download = self._fake_download
-        macsydata.Config.models_dir = lambda x: self.models_dir
-        try:
+        with self._mock_remote([model_pack_vers]):
             with self.catch_log(log_name='macsydata') as log:
                 macsydata.do_install(self.args)
                 log_msg = log.get_value().strip()
             self.assertEqual(log_msg,
                              f"""{model_pack_name} (0.0b2) is already installed but {model_pack_vers} version is available.
 To install it please run '{self.args.tool_name} install --upgrade {model_pack_name}'""")
-        finally:
-            del macsydata.Config.models_dir
-            macsydata._get_remote_available_versions = get_remote_available_versions
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.download = remote_download
 
 
     def test_install_remote_upper_in_local(self):
         pack_name = 'fake_pack'
         pack_vers = '0.0b1'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
+        dirs = self._std_dirs()
 
         self.create_fake_package(pack_name, dest='models')
 
-        self.args.model_package = f"{pack_name}>{pack_vers}"
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = False
-        self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.target = None
-        self.args.no_clean = False
+        # org is fake to be sure that the network function are mocked
+        self.args = self._mk_args(model_package=f"{pack_name}>{pack_vers}",
+                                  cache=dirs['cache'],
+                                  org='macsy-foo-bar')
 
         # function which doing net operations
         # so we need to mock them
-        get_remote_available_versions = macsydata._get_remote_available_versions
-        macsydata._get_remote_available_versions = lambda p_nam, org: [pack_vers]
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_download = macsydata.RemoteModelIndex.download
-        macsydata.RemoteModelIndex.download = self._fake_download
-        macsydata.Config.models_dir = lambda x: self.models_dir
-        try:
+        with self._mock_remote([pack_vers]):
             with self.catch_log(log_name='macsydata') as log:
                 macsydata.do_install(self.args)
                 log_msg = log.get_value().strip()
             self.assertEqual(log_msg,
                              f"""{pack_name} (0.0b2) is already installed.
 To downgrade to 0.0b1 use option -f --force-reinstall.""")
-        finally:
-            del macsydata.Config.models_dir
-            macsydata._get_remote_available_versions = get_remote_available_versions
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.download = remote_download
 
 
     @unittest.skipIf(os.getuid() == 0, 'Skip test if run as root')
     def test_install_remote_permision_error(self):
         model_pack_name = 'fake_pack'
         model_pack_vers = '0.0b2'
-        macsydata_cache = os.path.join(self.tmpdir, 'cache')
-        os.mkdir(macsydata_cache)
-        macsydata_tmp = os.path.join(self.tmpdir, 'tmp')
-        os.mkdir(macsydata_tmp)
-        macsydata_dest = os.path.join(self.tmpdir, 'models')
+        dirs = self._std_dirs()
 
         os.chmod(self.models_dir[0], 0o111)
+        self.addCleanup(os.chmod, self.models_dir[0], 0o777)
 
-        self.args.model_package = model_pack_name
-        self.args.cache = macsydata_cache
-        self.args.user = False
-        self.args.upgrade = False
-        self.args.force = False
-        self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.target = macsydata_dest
-        self.args.no_clean = False
+        # org is fake to be sure that the network function are mocked
+        self.args = self._mk_args(model_package=model_pack_name,
+                                  cache=dirs['cache'],
+                                  org='macsy-foo-bar',
+                                  target=dirs['models'])
 
         # functions which do net operations
         # so we need to mock them
-        get_remote_available_versions = macsydata._get_remote_available_versions
-        macsydata._get_remote_available_versions = lambda p_nam, org: [model_pack_vers]
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_download = macsydata.RemoteModelIndex.download
-        macsydata.RemoteModelIndex.download = self._fake_download
-        macsydata.Config.models_dir = lambda x: self.models_dir
-        try:
+        with self._mock_remote([model_pack_vers]):
             with self.catch_log(log_name='macsydata') as log:
                 with self.assertRaises(ValueError):
                     macsydata.do_install(self.args)
@@ -1353,236 +1181,63 @@ Extracting {model_pack_name} ({model_pack_vers}).
 Installing {model_pack_name} ({model_pack_vers}) in {self.models_dir[0]}
 {self.models_dir[0]} is not writable: [Errno 13] Permission denied: '{os.path.join(self.models_dir[0], model_pack_name)}'
 Maybe you can use --user option to install in your HOME.""")
-        finally:
-            os.chmod(self.models_dir[0], 0o777)
-            del macsydata.Config.models_dir
-            macsydata._get_remote_available_versions = get_remote_available_versions
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.download = remote_download
 
 
     def test_uninstall(self):
         pack_name = 'fake_1'
-        path = self.create_fake_package(pack_name, dest=self.models_dir[0])
+        registry = self._models_registry(pack_name)
+        path = os.path.join(self.models_dir[0], pack_name)
         self.args.model_package = pack_name
         self.args.models_dir = None
 
-        registry = ModelRegistry()
-        for model_loc in scan_models_dir(self.models_dir[0]):
-            registry.add(model_loc)
-
-        def fake_find_all_installed_package(models_dir=None, prog_name='macsylib'):
-            return registry
-
         def fake_find_installed_package(model_pack_name, models_dir=None, package_name='macsylib'):
             return registry[model_pack_name]
 
-        macsydata._find_all_installed_packages = fake_find_all_installed_package
-
-        find_local_package = macsydata._find_installed_package
-        macsydata._find_installed_package = fake_find_installed_package
-        try:
+        with mock.patch.object(macsydata, '_find_installed_package', fake_find_installed_package):
             with self.catch_log(log_name='macsydata') as log:
                 macsydata.do_uninstall(self.args)
                 log_msg = log.get_value().strip()
-        finally:
-            macsydata._find_installed_package = find_local_package
 
         expected_msg = f"models '{pack_name}' in {path} uninstalled."
         self.assertEqual(log_msg, expected_msg)
         self.assertFalse(os.path.exists(path))
 
         self.args.model_package = 'foo'
-        find_local_package = macsydata._find_installed_package
-
-        def fake_find_installed_package(model_pack_name, models_dir=None, package_name='macsylib'): return None
-
-        macsydata._find_installed_package = fake_find_installed_package
-        try:
+        with mock.patch.object(macsydata, '_find_installed_package',
+                               lambda model_pack_name, models_dir=None, package_name='macsylib': None):
             with self.catch_log(log_name='macsydata') as log:
                 with self.assertRaises(ValueError):
                     macsydata.do_uninstall(self.args)
                 log_msg = log.get_value().strip()
-        finally:
-            macsydata._find_installed_package = find_local_package
         expected_msg = f"Models '{self.args.model_package}' not found locally."
         self.assertEqual(log_msg, expected_msg)
 
 
-    def test_search_in_pack_name(self):
-        self.args.pattern = 'Foo'
+    def test_search(self):
         self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.careful = False
-        self.args.match_case = False
         self.args.models_dir = None
         self.args.no_clean = False
-
-        # functions which do net operations
-        # so we need to mock them
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_list_packages = macsydata.RemoteModelIndex.list_packages
-        macsydata.RemoteModelIndex.list_packages = lambda x: ['FOO']
-        remote_list_package_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, pack_nam: ['0.1']
-        remote_get_metadata = macsydata.RemoteModelIndex.get_metadata
-        macsydata.RemoteModelIndex.get_metadata = lambda x, pac_nam: {'vers': '0.1',
-                                                                      'short_desc': 'this is a foo desc_pattern'}
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_search(self.args)
-                stdout = sys.stdout.getvalue().strip()
-            self.assertEqual(stdout,  'FOO (0.1)                  - this is a foo desc_pattern')
-        finally:
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.list_packages = remote_list_packages
-            macsydata.RemoteModelIndex.get_metadata = remote_get_metadata
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_package_vers
-
-        # case where package is not versioned
-        self.args.pattern = 'Foo'
-        self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.careful = False
-        self.args.match_case = False
-        self.args.no_clean = False
-
-        # functions which do net operations
-        # so we need to mock them
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_list_packages = macsydata.RemoteModelIndex.list_packages
-        macsydata.RemoteModelIndex.list_packages = lambda x: ['FOO']
-        remote_list_package_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, pack_nam: []
-        remote_get_metadata = macsydata.RemoteModelIndex.get_metadata
-        macsydata.RemoteModelIndex.get_metadata = lambda x, pac_nam: {'short_desc': 'this is a foo desc_pattern'}
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_search(self.args)
-                stdout = sys.stdout.getvalue().strip()
-            self.assertEqual(stdout, '')
-        finally:
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.list_packages = remote_list_packages
-            macsydata.RemoteModelIndex.get_metadata = remote_get_metadata
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_package_vers
-
-
-    def test_search_in_pack_name_match_case(self):
-        self.args.pattern = 'Foo'.lower()
-        self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.careful = False
-        self.args.match_case = True
-        self.args.no_clean = False
-
-        # functions which do net operations
-        # so we need to mock them
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_list_packages = macsydata.RemoteModelIndex.list_packages
-        macsydata.RemoteModelIndex.list_packages = lambda x: ['FOO']
-        remote_list_package_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, pack_nam: ['0.1']
-        remote_get_metadata = macsydata.RemoteModelIndex.get_metadata
-        macsydata.RemoteModelIndex.get_metadata = lambda x, pac_nam: {'vers': '0.1',
-                                                                      'short_desc': 'this is a foo desc_pattern'}
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_search(self.args)
-                stdout = sys.stdout.getvalue().strip()
-            self.assertEqual(stdout,  '')
-        finally:
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.list_packages = remote_list_packages
-            macsydata.RemoteModelIndex.get_metadata = remote_get_metadata
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_package_vers
-
-
-    def test_search_in_pack_desc(self):
-        self.args.pattern = 'sc_pat'
-        self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.careful = True
-        self.args.match_case = False
-        self.args.no_clean = False
-
-        # functions which do net operations
-        # so we need to mock them
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_list_packages = macsydata.RemoteModelIndex.list_packages
-        macsydata.RemoteModelIndex.list_packages = lambda x: ['FOO']
-        remote_list_package_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, pack_nam: ['0.1']
-        remote_get_metadata = macsydata.RemoteModelIndex.get_metadata
-        macsydata.RemoteModelIndex.get_metadata = lambda x, pac_nam: {'vers': '0.1',
-                                                                      'short_desc': 'this is a foo desc_pattern'}
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_search(self.args)
-                stdout = sys.stdout.getvalue().strip()
-            self.assertEqual(stdout,  'FOO (0.1)                  - this is a foo desc_pattern')
-        finally:
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.list_packages = remote_list_packages
-            macsydata.RemoteModelIndex.get_metadata = remote_get_metadata
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_package_vers
-
-        # test when package is not versioned
-        self.args.pattern = 'sc_pat'
-        self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.careful = True
-        self.args.match_case = False
-
-        # functions which do net operations
-        # so we need to mock them
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_list_packages = macsydata.RemoteModelIndex.list_packages
-        macsydata.RemoteModelIndex.list_packages = lambda x: ['FOO']
-        remote_list_package_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, pack_nam: []
-        remote_get_metadata = macsydata.RemoteModelIndex.get_metadata
-        macsydata.RemoteModelIndex.get_metadata = lambda x, pac_nam: {'short_desc': 'this is a foo desc_pattern'}
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_search(self.args)
-                stdout = sys.stdout.getvalue().strip()
-            self.assertEqual(stdout, '')
-        finally:
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.list_packages = remote_list_packages
-            macsydata.RemoteModelIndex.get_metadata = remote_get_metadata
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_package_vers
-
-
-    def test_search_in_pack_desc_match_case(self):
-        self.args.pattern = 'sc_pat'.upper()
-        self.args.org = 'macsy-foo-bar'  # to be sure that the network function are mocked
-        self.args.careful = True
-        self.args.match_case = True
-        self.args.no_clean = False
-
-        # functions which do net operations
-        # so we need to mock them
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = lambda x: True
-        remote_list_packages = macsydata.RemoteModelIndex.list_packages
-        macsydata.RemoteModelIndex.list_packages = lambda x: ['FOO']
-        remote_list_package_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, pack_nam: ['0.1']
-        remote_get_metadata = macsydata.RemoteModelIndex.get_metadata
-        macsydata.RemoteModelIndex.get_metadata = lambda x, pac_nam: {'vers': '0.1',
-                                                                      'short_desc': 'this is a foo desc_pattern'}
-        try:
-            with self.catch_io(out=True):
-                macsydata.do_search(self.args)
-                stdout = sys.stdout.getvalue().strip()
-            self.assertEqual(stdout,  '')
-        finally:
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.list_packages = remote_list_packages
-            macsydata.RemoteModelIndex.get_metadata = remote_get_metadata
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_package_vers
+        found = 'FOO (0.1)                  - this is a foo desc_pattern'
+        # search in the package name (careful False) or also in its description (careful True)
+        cases = (
+            ({'pattern': 'Foo', 'careful': False, 'match_case': False}, found),
+            ({'pattern': 'foo', 'careful': False, 'match_case': True}, ''),
+            ({'pattern': 'sc_pat', 'careful': True, 'match_case': False}, found),
+            ({'pattern': 'SC_PAT', 'careful': True, 'match_case': True}, ''),
+        )
+        unversioned_metadata = {'short_desc': self.search_metadata['short_desc']}
+        for options, expected_output in cases:
+            for opt, value in options.items():
+                setattr(self.args, opt, value)
+            with self.subTest(**options):
+                with self._mock_search(['0.1']):
+                    stdout = self._capture_stdout(macsydata.do_search, self.args)
+                self.assertEqual(stdout, expected_output)
+            with self.subTest(**options, versioned=False):
+                # a package which is not versioned is never found
+                with self._mock_search([], metadata=unversioned_metadata):
+                    stdout = self._capture_stdout(macsydata.do_search, self.args)
+                self.assertEqual(stdout, '')
 
 
     def test_search_reach_limit(self):
@@ -1592,296 +1247,145 @@ Maybe you can use --user option to install in your HOME.""")
         self.args.match_case = True
         self.args.no_clean = False
 
-        # functions which do net operations
-        # so we need to mock them
         def fake_remote(self):
             raise MacsyDataLimitError('bla')
 
-        remote_exists = macsydata.RemoteModelIndex.remote_exists
-        macsydata.RemoteModelIndex.remote_exists = fake_remote
-        remote_list_packages = macsydata.RemoteModelIndex.list_packages
-        macsydata.RemoteModelIndex.list_packages = lambda x: ['FOO']
-        remote_list_package_vers = macsydata.RemoteModelIndex.list_package_vers
-        macsydata.RemoteModelIndex.list_package_vers = lambda x, pack_nam: ['0.1']
-        remote_get_metadata = macsydata.RemoteModelIndex.get_metadata
-        macsydata.RemoteModelIndex.get_metadata = lambda x, pac_nam: {'vers': '0.1',
-                                                                      'short_desc': 'this is a foo desc_pattern'}
-        try:
-            with self.catch_io(out=True):
-                with self.catch_log(log_name='macsydata') as log:
-                    macsydata.do_search(self.args)
-                    log_msg = log.get_value().strip()
-                stdout = sys.stdout.getvalue().strip()
-            self.assertEqual(stdout,  '')
-            self.assertEqual(log_msg, 'bla')
-        finally:
-            macsydata.RemoteModelIndex.remote_exists = remote_exists
-            macsydata.RemoteModelIndex.list_packages = remote_list_packages
-            macsydata.RemoteModelIndex.get_metadata = remote_get_metadata
-            macsydata.RemoteModelIndex.list_package_vers = remote_list_package_vers
+        with self._mock_search(['0.1'], remote_exists=fake_remote):
+            with self.catch_log(log_name='macsydata') as log:
+                stdout = self._capture_stdout(macsydata.do_search, self.args)
+                log_msg = log.get_value().strip()
+        self.assertEqual(stdout,  '')
+        self.assertEqual(log_msg, 'bla')
 
 
     @unittest.skipIf(git is None, "GitPython is not installed")
+    @mock.patch.object(macsydata.time, 'localtime', lambda: FakeTime(2022))
     def test_init_package_minimal(self):
-        self.args.model_package = 'minimal_pack'
-        self.args.maintainer = 'John Doe'
-        self.args.email = 'john.doe@domain.org'
-        self.args.authors = 'Jim Doe, John Doe'
-        self.args.license = None
-        self.args.holders = None
-        self.args.desc = None
-        self.args.models_dir = self.models_dir[0]
-        self.args.no_clean = False
-        # see below (test_init_package_complete)
-        # why a do a mock for localtime
-        fake_time = namedtuple('FakeTime', ['tm_year'])
-        local_time_ori = macsydata.time.localtime
-        macsydata.time.localtime = lambda: fake_time(2022)
-        try:
-            with self.catch_log(log_name='macsydata'):
-                macsydata.do_init_package(self.args)
+        self.args = self._mk_init_args(model_package='minimal_pack', license=None, holders=None, desc=None)
+        with self.catch_log(log_name='macsydata'):
+            macsydata.do_init_package(self.args)
+        self.assertInitPackage(self.args.model_package)
 
-            files = ('README.md', 'metadata.yml', 'model_conf.xml', os.path.join('definitions', 'model_example.xml'))
-            for f_name in files:
-                with self.subTest(file_name=f_name):
-                    expected_file = self.find_data(self.args.model_package, f_name)
-                    got_file = os.path.join(self.args.models_dir, self.args.model_package, f_name)
-                    self.assertFileEqual(expected_file, got_file)
-        finally:
-            macsydata.time.localtime = local_time_ori
 
+    @mock.patch.object(macsydata.time, 'localtime', lambda: FakeTime(2022))
+    def test_init_package_minimal_no_git(self):
+        # only the generation of the files is checked
+        # so the repository is a mock and this test does not need GitPython
+        repos = []
 
-    @unittest.skipIf(git is None, "GitPython is not installed")
-    def test_init_package_license(self):
-        self.args.model_package = 'init_pack_license'
-        self.args.maintainer = 'John Doe'
-        self.args.email = 'john.doe@domain.org'
-        self.args.authors = 'Jim Doe, John Doe'
-        self.args.license = 'cc-by-nc-sa'
-        self.args.holders = None
-        self.args.desc = 'description in one line of this package'
-        self.args.models_dir = self.models_dir[0]
-        self.args.no_clean = False
-        # see below (test_init_package_complete)
-        # why a do a mock for localtime
-        fake_time = namedtuple('FakeTime', ['tm_year'])
-        local_time_ori = macsydata.time.localtime
-        macsydata.time.localtime = lambda: fake_time(2022)
-        try:
+        def fake_init(pack_path):
+            git_dir = os.path.join(pack_path, '.git')
+            os.makedirs(os.path.join(git_dir, 'hooks'))
+            repos.append(mock.Mock(working_dir=pack_path, git_dir=git_dir, untracked_files=[]))
+            return repos[-1]
+
+        fake_git = mock.Mock()
+        fake_git.Repo.init.side_effect = fake_init
+        self.args = self._mk_init_args(model_package='minimal_pack', license=None, holders=None, desc=None)
+        with mock.patch.dict(sys.modules, {'git': fake_git}):
             with self.catch_log(log_name='macsydata'):
                 macsydata.do_init_package(self.args)
+        self.assertInitPackage(self.args.model_package)
+        fake_git.Repo.init.assert_called_once_with(os.path.join(self.models_dir[0], self.args.model_package))
+        repos[0].index.commit.assert_called_once()
 
-            files = ('README.md', 'metadata.yml', 'model_conf.xml', os.path.join('definitions', 'model_example.xml'))
-            for f_name in files:
-                with self.subTest(file_name=f_name):
-                    expected_file = self.find_data(self.args.model_package, f_name)
-                    got_file = os.path.join(self.args.models_dir, self.args.model_package, f_name)
-                    self.assertFileEqual(expected_file, got_file)
-        finally:
-            macsydata.time.localtime = local_time_ori
+
+    @unittest.skipIf(git is None, "GitPython is not installed")
+    @mock.patch.object(macsydata.time, 'localtime', lambda: FakeTime(2022))
+    def test_init_package_license(self):
+        self.args = self._mk_init_args(model_package='init_pack_license', holders=None)
+        with self.catch_log(log_name='macsydata'):
+            macsydata.do_init_package(self.args)
+        self.assertInitPackage(self.args.model_package)
 
 
     @unittest.skipIf(git is None, "GitPython is not installed")
+    @mock.patch.object(macsydata.time, 'localtime', lambda: FakeTime(2022))
     def test_init_package_complete(self):
-        self.args.model_package = 'init_pack'
-        self.args.maintainer = 'John Doe'
-        self.args.email = 'john.doe@domain.org'
-        self.args.authors = 'Jim Doe, John Doe'
-        self.args.license = 'cc-by-nc-sa'
-        self.args.holders = 'Pasteur'
-        self.args.desc = 'description in one line of this package'
-        self.args.models_dir = self.models_dir[0]
-        self.args.no_clean = False
-        # do_init_package call localtime to get year
-        # and put it in copyright filed of metadata
-        # so I do monkey patching to get reliable year
-        # otherwise I have to adapt the test each new year ;-(
-        fake_time = namedtuple('FakeTime', ['tm_year'])
-        local_time_ori = macsydata.time.localtime
-        macsydata.time.localtime = lambda: fake_time(2022)
-        try:
-            with self.catch_log(log_name='macsydata'):
-                macsydata.do_init_package(self.args)
-
-            files = ('README.md', 'metadata.yml', 'model_conf.xml', os.path.join('definitions', 'model_example.xml'))
-            for f_name in files:
-                with self.subTest(file_name=f_name):
-                    expected_file = self.find_data(self.args.model_package, f_name)
-                    got_file = os.path.join(self.args.models_dir, self.args.model_package, f_name)
-                    self.assertFileEqual(expected_file, got_file)
-        finally:
-            macsydata.time.localtime = local_time_ori
+        self.args = self._mk_init_args()
+        with self.catch_log(log_name='macsydata'):
+            macsydata.do_init_package(self.args)
+        self.assertInitPackage(self.args.model_package)
 
 
     @unittest.skipIf(git is None, "GitPython is not installed")
+    @mock.patch.object(macsydata.time, 'localtime', lambda: FakeTime(2022))
     def test_init_empty_dir_exists(self):
-        self.args.model_package = 'init_pack'
-        self.args.maintainer = 'John Doe'
-        self.args.email = 'john.doe@domain.org'
-        self.args.authors = 'Jim Doe, John Doe'
-        self.args.license = 'cc-by-nc-sa'
-        self.args.holders = 'Pasteur'
-        self.args.desc = 'description in one line of this package'
-        self.args.models_dir = self.models_dir[0]
-        self.args.no_clean = False
-        # see above (test_init_package_complete)
-        # why a do a mock for localtime
-        fake_time = namedtuple('FakeTime', ['tm_year'])
-        local_time_ori = macsydata.time.localtime
-        macsydata.time.localtime = lambda: fake_time(2022)
+        self.args = self._mk_init_args()
         os.makedirs(os.path.join(self.models_dir[0], self.args.model_package))
-        try:
-            with self.catch_log(log_name='macsydata'):
-                macsydata.do_init_package(self.args)
-
-            files = ('README.md', 'metadata.yml', 'model_conf.xml', os.path.join('definitions', 'model_example.xml'))
-            for f_name in files:
-                with self.subTest(file_name=f_name):
-                    expected_file = self.find_data(self.args.model_package, f_name)
-                    got_file = os.path.join(self.args.models_dir, self.args.model_package, f_name)
-                    self.assertFileEqual(expected_file, got_file)
-        finally:
-            macsydata.time.localtime = local_time_ori
+        with self.catch_log(log_name='macsydata'):
+            macsydata.do_init_package(self.args)
+        self.assertInitPackage(self.args.model_package)
 
 
     @unittest.skipIf(git is None, "GitPython is not installed")
+    @mock.patch.object(macsydata.time, 'localtime', lambda: FakeTime(2022))
     def test_init_dir_exists_not_pack(self):
-        self.args.model_package = 'init_pack'
-        self.args.maintainer = 'John Doe'
-        self.args.email = 'john.doe@domain.org'
-        self.args.authors = 'Jim Doe, John Doe'
-        self.args.license = 'cc-by-nc-sa'
-        self.args.holders = 'Pasteur'
-        self.args.desc = 'description in one line of this package'
-        self.args.models_dir = self.models_dir[0]
-        self.args.no_clean = False
-        # see above (test_init_package_complete)
-        # why a do a mock for localtime
-        fake_time = namedtuple('FakeTime', ['tm_year'])
-        local_time_ori = macsydata.time.localtime
-        macsydata.time.localtime = lambda: fake_time(2022)
+        self.args = self._mk_init_args()
         pack_path = os.path.join(self.models_dir[0], self.args.model_package)
         os.makedirs(pack_path)
         os.mkdir(os.path.join(pack_path, 'nimportnaoik'))
-        try:
-            with self.catch_log(log_name='macsydata') as log:
-                with self.assertRaises(ValueError):
-                    macsydata.do_init_package(self.args)
-                log_msg = log.get_value().strip()
-            self.assertEqual(log_msg,
-                             f"{pack_path} already exits and not look a model package:"
-                             f" There is no definitions, profiles.")
+        with self.catch_log(log_name='macsydata') as log:
+            with self.assertRaises(ValueError):
+                macsydata.do_init_package(self.args)
+            log_msg = log.get_value().strip()
+        self.assertEqual(log_msg,
+                         f"{pack_path} already exits and not look a model package:"
+                         f" There is no definitions, profiles.")
 
-        finally:
-            macsydata.time.localtime = local_time_ori
 
     @unittest.skipIf(git is None, "GitPython is not installed")
+    @mock.patch.object(macsydata.time, 'localtime', lambda: FakeTime(2022))
     def test_init_dir_exists_look_pack(self):
-        self.args.model_package = 'init_pack'
-        self.args.maintainer = 'John Doe'
-        self.args.email = 'john.doe@domain.org'
-        self.args.authors = 'Jim Doe, John Doe'
-        self.args.license = 'cc-by-nc-sa'
-        self.args.holders = 'Pasteur'
-        self.args.desc = 'description in one line of this package'
-        self.args.models_dir = self.models_dir[0]
-        self.args.no_clean = False
-        # see above (test_init_package_complete)
-        # why a do a mock for localtime
-        fake_time = namedtuple('FakeTime', ['tm_year'])
-        local_time_ori = macsydata.time.localtime
-        macsydata.time.localtime = lambda: fake_time(2022)
+        self.args = self._mk_init_args()
         pack_path = os.path.join(self.models_dir[0], self.args.model_package)
         os.makedirs(pack_path)
         os.mkdir(os.path.join(pack_path, 'definitions'))
         os.mkdir(os.path.join(pack_path, 'profiles'))
         git.Repo.init(pack_path)
-        try:
-            with self.catch_log(log_name='macsydata'):
-                macsydata.do_init_package(self.args)
-            files = ('README.md', 'metadata.yml', 'model_conf.xml', os.path.join('definitions', 'model_example.xml'))
-            for f_name in files:
-                with self.subTest(file_name=f_name):
-                    expected_file = self.find_data(self.args.model_package, f_name)
-                    got_file = os.path.join(self.args.models_dir, self.args.model_package, f_name)
-                    self.assertFileEqual(expected_file, got_file)
-            repo = git.Repo(pack_path)
-            tree = repo.head.commit.tree
-            files_and_dirs = {entry.name for entry in tree}
-            # profiles is empty so not in git
-            # we list only first level so 'definitions/model_example.xml' does not appear
-            self.assertEqual({'COPYRIGHT', 'LICENSE', 'README.md', 'definitions', 'metadata.yml', 'model_conf.xml'},
-                             files_and_dirs)
-        finally:
-            macsydata.time.localtime = local_time_ori
+        with self.catch_log(log_name='macsydata'):
+            macsydata.do_init_package(self.args)
+        self.assertInitPackage(self.args.model_package)
+        repo = git.Repo(pack_path)
+        tree = repo.head.commit.tree
+        files_and_dirs = {entry.name for entry in tree}
+        # profiles is empty so not in git
+        # we list only first level so 'definitions/model_example.xml' does not appear
+        self.assertEqual({'COPYRIGHT', 'LICENSE', 'README.md', 'definitions', 'metadata.yml', 'model_conf.xml'},
+                         files_and_dirs)
 
 
     @unittest.skipIf(git is None, "GitPython is not installed")
+    @mock.patch.object(macsydata.time, 'localtime', lambda: FakeTime(2022))
     def test_init_existing_pack(self):
-        self.args.model_package = 'init_pack'
-        self.args.maintainer = 'John Doe'
-        self.args.email = 'john.doe@domain.org'
-        self.args.authors = 'Jim Doe, John Doe'
-        self.args.license = 'cc-by-nc-sa'
-        self.args.holders = 'Pasteur'
-        self.args.desc = 'description in one line of this package'
-        self.args.models_dir = self.models_dir[0]
-        self.args.no_clean = False
-        # see above (test_init_package_complete)
-        # why a do a mock for localtime
-        fake_time = namedtuple('FakeTime', ['tm_year'])
-        local_time_ori = macsydata.time.localtime
-        macsydata.time.localtime = lambda: fake_time(2022)
+        self.args = self._mk_init_args()
         pack_path = os.path.join(self.models_dir[0], self.args.model_package)
         with self.catch_log(log_name='macsydata'):
             macsydata.do_init_package(self.args)
-        try:
-            with self.catch_log(log_name='macsydata'):
-                macsydata.do_init_package(self.args)
-            files = ('README.md', 'metadata.yml', 'model_conf.xml', os.path.join('definitions', 'model_example.xml'))
-            for f_name in files:
-                with self.subTest(file_name=f_name):
-                    expected_file = self.find_data(self.args.model_package, f_name)
-                    got_file = os.path.join(self.args.models_dir, self.args.model_package, f_name)
-                    self.assertFileEqual(expected_file, got_file)
-            repo = git.Repo(pack_path)
-            tree = repo.head.commit.tree
-            files_and_dirs = {entry.name for entry in tree}
-            # profiles is empty so not in git
-            # we list only first level so 'definitions/model_example.xml' does not appear
-            self.assertEqual({'COPYRIGHT', 'LICENSE', 'README.md', 'definitions', 'metadata.yml', 'model_conf.xml'},
-                             files_and_dirs)
-        finally:
-            macsydata.time.localtime = local_time_ori
+        with self.catch_log(log_name='macsydata'):
+            macsydata.do_init_package(self.args)
+        self.assertInitPackage(self.args.model_package)
+        repo = git.Repo(pack_path)
+        tree = repo.head.commit.tree
+        files_and_dirs = {entry.name for entry in tree}
+        # profiles is empty so not in git
+        # we list only first level so 'definitions/model_example.xml' does not appear
+        self.assertEqual({'COPYRIGHT', 'LICENSE', 'README.md', 'definitions', 'metadata.yml', 'model_conf.xml'},
+                         files_and_dirs)
 
 
     @unittest.skipIf(git is None, "GitPython is not installed")
+    @mock.patch.object(macsydata.time, 'localtime', lambda: FakeTime(2022))
     def test_init_existing_file(self):
-        self.args.model_package = 'init_pack'
-        self.args.maintainer = 'John Doe'
-        self.args.email = 'john.doe@domain.org'
-        self.args.authors = 'Jim Doe, John Doe'
-        self.args.license = 'cc-by-nc-sa'
-        self.args.holders = 'Pasteur'
-        self.args.desc = 'description in one line of this package'
-        self.args.models_dir = self.models_dir[0]
-        self.args.no_clean = False
-        # see above (test_init_package_complete)
-        # why a do a mock for localtime
-        fake_time = namedtuple('FakeTime', ['tm_year'])
-        local_time_ori = macsydata.time.localtime
-        macsydata.time.localtime = lambda: fake_time(2022)
+        self.args = self._mk_init_args()
         pack_path = os.path.join(self.models_dir[0], self.args.model_package)
         open(pack_path, 'w').close()
-        try:
-            with self.catch_log(log_name='macsydata') as log:
-                with self.assertRaises(ValueError):
-                    macsydata.do_init_package(self.args)
-                log_msg = log.get_value().strip()
-                self.assertEqual(log_msg,
-                                 f"{pack_path} already exists and is not a directory.")
-        finally:
-            macsydata.time.localtime = local_time_ori
+        with self.catch_log(log_name='macsydata') as log:
+            with self.assertRaises(ValueError):
+                macsydata.do_init_package(self.args)
+            log_msg = log.get_value().strip()
+        self.assertEqual(log_msg,
+                         f"{pack_path} already exists and is not a directory.")
 
 
     def test_init_no_git(self):
@@ -1892,30 +1396,15 @@ Maybe you can use --user option to install in your HOME.""")
                 raise ModuleNotFoundError()
             return ori_imp(name, *args)
 
-        globals()['__builtins__']['__import__'] = fake_import
-
-        real_exit = sys.exit
-        macsydata.sys.exit = self.fake_exit
+        self.args = self._mk_init_args(model_package='minimal_pack', license=None, holders=None, desc=None,
+                                       tool_name='msl_data')
 
-        self.args.model_package = 'minimal_pack'
-        self.args.maintainer = 'John Doe'
-        self.args.email = 'john.doe@domain.org'
-        self.args.authors = 'Jim Doe, John Doe'
-        self.args.license = None
-        self.args.holders = None
-        self.args.desc = None
-        self.args.models_dir = self.models_dir[0]
-        self.args.no_clean = False
-        self.args.tool_name = 'msl_data'
-
-        try:
+        with mock.patch('builtins.__import__', fake_import), \
+                mock.patch.object(macsydata.sys, 'exit', self.fake_exit):
             with self.catch_log(log_name='macsydata') as log:
                 with self.assertRaises(TypeError):
                     macsydata.do_init_package(self.args)
                 log_msg = log.get_value().strip()
-        finally:
-            globals()['__builtins__']['__import__'] = ori_imp
-            macsydata.sys.exit = real_exit
 
         expected_log = """GitPython is not installed, `msl_data init` is disabled.
 To turn this feature ON:
@@ -1928,8 +1417,7 @@ To turn this feature ON:
     def test_build_argparser(self):
         tool_name = 'msl_data'
         cmd = f"{tool_name} install toto>1"
-        version = f"{tool_name} version message"
-        parser = macsydata.build_arg_parser(macsydata._cmde_line_header(), version)
+        parser = self._parser
         args = parser.parse_args(cmd.split()[1:])
         self.assertEqual(args.func.__name__, 'do_install')
         self.assertEqual(args.model_package, 'toto>1')
@@ -1990,10 +1478,8 @@ To turn this feature ON:
             self.assertEqual(args.email, 'jim.doe@my_domain.com')
 
     def test_cmd_name(self):
-        version = "msl version message"
-        parser = macsydata.build_arg_parser(macsydata._cmde_line_header(), version)
         cmd = "msl_data download foo"
-        args = parser.parse_args(cmd.split()[1:])
+        args = self._parser.parse_args(cmd.split()[1:])
         cmd_name = macsydata.cmd_name(args)
         self.assertEqual(cmd_name, 'msl_data download')
 
@@ -2005,14 +1491,9 @@ To turn this feature ON:
 
     def test_no_subcommand(self):
         cmd = "msl_data"
-        parser = macsydata.build_arg_parser(macsydata._cmde_line_header(),
-                                            'msl_data version message',
-                                            package_name='macsylib', tool_name='msl_data')
         out = io.StringIO()
-        parser.print_help(file=out)
+        self._parser.print_help(file=out)
 
-        with self.catch_io(out=True):
-            macsydata.main(args=cmd.split()[1:])
-            stdout = sys.stdout.getvalue().strip()
+        stdout = self._capture_stdout(macsydata.main, cmd.split()[1:])
         self.assertEqual(stdout,
                          out.getvalue().strip())
@@ -43,27 +43,23 @@ from macsylib.metadata import Maintainer
 from macsylib import model_conf_parser
 from macsylib.error import MacsydataError, MacsyDataLimitError
 
-from tests import MacsyTest
+from tests import MacsyTest, link_file
 
 
 class TestPackageFunc(MacsyTest):
 
     def test_parse_arch_path(self):
-        self.assertTupleEqual(model_package.parse_arch_path("pack-3.0.tar.gz"),
-                              ('pack', '3.0'))
-        self.assertTupleEqual(model_package.parse_arch_path("pack-3.0.tgz"),
-                              ('pack', '3.0'))
+        for path in ("pack-3.0.tar.gz", "pack-3.0.tgz"):
+            with self.subTest(path=path):
+                self.assertTupleEqual(model_package.parse_arch_path(path),
+                                      ('pack', '3.0'))
 
-        pack = "pack-3.0.foo"
-        with self.assertRaises(ValueError) as ctx:
-            model_package.parse_arch_path(pack)
-        self.assertEqual(str(ctx.exception),
-                         f"{pack} does not seem to be a package (a tarball).")
-        pack = "pack.tar.gz"
-        with self.assertRaises(ValueError) as ctx:
-            model_package.parse_arch_path(pack)
-        self.assertEqual(str(ctx.exception),
-                         f"{pack} does not seem to not be versioned.")
+        for path, msg in (("pack-3.0.foo", "pack-3.0.foo does not seem to be a package (a tarball)."),
+                          ("pack.tar.gz", "pack.tar.gz does not seem to not be versioned.")):
+            with self.subTest(path=path):
+                with self.assertRaises(ValueError) as ctx:
+                    model_package.parse_arch_path(path)
+                self.assertEqual(str(ctx.exception), msg)
 
 
     def test_init(self):
@@ -84,135 +80,120 @@ class TestLocalModelIndex(MacsyTest):
         self.assertEqual(lmi.repos_url, 'local')
 
 
+class MockResponse(io.BytesIO):
+    """
+    The response of urllib.request.urlopen mocked for the RemoteModelIndex tests
+    """
+
+    def __init__(self, data, status_code):
+        super().__init__(data)
+        self.status_code = status_code
+
+
+# the body of the responses of the urls mocked for the RemoteModelIndex tests {url: data}
+# they are encoded once at import
+_MOCK_RESPONSES = {url: data.encode("utf-8") for url, data in {
+    'https://test_url_json/': json.dumps({'fake': ['json', 'response']}),
+    'https://api.github.com/orgs/remote_exists_true': json.dumps({'type': 'Organization'}),
+    'https://api.github.com/orgs/list_packages/repos': json.dumps([{'name': 'model_1'},
+                                                                   {'name': 'model_2'},
+                                                                   {'name':'.github'}]),
+    'https://api.github.com/repos/list_package_vers/model_1/tags': json.dumps([{'name': 'v_1'}, {'name': 'v_2'}]),
+    'https://raw.githubusercontent.com/get_metadata/foo/0.0/metadata.yml': yaml.dump({"maintainer": {"name": "moi"}}),
+}.items()}
+
+# the urls mocked for the RemoteModelIndex tests which raise an HTTPError {url: (code, msg)}
+_MOCK_ERRORS = {
+    'https://test_url_json/limit': (403, 'forbidden'),
+    'https://api.github.com/orgs/remote_exists_false': (404, 'not found'),
+    'https://api.github.com/orgs/remote_exists_server_error': (500, 'Server Error'),
+    'https://api.github.com/orgs/remote_exists_unexpected_error': (204, 'No Content'),
+    'https://api.github.com/repos/list_package_vers/model_2/tags': (404, 'not found'),
+    'https://api.github.com/repos/list_package_vers/model_3/tags': (500, 'Server Error'),
+    'https://api.github.com/repos/package_download/bad_pack/tarball/0.2': (404, 'not found'),
+}
+
+
 class TestRemoteModelIndex(MacsyTest):
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # the directories of the tests are removed all at once at the end of the class
+        cls._tmp_root = tempfile.TemporaryDirectory(prefix='test_msl_package_')
+
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmp_root.cleanup()
+
+
     def setUp(self) -> None:
-        self._tmp_dir = tempfile.TemporaryDirectory(prefix='test_msl_package_')
-        self.tmpdir = self._tmp_dir.name
-
-
-    def tearDown(self) -> None:
-        self._tmp_dir.cleanup()
-
-
-    def mocked_requests_get(url: str, context:None=None):
-        # cannot type the return value the class is defined inside de method
-
-        class MockResponse:
-            def __init__(self, data, status_code):
-                self.data = io.BytesIO(bytes(data.encode("utf-8")))
-                self.status_code = status_code
-
-            def read(self, length=-1):
-                return self.data.read(length)
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, type, value, traceback):
-                return False
-
-        if url == 'https://test_url_json/':
-            resp = {'fake': ['json', 'response']}
-            return MockResponse(json.dumps(resp), 200)
-        elif url == 'https://test_url_json/limit':
-            raise urllib.error.HTTPError(url, 403, 'forbidden', None, None)
-        elif url == 'https://api.github.com/orgs/remote_exists_true':
-            resp = {'type': 'Organization'}
-            return MockResponse(json.dumps(resp), 200)
-        elif url == 'https://api.github.com/orgs/remote_exists_false':
-            raise urllib.error.HTTPError(url, 404, 'not found', None, None)
-        elif url == 'https://api.github.com/orgs/remote_exists_server_error':
-            raise urllib.error.HTTPError(url, 500, 'Server Error', None, None)
-        elif url == 'https://api.github.com/orgs/remote_exists_unexpected_error':
-            raise urllib.error.HTTPError(url, 204, 'No Content', None, None)
-        elif url == 'https://api.github.com/orgs/list_packages/repos':
-            resp = [{'name': 'model_1'}, {'name': 'model_2'}, {'name':'.github'}]
-            return MockResponse(json.dumps(resp), 200)
-        elif url == 'https://api.github.com/repos/list_package_vers/model_1/tags':
-            resp = [{'name': 'v_1'}, {'name': 'v_2'}]
-            return MockResponse(json.dumps(resp), 200)
-        elif url == 'https://api.github.com/repos/list_package_vers/model_2/tags':
-            raise urllib.error.HTTPError(url, 404, 'not found', None, None)
-        elif url == 'https://api.github.com/repos/list_package_vers/model_3/tags':
-            raise urllib.error.HTTPError(url, 500, 'Server Error', None, None)
+        self.tmpdir = tempfile.mkdtemp(dir=self._tmp_root.name)
+
+
+    def mocked_requests_get(url: str, context:None=None) -> MockResponse:
+        if url in _MOCK_ERRORS:
+            code, msg = _MOCK_ERRORS[url]
+            raise urllib.error.HTTPError(url, code, msg, None, None)
+        elif url in _MOCK_RESPONSES:
+            return MockResponse(_MOCK_RESPONSES[url], 200)
         elif 'https://api.github.com/repos/package_download/fake/tarball/1.0' in url:
-            return MockResponse('fake data ' * 2, 200)
-        elif url == 'https://api.github.com/repos/package_download/bad_pack/tarball/0.2':
-            raise urllib.error.HTTPError(url, 404, 'not found', None, None)
-        elif url == 'https://raw.githubusercontent.com/get_metadata/foo/0.0/metadata.yml':
-            data = yaml.dump({"maintainer": {"name": "moi"}})
-            return MockResponse(data, 200)
+            return MockResponse(b'fake data ' * 2, 200)
         else:
             raise RuntimeError("test non prevu", url)
 
 
+    def mocked_url_json(self, url: str) -> dict:
+        # stand for RemoteModelIndex._url_json for the tests which do not exercise urllib itself
+        if url in _MOCK_ERRORS:
+            code, msg = _MOCK_ERRORS[url]
+            raise urllib.error.HTTPError(url, code, msg, None, None)
+        return json.loads(_MOCK_RESPONSES[url])
+
+
+    @patch.object(model_package.RemoteModelIndex, 'remote_exists', lambda x: True)
     def test_init(self):
-        rem_exists = model_package.RemoteModelIndex.remote_exists
-        model_package.RemoteModelIndex.remote_exists = lambda x: True
-        try:
-            remote = model_package.RemoteModelIndex()
-            remote.cache = self.tmpdir
-        finally:
-            model_package.RemoteModelIndex.remote_exists = rem_exists
+        remote = model_package.RemoteModelIndex()
+        remote.cache = self.tmpdir
         self.assertEqual(remote.org_name, 'macsy-models')
         self.assertEqual(remote.base_url, 'https://api.github.com')
         self.assertEqual(remote.cache, self.tmpdir)
 
-        model_package.RemoteModelIndex.remote_exists = lambda x: True
-        try:
-            remote = model_package.RemoteModelIndex(org='foo')
-            remote.cache = self.tmpdir
-        finally:
-            model_package.RemoteModelIndex.remote_exists = rem_exists
+        remote = model_package.RemoteModelIndex(org='foo')
+        remote.cache = self.tmpdir
         self.assertEqual(remote.org_name, 'foo')
 
-        model_package.RemoteModelIndex.remote_exists = lambda x: False
-        try:
+        with patch.object(model_package.RemoteModelIndex, 'remote_exists', lambda x: False):
             with self.assertRaises(ValueError) as ctx:
                 model_package.RemoteModelIndex(org='foo')
-        finally:
-            model_package.RemoteModelIndex.remote_exists = rem_exists
         self.assertEqual(str(ctx.exception), "the 'foo' organization does not exist.")
 
 
+    @patch.object(model_package.RemoteModelIndex, 'remote_exists', lambda x: True)
     def test_repos_url(self):
-        rem_exists = model_package.RemoteModelIndex.remote_exists
-        model_package.RemoteModelIndex.remote_exists = lambda x: True
-        try:
-            org = "package_repos_url"
-            remote = model_package.RemoteModelIndex(org=org)
-            self.assertEqual(remote.repos_url, f"https://github.com/{org}")
-        finally:
-            rem_exists
+        org = "package_repos_url"
+        remote = model_package.RemoteModelIndex(org=org)
+        self.assertEqual(remote.repos_url, f"https://github.com/{org}")
 
     @patch('urllib.request.urlopen', side_effect=mocked_requests_get)
+    @patch.object(model_package.RemoteModelIndex, 'remote_exists', lambda x: True)
     def test_url_json(self, mock_urlopen):
-        rem_exists = model_package.RemoteModelIndex.remote_exists
-        model_package.RemoteModelIndex.remote_exists = lambda x: True
         remote = model_package.RemoteModelIndex(org="nimportnaoik")
         remote.cache = self.tmpdir
-        try:
-            j = remote._url_json("https://test_url_json/")
-            self.assertDictEqual(j, {'fake': ['json', 'response']})
-        finally:
-            model_package.RemoteModelIndex.remote_exists = rem_exists
+        j = remote._url_json("https://test_url_json/")
+        self.assertDictEqual(j, {'fake': ['json', 'response']})
 
 
     @patch('urllib.request.urlopen', side_effect=mocked_requests_get)
+    @patch.object(model_package.RemoteModelIndex, 'remote_exists', lambda x: True)
     def test_url_json_reach_limit(self, mock_urlopen):
-        rem_exists = model_package.RemoteModelIndex.remote_exists
-        model_package.RemoteModelIndex.remote_exists = lambda x: True
         remote = model_package.RemoteModelIndex(org="nimportnaoik")
         remote.cache = self.tmpdir
-        try:
-            with self.assertRaises(MacsyDataLimitError) as ctx:
-                remote._url_json("https://test_url_json/limit")
-            self.assertEqual(str(ctx.exception),
-                             """You reach the maximum number of request per hour to github.
+        with self.assertRaises(MacsyDataLimitError) as ctx:
+            remote._url_json("https://test_url_json/limit")
+        self.assertEqual(str(ctx.exception),
+                         """You reach the maximum number of request per hour to github.
 Please wait before to try again.""")
-        finally:
-            model_package.RemoteModelIndex.remote_exists = rem_exists
 
 
     @patch('urllib.request.urlopen', side_effect=mocked_requests_get)
@@ -239,74 +220,50 @@ Please wait before to try again.""")
                          "HTTP Error 204: No Content")
 
     @patch('urllib.request.urlopen', side_effect=mocked_requests_get)
+    @patch.object(model_package.RemoteModelIndex, 'remote_exists', lambda x: True)
     def test_get_metadata(self, mock_urlopen):
-        rem_exists = model_package.RemoteModelIndex.remote_exists
-        list_package_vers = model_package.RemoteModelIndex.list_package_vers
-        try:
-            vers = '0.0'
-            pack_name = 'foo'
-            model_package.RemoteModelIndex.remote_exists = lambda x: True
-            model_package.RemoteModelIndex.list_package_vers = lambda x, pack_name: [vers]
+        vers = '0.0'
+        pack_name = 'foo'
+        with patch.object(model_package.RemoteModelIndex, 'list_package_vers', lambda x, pack_name: [vers]):
             remote = model_package.RemoteModelIndex(org="get_metadata")
             remote.cache = self.tmpdir
             metadata = remote.get_metadata(pack_name)
-            self.assertDictEqual(metadata, {"maintainer": {"name": "moi"}})
-        finally:
-            model_package.RemoteModelIndex.remote_exists = rem_exists
-            model_package.RemoteModelIndex.list_package_vers = list_package_vers
+        self.assertDictEqual(metadata, {"maintainer": {"name": "moi"}})
 
         #################################################
         # The remote package is not versioned (tagged)  #
         #################################################
-        try:
-            model_package.RemoteModelIndex.remote_exists = lambda x: True
-            model_package.RemoteModelIndex.list_package_vers = lambda x, pack_name: []
+        with patch.object(model_package.RemoteModelIndex, 'list_package_vers', lambda x, pack_name: []):
             remote = model_package.RemoteModelIndex(org="get_metadata")
             with self.assertRaises(MacsydataError) as ctx:
                 remote.get_metadata(pack_name)
-            self.assertEqual(str(ctx.exception),
-                             "No official version available for model 'foo'")
-        finally:
-            model_package.RemoteModelIndex.remote_exists = rem_exists
-            model_package.RemoteModelIndex.list_package_vers = list_package_vers
+        self.assertEqual(str(ctx.exception),
+                         "No official version available for model 'foo'")
 
         #####################################
         # The pack version is not available #
         #####################################
-        try:
-            model_package.RemoteModelIndex.remote_exists = lambda x: True
-            model_package.RemoteModelIndex.list_package_vers = lambda x, pack_name: ["12"]
+        with patch.object(model_package.RemoteModelIndex, 'list_package_vers', lambda x, pack_name: ["12"]):
             remote = model_package.RemoteModelIndex(org="get_metadata")
             with self.assertRaises(RuntimeError) as ctx:
                 remote.get_metadata(pack_name, vers="1.1")
-            self.assertEqual(str(ctx.exception),
-                             "The version '1.1' does not exists for model foo.")
-        finally:
-            model_package.RemoteModelIndex.remote_exists = rem_exists
-            model_package.RemoteModelIndex.list_package_vers = list_package_vers
+        self.assertEqual(str(ctx.exception),
+                         "The version '1.1' does not exists for model foo.")
 
 
-    @patch('urllib.request.urlopen', side_effect=mocked_requests_get)
-    def test_list_packages(self, mock_urlopen):
-        rem_exists = model_package.RemoteModelIndex.remote_exists
-        try:
-            model_package.RemoteModelIndex.remote_exists = lambda x: True
-            remote = model_package.RemoteModelIndex(org="list_packages")
-            remote.cache = self.tmpdir
-            self.assertListEqual(remote.list_packages(), ['model_1', 'model_2'])
-        finally:
-            model_package.RemoteModelIndex.remote_exists = rem_exists
+    @patch.object(model_package.RemoteModelIndex, '_url_json', mocked_url_json)
+    @patch.object(model_package.RemoteModelIndex, 'remote_exists', lambda x: True)
+    def test_list_packages(self):
+        remote = model_package.RemoteModelIndex(org="list_packages")
+        remote.cache = self.tmpdir
+        self.assertListEqual(remote.list_packages(), ['model_1', 'model_2'])
 
 
-    @patch('urllib.request.urlopen', side_effect=mocked_requests_get)
-    def test_list_package_vers(self, mock_urlopen):
-        rem_exists = model_package.RemoteModelIndex.remote_exists
-        try:
-            model_package.RemoteModelIndex.remote_exists = lambda x: True
-            remote = model_package.RemoteModelIndex(org="list_package_vers")
-            remote.cache = self.tmpdir
-        finally:
-            model_package.RemoteModelIndex.remote_exists = rem_exists
+    @patch.object(model_package.RemoteModelIndex, '_url_json', mocked_url_json)
+    @patch.object(model_package.RemoteModelIndex, 'remote_exists', lambda x: True)
+    def test_list_package_vers(self):
+        remote = model_package.RemoteModelIndex(org="list_package_vers")
+        remote.cache = self.tmpdir
 
         self.assertListEqual(remote.list_package_vers('model_1'), ['v_1', 'v_2'])
 
@@ -320,132 +277,190 @@ Please wait before to try again.""")
 
 
     @patch('urllib.request.urlopen', side_effect=mocked_requests_get)
+    @patch.object(model_package.RemoteModelIndex, 'remote_exists', lambda x: True)
     def test_download(self, mock_urlopen):
-        rem_exists = model_package.RemoteModelIndex.remote_exists
-        try:
-            model_package.RemoteModelIndex.remote_exists = lambda x: True
-            remote = model_package.RemoteModelIndex(org="package_download")
-            remote.cache = self.tmpdir
-            pack_name = "fake"
-            pack_vers = "1.0"
-            # ensure that remote.cache does not exists
-            if os.path.exists(remote.cache):
-                if os.path.isdir(remote.cache):
-                    shutil.rmtree(remote.cache)
-                elif os.path.isfile(remote.cache) or os.path.islink(remote.cache):
-                    os.unlink(remote.cache)
-
-            arch_path = remote.download(pack_name, pack_vers)
-            self.assertEqual(os.path.join(remote.cache, remote.org_name, f"{pack_name}-{pack_vers}.tar.gz"),
-                             arch_path)
-            self.assertFileEqual(arch_path, io.StringIO('fake data ' * 2))
-
-            # download again with existing remote.cache and replace old archive
-            os.unlink(arch_path)
-            arch_path = remote.download(pack_name, pack_vers)
-            self.assertFileEqual(arch_path, io.StringIO('fake data ' * 2))
-
-            # download again with existing remote.cache and replace old archive
-            os.unlink(arch_path)
-            dest = os.path.join(self.tmpdir, 'dest')
-            os.makedirs(dest)
-            arch_path = remote.download(pack_name, pack_vers, dest=dest)
-            self.assertEqual(os.path.join(dest, f'{pack_name}-{pack_vers}.tar.gz'), arch_path)
-
-            # remote cache exist and is a file
-            shutil.rmtree(remote.cache)
-            open(remote.cache, 'w').close()
-            try:
-                with self.assertRaises(NotADirectoryError) as ctx:
-                    remote.download(pack_name, pack_vers)
-                self.assertEqual(str(ctx.exception),
-                                 f"The tmp cache '{remote.cache}' already exists")
-            finally:
+        remote = model_package.RemoteModelIndex(org="package_download")
+        remote.cache = self.tmpdir
+        pack_name = "fake"
+        pack_vers = "1.0"
+        # ensure that remote.cache does not exists
+        if os.path.exists(remote.cache):
+            if os.path.isdir(remote.cache):
+                shutil.rmtree(remote.cache)
+            elif os.path.isfile(remote.cache) or os.path.islink(remote.cache):
                 os.unlink(remote.cache)
 
-            with self.assertRaises(ValueError) as ctx:
-                _ = remote.download("bad_pack", "0.2")
+        arch_path = remote.download(pack_name, pack_vers)
+        self.assertEqual(os.path.join(remote.cache, remote.org_name, f"{pack_name}-{pack_vers}.tar.gz"),
+                         arch_path)
+        self.assertFileEqual(arch_path, io.StringIO('fake data ' * 2))
+
+        # download again with existing remote.cache and replace old archive
+        os.unlink(arch_path)
+        arch_path = remote.download(pack_name, pack_vers)
+        self.assertFileEqual(arch_path, io.StringIO('fake data ' * 2))
+
+        # download again with existing remote.cache and replace old archive
+        os.unlink(arch_path)
+        dest = os.path.join(self.tmpdir, 'dest')
+        os.makedirs(dest)
+        arch_path = remote.download(pack_name, pack_vers, dest=dest)
+        self.assertEqual(os.path.join(dest, f'{pack_name}-{pack_vers}.tar.gz'), arch_path)
+
+        # remote cache exist and is a file
+        shutil.rmtree(remote.cache)
+        open(remote.cache, 'w').close()
+        try:
+            with self.assertRaises(NotADirectoryError) as ctx:
+                remote.download(pack_name, pack_vers)
             self.assertEqual(str(ctx.exception),
-                             "package 'bad_pack-0.2' does not exists on repos 'package_download'")
+                             f"The tmp cache '{remote.cache}' already exists")
         finally:
-            model_package.RemoteModelIndex.remote_exists = rem_exists
+            os.unlink(remote.cache)
+
+        with self.assertRaises(ValueError) as ctx:
+            _ = remote.download("bad_pack", "0.2")
+        self.assertEqual(str(ctx.exception),
+                         "package 'bad_pack-0.2' does not exists on repos 'package_download'")
 
 
+    @patch.object(model_package.RemoteModelIndex, 'remote_exists', lambda x: True)
     def test_unarchive(self):
 
         def create_pack(dir_, repo, name, vers, key):
             pack_name = f"{name}-{vers}"
             tar_path = os.path.join(dir_, f"{pack_name}.tar.gz")
-            with tarfile.open(tar_path, "w:gz") as tar:
-                tmp_pack = os.path.join(dir_, f"{repo}-{name}-{key}")
-                os.mkdir(tmp_pack)
+            # the archive is built in memory, the files of the package are never written on disk
+            # unarchive_package opens the archive in 'r:gz' mode so it must be gzipped, but it is not compressed
+            arch = io.BytesIO()
+            with tarfile.open(fileobj=arch, mode="w:gz", compresslevel=0) as tar:
+                root = f"{repo}-{name}-{key}"
+                info = tarfile.TarInfo(root)
+                info.type = tarfile.DIRTYPE
+                info.mode = 0o755
+                tar.addfile(info)
                 for i in range(3):
-                    name = f"file_{i}"
-                    tmp_file = os.path.join(tmp_pack, name)
-                    with open(tmp_file, 'w') as f:
-                        f.write(f"Content of file {i}\n")
-                tar.add(tmp_pack, arcname=os.path.basename(tmp_pack))
-            shutil.rmtree(tmp_pack)
+                    content = f"Content of file {i}\n".encode()
+                    info = tarfile.TarInfo(f"{root}/file_{i}")
+                    info.size = len(content)
+                    info.mode = 0o644
+                    tar.addfile(info, io.BytesIO(content))
+            with open(tar_path, 'wb') as tar_file:
+                tar_file.write(arch.getvalue())
             return tar_path
 
         pack_name = 'model-toto'
         pack_vers = '2.0'
 
-        rem_exists = model_package.RemoteModelIndex.remote_exists
-        model_package.RemoteModelIndex.remote_exists = lambda x: True
-        try:
-            remote = model_package.RemoteModelIndex(org="package_unarchive")
-            arch = create_pack(self.tmpdir, remote.org_name, pack_name, pack_vers, 'e020300')
-            remote.cache = self.tmpdir
+        remote = model_package.RemoteModelIndex(org="package_unarchive")
+        arch = create_pack(self.tmpdir, remote.org_name, pack_name, pack_vers, 'e020300')
+        remote.cache = self.tmpdir
 
-            model_path = remote.unarchive_package(arch)
-            unpacked_path = os.path.join(self.tmpdir, remote.org_name, pack_name, pack_vers, pack_name)
-            self.assertEqual(model_path, unpacked_path)
-            self.assertTrue(os.path.exists(unpacked_path))
-            self.assertTrue(os.path.isdir(unpacked_path))
-            self.assertListEqual(sorted(glob.glob(f"{unpacked_path}/*")),
-                                 sorted([os.path.join(unpacked_path, f"file_{i}") for i in range(3)])
-                                 )
-            # test package is remove before to unarchive a new one
-            open(os.path.join(unpacked_path, "file_must_be_removed"), 'w').close()
-            model_path = remote.unarchive_package(arch)
-            self.assertListEqual(sorted(glob.glob(f"{unpacked_path}/*")),
-                                 sorted([os.path.join(unpacked_path, f"file_{i}") for i in range(3)])
-                                 )
-        finally:
-            model_package.RemoteModelIndex.remote_exists = rem_exists
+        model_path = remote.unarchive_package(arch)
+        unpacked_path = os.path.join(self.tmpdir, remote.org_name, pack_name, pack_vers, pack_name)
+        self.assertEqual(model_path, unpacked_path)
+        self.assertTrue(os.path.exists(unpacked_path))
+        self.assertTrue(os.path.isdir(unpacked_path))
+        self.assertListEqual(sorted(glob.glob(f"{unpacked_path}/*")),
+                             sorted([os.path.join(unpacked_path, f"file_{i}") for i in range(3)])
+                             )
+        # test package is remove before to unarchive a new one
+        open(os.path.join(unpacked_path, "file_must_be_removed"), 'w').close()
+        model_path = remote.unarchive_package(arch)
+        self.assertListEqual(sorted(glob.glob(f"{unpacked_path}/*")),
+                             sorted([os.path.join(unpacked_path, f"file_{i}") for i in range(3)])
+                             )
 
 
 class TestModelPackage(MacsyTest):
 
-    def setUp(self) -> None:
-        self._tmp_dir = tempfile.TemporaryDirectory(prefix='test_msl_package_')
-        self.tmpdir = self._tmp_dir.name
+    # the content of the files of the fake packages, the same for all tests
+    # they are written as bytes to skip the encoding at each package creation
+    _model_1_bytes = b"""<model inter_gene_max_space="20" min_mandatory_genes_required="1" min_genes_required="2" vers="2.0">
+    <gene name="flgB" presence="mandatory"/>
+    <gene name="flgC" presence="mandatory" inter_gene_max_space="2"/>
+</model>"""
+    _model_2_bytes = b"""<model inter_gene_max_space="20" min_mandatory_genes_required="1" min_genes_required="2" vers="2.0">
+    <gene name="fliE" presence="mandatory" multi_system="True"/>
+    <gene name="tadZ" presence="accessory" loner="True"/>
+    <gene name="sctC" presence="forbidden"/>
+</model>"""
+    _bad_model_bytes = b"""<model inter_gene_max_space="20" min_mandatory_genes_required="2" min_genes_required="1" vers="2.0">
+    <gene name="flgB" presence="mandatory"/>
+    <gene name="flgC" presence="mandatory" inter_gene_max_space="2"/>
+</model>"""
+    _readme_bytes = b"# This a README\n"
+    _license_bytes = b"# This the License\n"
+    _model_conf_bytes = b"""<model_config>
+    <weights>
+        <itself>11</itself>
+        <exchangeable>12</exchangeable>
+        <mandatory>13</mandatory>
+        <accessory>14</accessory>
+        <neutral>0</neutral>
+        <out_of_cluster>10</out_of_cluster>
+    </weights>
+    <filtering>
+        <e_value_search>0.12</e_value_search>
+        <i_evalue_sel>0.012</i_evalue_sel>
+        <coverage_profile>0.55</coverage_profile>
+        <cut_ga>False</cut_ga>
+    </filtering>
+</model_config>
+"""
+    _bad_model_conf_bytes = b"""<model_config>
+    <weights>
+        <itself>FOO</itself>
+        <exchangeable>BAR</exchangeable>
+    </weights>
+</model_config>
+"""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # the directories of the tests are removed all at once at the end of the class
+        cls._tmp_root = tempfile.TemporaryDirectory(prefix='test_msl_package_')
+        # the fake packages templates built by create_fake_package, {options: path}
+        cls._templates = {}
+        # the serialized metadata of the templates, {(metadata file, vers): yaml}
+        cls._metadata_bytes = {}
+        # the profiles of the fake packages {name: path}
+        cls._hmm_srcs = {name: cls.find_data('models', 'foo', 'profiles', f'{name}.hmm')
+                         for name in ('flgB', 'flgC', 'fliE', 'tadZ', 'sctC')}
+        # the logger is set once for all tests
         macsylib.init_logger()
         macsylib.logger_set_level(level=30)
-        logger = colorlog.getLogger('macsylib.package')
-        model_package._log = logger
-        logger = colorlog.getLogger('macsylib.model_conf_parser')
-        model_conf_parser._log = logger
+        # the loggers are replaced only during the tests of this class
+        # so the other tests (maybe run in the same process by pytest-xdist) are not affected
+        for module, log_name in ((model_package, 'macsylib.package'),
+                                 (model_conf_parser, 'macsylib.model_conf_parser')):
+            log_patcher = patch.object(module, '_log', colorlog.getLogger(log_name))
+            log_patcher.start()
+            cls.addClassCleanup(log_patcher.stop)
+        # the metadata expected in the fake packages, it is only read by the tests
         maintainer = Maintainer("auth_name", "auth_name@mondomain.fr")
-        self.metadata = model_package.Metadata(maintainer,
-                                         "this is a short description of the repos")
-        self.metadata.vers = "0.0b2"
-        self.metadata.cite = ["bla bla",
-                                  "link to publication",
-                                  """ligne 1
+        cls.metadata = model_package.Metadata(maintainer,
+                                              "this is a short description of the repos")
+        cls.metadata.vers = "0.0b2"
+        cls.metadata.cite = ["bla bla",
+                             "link to publication",
+                             """ligne 1
 ligne 2
 ligne 3 et bbbbb
 """]
-        self.metadata.doc = "http://link/to/the/documentation"
-        self.metadata.license = "CC BY-NC-SA 4.0 (https://creativecommons.org/licenses/by-nc-sa/4.0/)"
-        self.metadata.copyright_date = "2019"
-        self.metadata.copyright_holder = "Institut Pasteur, CNRS"
+        cls.metadata.doc = "http://link/to/the/documentation"
+        cls.metadata.license = "CC BY-NC-SA 4.0 (https://creativecommons.org/licenses/by-nc-sa/4.0/)"
+        cls.metadata.copyright_date = "2019"
+        cls.metadata.copyright_holder = "Institut Pasteur, CNRS"
 
 
-    def tearDown(self) -> None:
-        self._tmp_dir.cleanup()
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmp_root.cleanup()
+
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.mkdtemp(dir=self._tmp_root.name)
 
 
     def create_fake_package(self, model,
@@ -460,83 +475,63 @@ ligne 3 et bbbbb
                             vers=True,
                             bad_conf=False):
         pack_path = os.path.join(self.tmpdir, model)
-        os.mkdir(pack_path)
+        # the content of a fake package does not depend on its name
+        # so each variant is built once in a template and the packages are hard linked on it
+        options = (definitions, bad_definitions, profiles, tuple(skip_hmm or ()), metadata,
+                   readme, license, conf, vers, bad_conf)
+        template = self._templates.get(options)
+        if template is None:
+            template = os.path.join(self._tmp_root.name, 'templates', str(len(self._templates)))
+            self._build_fake_package(template, *options)
+            self._templates[options] = template
+        shutil.copytree(template, pack_path, copy_function=link_file)
+        return pack_path
+
+
+    def _build_fake_package(self, pack_path, definitions, bad_definitions, profiles, skip_hmm, metadata,
+                            readme, license, conf, vers, bad_conf):
+        os.makedirs(pack_path)
         if definitions:
             def_dir = os.path.join(pack_path, 'definitions')
             os.mkdir(def_dir)
-            with open(os.path.join(def_dir, "model_1.xml"), 'w') as f:
-                f.write("""<model inter_gene_max_space="20" min_mandatory_genes_required="1" min_genes_required="2" vers="2.0">
-    <gene name="flgB" presence="mandatory"/>
-    <gene name="flgC" presence="mandatory" inter_gene_max_space="2"/>
-</model>""")
-            with open(os.path.join(def_dir, "model_2.xml"), 'w') as f:
-                f.write("""<model inter_gene_max_space="20" min_mandatory_genes_required="1" min_genes_required="2" vers="2.0">
-    <gene name="fliE" presence="mandatory" multi_system="True"/>
-    <gene name="tadZ" presence="accessory" loner="True"/>
-    <gene name="sctC" presence="forbidden"/>
-</model>""")
+            with open(os.path.join(def_dir, "model_1.xml"), 'wb') as f:
+                f.write(self._model_1_bytes)
+            with open(os.path.join(def_dir, "model_2.xml"), 'wb') as f:
+                f.write(self._model_2_bytes)
         if bad_definitions:
-            with open(os.path.join(def_dir, "model_3.xml"), 'w') as f:
-                f.write("""<model inter_gene_max_space="20" min_mandatory_genes_required="2" min_genes_required="1" vers="2.0">
-    <gene name="flgB" presence="mandatory"/>
-    <gene name="flgC" presence="mandatory" inter_gene_max_space="2"/>
-</model>""")
+            with open(os.path.join(def_dir, "model_3.xml"), 'wb') as f:
+                f.write(self._bad_model_bytes)
         if profiles:
             profile_dir = os.path.join(pack_path, 'profiles')
             os.mkdir(profile_dir)
-            for name in ('flgB', 'flgC', 'fliE', 'tadZ', 'sctC'):
+            for name, hmm_src in self._hmm_srcs.items():
                 if skip_hmm and name in skip_hmm:
                     continue
-                shutil.copyfile(self.find_data('models', 'foo', 'profiles', f'{name}.hmm'),
-                                os.path.join(profile_dir, f"{name}.hmm")
-                                )
+                link_file(hmm_src, os.path.join(profile_dir, f"{name}.hmm"))
         if metadata:
-            meta_path = self.find_data('pack_metadata', metadata)
-            meta_dest = os.path.join(pack_path, model_package.Metadata.name)
-            with open(meta_path) as meta_file:
-                meta = yaml.safe_load(meta_file)
-            if not vers:
-                meta['vers'] = None
-            with open(meta_dest, 'w') as meta_file:
-                yaml.dump(meta, meta_file,allow_unicode=True, indent=2)
+            # several variants share the same metadata, so the yaml is loaded and dumped once per metadata
+            meta_bytes = self._metadata_bytes.get((metadata, vers))
+            if meta_bytes is None:
+                with open(self.find_data('pack_metadata', metadata)) as meta_file:
+                    meta = yaml.safe_load(meta_file)
+                if not vers:
+                    meta['vers'] = None
+                meta_bytes = yaml.dump(meta, allow_unicode=True, indent=2).encode('utf-8')
+                self._metadata_bytes[(metadata, vers)] = meta_bytes
+            with open(os.path.join(pack_path, model_package.Metadata.name), 'wb') as meta_file:
+                meta_file.write(meta_bytes)
         if readme:
-            with open(os.path.join(pack_path, "README"), 'w') as f:
-                f.write("# This a README\n")
+            with open(os.path.join(pack_path, "README"), 'wb') as f:
+                f.write(self._readme_bytes)
         if license:
-            with open(os.path.join(pack_path, "LICENSE"), 'w') as f:
-                f.write("# This the License\n")
+            with open(os.path.join(pack_path, "LICENSE"), 'wb') as f:
+                f.write(self._license_bytes)
         if conf:
-            with open(os.path.join(pack_path, "model_conf.xml"), 'w') as f:
-                conf = """<model_config>
-    <weights>
-        <itself>11</itself>
-        <exchangeable>12</exchangeable>
-        <mandatory>13</mandatory>
-        <accessory>14</accessory>
-        <neutral>0</neutral>
-        <out_of_cluster>10</out_of_cluster>
-    </weights>
-    <filtering>
-        <e_value_search>0.12</e_value_search>
-        <i_evalue_sel>0.012</i_evalue_sel>
-        <coverage_profile>0.55</coverage_profile>
-        <cut_ga>False</cut_ga>
-    </filtering>
-</model_config>
-"""
-                f.write(conf)
+            with open(os.path.join(pack_path, "model_conf.xml"), 'wb') as f:
+                f.write(self._model_conf_bytes)
         elif bad_conf:
-            with open(os.path.join(pack_path, "model_conf.xml"), 'w') as f:
-                conf = """<model_config>
-    <weights>
-        <itself>FOO</itself>
-        <exchangeable>BAR</exchangeable>
-    </weights>
-</model_config>
-"""
-                f.write(conf)
-
-        return pack_path
+            with open(os.path.join(pack_path, "model_conf.xml"), 'wb') as f:
+                f.write(self._bad_model_conf_bytes)
 
 
     def test_init(self):
@@ -615,60 +610,36 @@ ligne 3 et bbbbb
         self.assertListEqual(warnings, [])
 
 
-    def test_check_structure_no_def(self):
-        fake_pack_path = self.create_fake_package('fake_model', definitions=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_structure()
-
-        self.assertListEqual(errors, ["The model package 'fake_model' have no 'definitions' directory."])
-        self.assertListEqual(warnings, [])
-
-        open(os.path.join(pack.path, 'definitions'), 'w').close()
-        errors, warnings = pack._check_structure()
-        self.assertListEqual(errors, [f"'{os.path.join(self.tmpdir, 'fake_model', 'definitions')}' is not a directory."])
-        self.assertListEqual(warnings, [])
-
-
-    def test_check_structure_no_profiles(self):
-        fake_pack_path = self.create_fake_package('fake_model', profiles=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_structure()
-
-        self.assertListEqual(errors, ["The model package 'fake_model' have no 'profiles' directory."])
-        self.assertListEqual(warnings, [])
-
-        open(os.path.join(pack.path, 'profiles'), 'w').close()
-        errors, warnings = pack._check_structure()
-        self.assertListEqual(errors, [f"'{os.path.join(self.tmpdir, 'fake_model', 'profiles')}' is not a directory."])
-        self.assertListEqual(warnings, [])
-
-
-    def test_check_structure_no_metadata(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='')
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_structure()
-
-        self.assertListEqual(errors, ["The model package 'fake_model' have no 'metadata.yml'."])
-        self.assertListEqual(warnings, [])
-
-
-    def test_check_structure_no_readme(self):
-        fake_pack_path = self.create_fake_package('fake_model', readme=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_structure()
-
-        self.assertEqual(errors, [])
-        self.assertEqual(warnings, ["The model package 'fake_model' have not any README file."])
-
-
-    def test_check_structure_no_license(self):
-        fake_pack_path = self.create_fake_package('fake_model', license=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_structure()
-
-        self.assertEqual(errors, [])
-        self.assertEqual(warnings, ["The model package 'fake_model' have not any LICENSE file. "
-                                    "May be you have not right to use it."])
+    def test_check_structure_missing(self):
+        # (options of the fake package, expected errors, expected warnings, entry to replace by a file)
+        cases = [({'definitions': False}, ["The model package 'fake_model' have no 'definitions' directory."], [],
+                  'definitions'),
+                 ({'profiles': False}, ["The model package 'fake_model' have no 'profiles' directory."], [],
+                  'profiles'),
+                 ({'metadata': ''}, ["The model package 'fake_model' have no 'metadata.yml'."], [], None),
+                 ({'readme': False}, [], ["The model package 'fake_model' have not any README file."], None),
+                 ({'license': False}, [], ["The model package 'fake_model' have not any LICENSE file. "
+                                           "May be you have not right to use it."], None),
+                 ]
+        for overrides, exp_errors, exp_warnings, not_a_dir in cases:
+            with self.subTest(**overrides):
+                fake_pack_path = self.create_fake_package('fake_model', **overrides)
+                try:
+                    pack = model_package.ModelPackage(fake_pack_path)
+                    errors, warnings = pack._check_structure()
+                    self.assertListEqual(errors, exp_errors)
+                    self.assertListEqual(warnings, exp_warnings)
+
+                    if not_a_dir:
+                        open(os.path.join(pack.path, not_a_dir), 'w').close()
+                        errors, warnings = pack._check_structure()
+                        self.assertListEqual(errors,
+                                             [f"'{os.path.join(self.tmpdir, 'fake_model', not_a_dir)}' "
+                                              f"is not a directory."])
+                        self.assertListEqual(warnings, [])
+                finally:
+                    # the packages are hard links on the templates, removing them is cheap
+                    shutil.rmtree(fake_pack_path)
 
 
     def test_check_model_consistency(self):
@@ -699,10 +670,9 @@ ligne 3 et bbbbb
             errors, warnings = pack._check_model_consistency()
 
         self.assertEqual(warnings, [])
-        self.assertSetEqual(set(errors),
-                            set(["'fake_model/flgB': No such profile",
-                                 "'fake_model/fliE': No such profile"])
-                            )
+        self.assertListEqual(sorted(errors),
+                             ["'fake_model/flgB': No such profile",
+                              "'fake_model/fliE': No such profile"])
 
 
     def test_check_model_consistency_bad_definitions(self):
@@ -732,83 +702,42 @@ ligne 3 et bbbbb
         self.assertEqual(errors, [])
         self.assertEqual(warnings, [])
 
-    def test_check_metadata_no_maintainer(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='metadata_no_maintainer.yml', vers=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_metadata()
-        self.assertListEqual(errors, [f"- The metadata file '{fake_pack_path}/metadata.yml' is not valid: "
-                                      f"the element 'maintainer' is required."])
-        self.assertListEqual(warnings, [])
-
-    def test_check_metadata_no_name(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='metadata_no_name.yml', vers=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_metadata()
-        self.assertListEqual(errors, [f"- The metadata file '{fake_pack_path}/metadata.yml' is not valid: "
-                                                "the element 'maintainer' must have fields 'name' and 'email'."])
-        self.assertListEqual(warnings, [])
-
-    def test_check_metadata_no_email(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='metadata_no_email.yml', vers=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_metadata()
-        self.assertListEqual(errors, [f"- The metadata file '{fake_pack_path}/metadata.yml' is not valid: "
-                                                "the element 'maintainer' must have fields 'name' and 'email'."])
-        self.assertListEqual(warnings, [])
-
-    def test_check_metadata_no_desc(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='metadata_no_desc.yml', vers=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_metadata()
-        self.assertEqual(errors, [f"- The metadata file '{fake_pack_path}/metadata.yml' is not valid: "
-                                  f"the element 'short_desc' is required."])
-        self.assertEqual(warnings, [])
-
-
-    def test_check_metadata_no_vers(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='metadata_no_vers.yml')
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_metadata()
-        self.assertEqual(errors, [])
-        self.assertEqual(warnings, [])
-
-    def test_check_metadata_with_vers(self):
-        fake_pack_path = self.create_fake_package('fake_model')
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_metadata()
-        self.assertEqual(errors, [])
-        self.assertEqual(warnings, ["The field 'vers' is not required anymore."
-                                    "\n  It will be ignored and set by macsydata during installation phase according"
-                                    " to the git tag."])
-
-    def test_check_metadata_no_cite(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='metadata_no_cite.yml', vers=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_metadata()
-        self.assertEqual(errors, [])
-        self.assertEqual(warnings, [f"It's better if the field 'cite' is setup in '{fake_pack_path}/metadata.yml' file."])
-
-
-    def test_check_metadata_no_doc(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='metadata_no_doc.yml', vers=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_metadata()
-        self.assertEqual(errors, [])
-        self.assertEqual(warnings, [f"It's better if the field 'doc' is setup in '{fake_pack_path}/metadata.yml' file."])
-
-    def test_check_metadata_no_license(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='metadata_no_license.yml', vers=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_metadata()
-        self.assertEqual(errors, [])
-        self.assertEqual(warnings, [f"It's better if the field 'license' is setup in '{fake_pack_path}/metadata.yml' file."])
-
-    def test_check_metadata_no_copyright(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='metadata_no_copyright.yml', vers=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-        errors, warnings = pack._check_metadata()
-        self.assertEqual(errors, [])
-        self.assertEqual(warnings, [f"It's better if the field 'copyright' is setup in '{fake_pack_path}/metadata.yml' file."])
+    def test_check_metadata_variants(self):
+        not_valid = "- The metadata file '{path}/metadata.yml' is not valid: "
+        # (metadata file, vers in metadata, expected errors, expected warnings)
+        # {path} in the messages is replaced by the path of the package
+        cases = [('metadata_no_maintainer.yml', False,
+                  [not_valid + "the element 'maintainer' is required."], []),
+                 ('metadata_no_name.yml', False,
+                  [not_valid + "the element 'maintainer' must have fields 'name' and 'email'."], []),
+                 ('metadata_no_email.yml', False,
+                  [not_valid + "the element 'maintainer' must have fields 'name' and 'email'."], []),
+                 ('metadata_no_desc.yml', False,
+                  [not_valid + "the element 'short_desc' is required."], []),
+                 ('metadata_no_vers.yml', True, [], []),
+                 ('good_metadata.yml', True,
+                  [], ["The field 'vers' is not required anymore."
+                       "\n  It will be ignored and set by macsydata during installation phase according"
+                       " to the git tag."]),
+                 ('metadata_no_cite.yml', False, [],
+                  ["It's better if the field 'cite' is setup in '{path}/metadata.yml' file."]),
+                 ('metadata_no_doc.yml', False, [],
+                  ["It's better if the field 'doc' is setup in '{path}/metadata.yml' file."]),
+                 ('metadata_no_license.yml', False, [],
+                  ["It's better if the field 'license' is setup in '{path}/metadata.yml' file."]),
+                 ('metadata_no_copyright.yml', False, [],
+                  ["It's better if the field 'copyright' is setup in '{path}/metadata.yml' file."]),
+                 ]
+        for metadata, vers, exp_errors, exp_warnings in cases:
+            with self.subTest(metadata=metadata, vers=vers):
+                fake_pack_path = self.create_fake_package('fake_model', metadata=metadata, vers=vers)
+                try:
+                    pack = model_package.ModelPackage(fake_pack_path)
+                    errors, warnings = pack._check_metadata()
+                    self.assertListEqual(errors, [msg.format(path=fake_pack_path) for msg in exp_errors])
+                    self.assertListEqual(warnings, [msg.format(path=fake_pack_path) for msg in exp_warnings])
+                finally:
+                    shutil.rmtree(fake_pack_path)
 
 
     def test_check(self):
@@ -844,13 +773,13 @@ ligne 3 et bbbbb
         fake_pack_path = self.create_fake_package('fake_model', profiles=False)
         profiles_dir = os.path.join(fake_pack_path, 'profiles')
         os.mkdir(profiles_dir)
-        shutil.copyfile(self.find_data('hmm', 'one_profile.hmm'), os.path.join(profiles_dir, 'one_profile.hmm'))
+        link_file(self.find_data('hmm', 'one_profile.hmm'), os.path.join(profiles_dir, 'one_profile.hmm'))
         pack = model_package.ModelPackage(fake_pack_path)
         errors, warnings = pack._check_profiles()
         self.assertListEqual(errors, [])
         self.assertListEqual(warnings, [])
 
-        shutil.copyfile(self.find_data('hmm', 'several_profiles.hmm'), os.path.join(profiles_dir, 'several_profiles.hmm'))
+        link_file(self.find_data('hmm', 'several_profiles.hmm'), os.path.join(profiles_dir, 'several_profiles.hmm'))
         errors, warnings = pack._check_profiles()
         self.assertListEqual(errors, [
             '\nThere are several profiles RM_Type_II__Type_II_REases___Type_II_REase01\n'
@@ -878,7 +807,7 @@ ligne 3 et bbbbb
         profiles_dir = os.path.join(fake_pack_path, 'profiles')
         os.mkdir(profiles_dir)
         old_profile = os.path.join(profiles_dir, 'old_profile.hmm')
-        shutil.copyfile(self.find_data('hmm', 'old_profile.hmm'), old_profile)
+        link_file(self.find_data('hmm', 'old_profile.hmm'), old_profile)
         pack = model_package.ModelPackage(fake_pack_path)
         errors, warnings = pack._check_profiles()
         self.assertListEqual(errors, [f"The file {old_profile} does not seems to be HMMER 3 profile: "
@@ -923,90 +852,6 @@ ligne 3 et bbbbb
 
 
     def test_info(self):
-        fake_pack_path = self.create_fake_package('fake_model', license=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-
-        info = pack.info()
-
-        expected_info = """
-fake_model (0.0b2)
-
-maintainer: auth_name <auth_name@mondomain.fr>
-
-this is a short description of the repos
-
-how to cite:
-\t- bla bla
-\t- link to publication
-\t- ligne 1
-\t  ligne 2
-\t  ligne 3 et bbbbb
-
-documentation
-\thttp://link/to/the/documentation
-
-This data are released under CC BY-NC-SA 4.0 (https://creativecommons.org/licenses/by-nc-sa/4.0/)
-copyright: 2019, Institut Pasteur, CNRS
-"""
-        self.assertEqual(info, expected_info)
-
-    def test_info_no_citation(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='metadata_no_cite.yml', license=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-
-        info = pack.info()
-
-        expected_info = """
-fake_model (0.0b2)
-
-maintainer: auth_name <auth_name@mondomain.fr>
-
-this is a short description of the repos
-
-how to cite:
-\t- No citation available
-
-documentation
-\thttp://link/to/the/documentation
-
-This data are released under CC BY-NC-SA 4.0 (https://creativecommons.org/licenses/by-nc-sa/4.0/)
-copyright: 2019, Institut Pasteur, CNRS
-"""
-        self.assertEqual(info, expected_info)
-
-    def test_info_no_doc(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='metadata_no_doc.yml', license=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-
-        info = pack.info()
-        expected_info = """
-fake_model (0.0b2)
-
-maintainer: auth_name <auth_name@mondomain.fr>
-
-this is a short description of the repos
-
-how to cite:
-\t- bla bla
-\t- link to publication
-\t- ligne 1
-\t  ligne 2
-\t  ligne 3 et bbbbb
-
-documentation
-\tNo documentation available
-
-This data are released under CC BY-NC-SA 4.0 (https://creativecommons.org/licenses/by-nc-sa/4.0/)
-copyright: 2019, Institut Pasteur, CNRS
-"""
-        self.assertEqual(info, expected_info)
-
-
-    def test_info_no_license(self):
-        fake_pack_path = self.create_fake_package('fake_model', metadata='metadata_no_license.yml', license=False)
-        pack = model_package.ModelPackage(fake_pack_path)
-
-        info = pack.info()
         expected_info = """
 fake_model (0.0b2)
 
@@ -1015,16 +860,32 @@ maintainer: auth_name <auth_name@mondomain.fr>
 this is a short description of the repos
 
 how to cite:
-\t- bla bla
-\t- link to publication
-\t- ligne 1
-\t  ligne 2
-\t  ligne 3 et bbbbb
+{cite}
 
 documentation
-\thttp://link/to/the/documentation
+\t{doc}
 
-This data are released under No license available
+This data are released under {license}
 copyright: 2019, Institut Pasteur, CNRS
 """
-        self.assertEqual(info, expected_info)
+        default = {'cite': "\t- bla bla\n"
+                           "\t- link to publication\n"
+                           "\t- ligne 1\n"
+                           "\t  ligne 2\n"
+                           "\t  ligne 3 et bbbbb",
+                   'doc': "http://link/to/the/documentation",
+                   'license': "CC BY-NC-SA 4.0 (https://creativecommons.org/licenses/by-nc-sa/4.0/)"}
+        # (metadata file, the fields of the info which differ from default)
+        cases = [('good_metadata.yml', {}),
+                 ('metadata_no_cite.yml', {'cite': "\t- No citation available"}),
+                 ('metadata_no_doc.yml', {'doc': "No documentation available"}),
+                 ('metadata_no_license.yml', {'license': "No license available"}),
+                 ]
+        for metadata, fields in cases:
+            with self.subTest(metadata=metadata):
+                fake_pack_path = self.create_fake_package('fake_model', metadata=metadata, license=False)
+                try:
+                    pack = model_package.ModelPackage(fake_pack_path)
+                    self.assertEqual(pack.info(), expected_info.format(**(default | fields)))
+                finally:
+                    shutil.rmtree(fake_pack_path)
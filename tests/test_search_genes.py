@@ -30,6 +30,8 @@ import unittest
 import shutil
 import tempfile
 import argparse
+import copy
+from unittest.mock import patch
 
 import macsylib
 from macsylib.config import Config, MacsyDefaults
@@ -45,59 +47,68 @@ from tests import MacsyTest
 
 class TestSearchGenes(MacsyTest):
 
+    @classmethod
+    def setUpClass(cls):
+        # the directories of the tests are removed all at once at the end of the class
+        cls._tmp_root = tempfile.TemporaryDirectory(prefix='test_msl_search_genes_')
+        # the sequence index is only read by the searches
+        # so it is built once for all tests
+        cls.index_dir = os.path.join(cls._tmp_root.name, 'index')
+        os.mkdir(cls.index_dir)
+        # the options which do not change between the tests
+        # each test copies them and sets its own out_dir
+        cls._args = argparse.Namespace(sequence_db=cls.find_data("base", "test_base.fa"),
+                                       db_type='gembase',
+                                       models_dir=cls.find_data('models'),
+                                       log_level=30,
+                                       no_cut_ga=True,
+                                       index_dir=cls.index_dir)
+        Indexes(Config(MacsyDefaults(), cls._mk_args(cls._tmp_root.name))).build()
+
+        cls.model_name = 'foo'
+        cls.model_location = ModelLocation(path=os.path.join(cls._args.models_dir, cls.model_name))
+
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp_root.cleanup()
+
+
+    @classmethod
+    def _mk_args(cls, out_dir):
+        args = copy.copy(cls._args)
+        args.out_dir = out_dir
+        args.res_search_dir = args.out_dir
+        return args
+
+
     def setUp(self):
-        self._tmp_dir = tempfile.TemporaryDirectory(prefix='test_msl_search_genes_')
-        self.tmp_dir = self._tmp_dir.name
+        self.tmp_dir = tempfile.mkdtemp(dir=self._tmp_root.name)
         macsylib.init_logger(name='macsylib')
         macsylib.logger_set_level(level=30)
 
-        args = argparse.Namespace()
-        args.sequence_db = self.find_data("base", "test_base.fa")
-        args.db_type = 'gembase'
-        args.models_dir = self.find_data('models')
-        args.log_level = 30
-        args.out_dir = os.path.join(self.tmp_dir, 'job_1')
-        args.res_search_dir = args.out_dir
-        args.no_cut_ga = True
-        args.index_dir = os.path.join(self.tmp_dir)
+        args = self._mk_args(os.path.join(self.tmp_dir, 'job_1'))
         os.mkdir(args.out_dir)
 
         self.cfg = Config(MacsyDefaults(), args)
-
-        self.model_name = 'foo'
-        self.model_location = ModelLocation(path=os.path.join(args.models_dir, self.model_name))
-
-        idx = Indexes(self.cfg)
-        idx.build()
         self.profile_factory = ProfileFactory(self.cfg)
 
-    def tearDown(self):
-        self._tmp_dir.cleanup()
-
     def test_worker_cpu(self):
-        worker_meth = self.cfg.worker
-        from macsylib import search_genes
-        threads_available_ori = search_genes.threads_available
-        try:
-            self.cfg.worker = lambda: 5
+        with patch.object(self.cfg, 'worker', lambda: 5):
             worker, cpu = worker_cpu(10, self.cfg)
-            self.assertEqual(worker, 5)
-            self.assertEqual(cpu, 1)
+        self.assertEqual(worker, 5)
+        self.assertEqual(cpu, 1)
 
-            self.cfg.worker = lambda: 11
+        with patch.object(self.cfg, 'worker', lambda: 11):
             worker, cpu = worker_cpu(5, self.cfg)
-            self.assertEqual(worker, 11)
-            self.assertEqual(cpu, 2)
+        self.assertEqual(worker, 11)
+        self.assertEqual(cpu, 2)
 
-            self.cfg.worker = lambda: 0
-            search_genes.threads_available = lambda: 12
+        with (patch.object(self.cfg, 'worker', lambda: 0),
+              patch('macsylib.search_genes.threads_available', lambda: 12)):
             worker, cpu = worker_cpu(5, self.cfg)
-            self.assertEqual(worker, 12)
-            self.assertEqual(cpu, 2)
-
-        finally:
-            self.cfg.worker = worker_meth
-            search_genes.threads_available = threads_available_ori
+        self.assertEqual(worker, 12)
+        self.assertEqual(cpu, 2)
 
     def test_search_fail(self):
         gene_name = "abc"
@@ -153,22 +164,13 @@ class TestSearchGenes(MacsyTest):
         self.assertEqual(expected_hit[0], report[0].hits[0])
 
 
-        # test ordered replicon
+        # test ordered_replicon and unordered
         # the only thing that change is the name of the replicon
-        self.cfg._set_db_type('ordered_replicon')
-        self.profile_factory = ProfileFactory(self.cfg)
         seq_name = os.path.basename(os.path.splitext(self.cfg.sequence_db())[0])
         expected_hit[0].replicon_name = seq_name
-        report = search_genes([mg_abc_1], self.cfg)
-        self.assertEqual(len(report), 1)
-        self.assertEqual(expected_hit[0], report[0].hits[0])
-
-        # test ordered replicon
-        # there is no diff with ordered_replicon
-        self.cfg._set_db_type('unordered')
-        self.profile_factory = ProfileFactory(self.cfg)
-        seq_name = os.path.basename(os.path.splitext(self.cfg.sequence_db())[0])
-        expected_hit[0].replicon_name = seq_name
-        report = search_genes([mg_abc_1], self.cfg)
-        self.assertEqual(len(report), 1)
-        self.assertEqual(expected_hit[0], report[0].hits[0])
+        for db_type in ('ordered_replicon', 'unordered'):
+            with self.subTest(db_type=db_type):
+                self.cfg._set_db_type(db_type)
+                report = search_genes([mg_abc_1], self.cfg)
+                self.assertEqual(len(report), 1)
+                self.assertEqual(expected_hit[0], report[0].hits[0])